@@ -0,0 +1,3 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""benchmarks/__init__.py."""
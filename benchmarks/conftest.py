@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""benchmarks/conftest.py.
+
+The ``bench`` fixture and the command line options of the microbenchmark suite::
+
+	python -m pytest benchmarks                      # measure and compare with benchmarks/baseline.json
+	python -m pytest benchmarks --bench-save         # measure and store the results as the new baseline
+
+Throughput depends on the machine, so the baseline is not part of the project: record one on the
+machine that compares, e.g. before an upgrade. Checks a baseline from elsewhere cannot make are
+listed in the warnings and the summary instead of passing silently.
+"""
+# Standard Library
+import os
+import shutil
+import tempfile
+import warnings
+from pathlib import Path
+from typing import (
+	Any,
+	Callable,
+	Dict,
+)
+
+# Third Party Library
+import pytest
+
+# App
+from benchmarks.micro import (
+	Measurement,
+	compare,
+	load_baseline,
+	measure,
+	reference_speed,
+	save_baseline,
+	skipped_checks,
+)
+
+
+BASELINE_PATH: Path = Path(__file__).parent / 'baseline.json'
+# Extra measurements of a benchmark slower than its baseline, before it counts as a regression.
+CONFIRM_RUNS: int = 2
+
+# Benchmarked code logs like it does anywhere else, but not into the project's log directory.
+# Set before anything imports `config`, which reads it.
+_LOG_DIR: str = tempfile.mkdtemp(prefix='hex_system_bench_')
+os.environ.setdefault('HEX_SYSTEM_LOG_DIR', _LOG_DIR)
+
+_RESULTS: Dict[str, Measurement] = {}
+_SPEEDS: Dict[str, float] = {}
+
+
+def pytest_addoption(parser) -> None:
+	group = parser.getgroup('bench', 'microbenchmarks')
+	group.addoption('--bench-baseline', type=Path, default=BASELINE_PATH, help='baseline file to compare with')
+	group.addoption('--bench-save', action='store_true', help='store the results as the new baseline')
+	group.addoption('--bench-tolerance', type=float, default=0.25, help='allowed throughput drop, 0.25 is 25%%')
+	group.addoption('--bench-min-time', type=float, default=0.05, help='shortest timed run, in seconds')
+	return
+
+
+@pytest.fixture(scope='session')
+def bench_baseline(request):
+	if request.config.getoption('--bench-save'):
+		return None
+	baseline = load_baseline(request.config.getoption('--bench-baseline'))
+	for skipped in skipped_checks(baseline):
+		warnings.warn(skipped, pytest.PytestWarning)
+	return baseline
+
+
+@pytest.fixture
+def bench(request, bench_baseline) -> Callable[[Callable[[], Any]], Measurement]:
+	"""Measure an operation under the name of the test, failing on a regression against the baseline."""
+	options = request.config.option
+
+	def run(function: Callable[[], Any]) -> Measurement:
+		name = request.node.name.replace('test_', '', 1)
+		# The machine's speed drifts even within a session, time the reference right next to each benchmark.
+		# A slowdown is only reported if it persists when measured again.
+		for _ in range(1 + CONFIRM_RUNS):
+			measurement = measure(function, min_time=options.bench_min_time)
+			speed = reference_speed(options.bench_min_time)
+			if name not in _RESULTS or measurement.ops_per_sec / speed > _RESULTS[name].ops_per_sec / _SPEEDS[name]:
+				_RESULTS[name], _SPEEDS[name] = measurement, speed
+			problems = compare(name, _RESULTS[name], bench_baseline, options.bench_tolerance, _SPEEDS[name])
+			if not problems:
+				break
+		if problems:
+			pytest.fail('\n'.join(problems), pytrace=False)
+		return _RESULTS[name]
+
+	return run
+
+
+def pytest_sessionfinish(session) -> None:
+	if _RESULTS and session.config.getoption('--bench-save'):
+		save_baseline(session.config.getoption('--bench-baseline'), _RESULTS, _SPEEDS)
+	shutil.rmtree(_LOG_DIR, ignore_errors=True)
+	return
+
+
+def pytest_terminal_summary(terminalreporter, config) -> None:
+	if not _RESULTS:
+		return
+	baseline = load_baseline(config.getoption('--bench-baseline'))
+	terminalreporter.section('microbenchmarks')
+	if not config.getoption('--bench-save'):
+		for skipped in skipped_checks(baseline):
+			terminalreporter.write_line(skipped, yellow=True)
+	baseline = baseline or {'results': {}}
+	terminalreporter.write_line(f'{"benchmark":<40} {"ops/sec":>14} {"baseline":>14} {"change":>8} {"allocs/op":>10}')
+	for name, measurement in sorted(_RESULTS.items()):
+		previous = baseline['results'].get(name)
+		reference, change = '', ''
+		if previous is not None:
+			reference = f'{previous["ops_per_sec"]:,.0f}'
+			change = f'{measurement.ops_per_sec / previous["ops_per_sec"] - 1.0:+.0%}'
+		terminalreporter.write_line(
+			f'{name:<40} {measurement.ops_per_sec:>14,.0f} {reference:>14} {change:>8} {measurement.allocations_per_op:>10}'
+		)
+	return
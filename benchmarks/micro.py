@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""benchmarks/micro.py.
+
+Microbenchmark measurements and baseline files, used by the ``bench`` fixture of the benchmark
+suite in ``benchmarks/conftest.py``.
+
+Throughput is the best of several timed runs, each long enough to hide the clock resolution.
+Allocations are the memory blocks an operation leaves allocated, counted with
+:func:`sys.getallocatedblocks` while the result of every call is kept alive: the result objects
+and everything they own. Unlike timings they do not depend on machine load, so they are
+compared against the baseline on any machine running the same Python implementation and minor
+version. Throughput is only compared on the environment the baseline was recorded in, see
+:func:`skipped_checks` for what a baseline from elsewhere leaves out.
+
+The speed of a shared or throttled machine drifts between runs by more than the regressions worth
+catching. Next to every benchmark a fixed reference workload is timed too, and the baseline throughput
+is scaled by how much faster or slower that workload ran, so only slowdowns of the benchmarked code
+itself remain.
+"""
+# Standard Library
+import gc
+import json
+import os
+import platform
+import sys
+import timeit
+from pathlib import Path
+from typing import (
+	Any,
+	Callable,
+	Dict,
+	List,
+	NamedTuple,
+	Optional,
+	Tuple,
+)
+
+
+__all__ = [
+	'Measurement',
+	'compare',
+	'count_allocations',
+	'environment',
+	'load_baseline',
+	'measure',
+	'reference_speed',
+	'save_baseline',
+	'skipped_checks',
+]
+
+# Calls per allocation count, enough for the results to outgrow the free lists of small objects.
+ALLOCATION_LOOPS: int = 10_000
+# More allocations per op than the baseline plus this count as a regression, free lists blur the counts a little.
+ALLOCATION_TOLERANCE: float = 0.5
+
+
+class Measurement(NamedTuple):
+	"""Result of one microbenchmark."""
+
+	ops_per_sec: float
+	allocations_per_op: float
+
+
+def environment() -> Dict[str, Any]:
+	"""Describe what the measurements depend on: Python build and machine."""
+	return {
+		'python': platform.python_version(),
+		'implementation': platform.python_implementation(),
+		'platform': platform.platform(),
+		'processor': platform.processor() or platform.machine(),
+		'cpu_count': os.cpu_count(),
+	}
+
+
+def count_allocations(function: Callable[[], Any], loops: int = ALLOCATION_LOOPS) -> float:
+	"""Count the memory blocks each call of ``function`` leaves allocated, kept by its result."""
+	results: List[Any] = [None] * loops
+	function()
+	gc.collect()
+	gc.disable()
+	try:
+		before = sys.getallocatedblocks()
+		for position in range(loops):
+			results[position] = function()
+		after = sys.getallocatedblocks()
+	finally:
+		gc.enable()
+	return round((after - before) / loops, 2)
+
+
+def measure(
+	function: Callable[[], Any],
+	min_time: float = 0.05,
+	repeat: int = 5,
+	allocations: bool = True
+) -> Measurement:
+	"""Measure the throughput and allocations of a function without arguments.
+
+	:param function: The operation to measure.
+	:type function: Callable[[], Any]
+	:param min_time: The shortest duration of one timed run, in seconds.
+	:type min_time: float
+	:param repeat: The amount of timed runs, the fastest counts.
+	:type repeat: int
+	:param allocations: Count allocations, 0.0 without.
+	:type allocations: bool
+	:rtype: Measurement
+	"""
+	timer = timeit.Timer(function)
+	# Grow the loop count until a run is measurable, then scale it to last about `min_time`.
+	loops = 1
+	while True:
+		elapsed = timer.timeit(number=loops)
+		if elapsed >= min_time / 10:
+			break
+		loops *= 10
+	loops = max(1, int(loops * min_time / elapsed))
+	best = min(timer.repeat(repeat=repeat, number=loops))
+	return Measurement(round(loops / best, 1), count_allocations(function) if allocations else 0.0)
+
+
+def _reference_workload() -> int:
+	"""Interpreter work unrelated to the package: calls, tuples, integer arithmetic and a dict."""
+	counts: Dict[int, int] = {}
+	for value in range(64):
+		pair = (value, value * 3 + 1)
+		counts[pair[1] % 7] = counts.get(pair[1] % 7, 0) + pair[0]
+	return len(counts)
+
+
+def reference_speed(min_time: float = 0.05, repeat: int = 5) -> float:
+	"""Measure how fast this machine currently runs the fixed reference workload, in ops/sec."""
+	return measure(_reference_workload, min_time, repeat, allocations=False).ops_per_sec
+
+
+def _python_release(environment_: Dict[str, Any]) -> Tuple[str, str]:
+	"""Get what allocation counts depend on: the implementation and its major.minor version."""
+	return environment_['implementation'], '.'.join(environment_['python'].split('.')[:2])
+
+
+def skipped_checks(baseline: Optional[Dict[str, Any]]) -> List[str]:
+	"""Describe the comparisons :func:`compare` leaves out against a baseline, empty if it does none.
+
+	:rtype: List[str]
+	"""
+	if baseline is None:
+		return ['no baseline: nothing is compared, record one with --bench-save']
+	current, recorded = environment(), baseline['environment']
+	skipped = []
+	if recorded != current:
+		changes = ', '.join(
+			f'{key} {recorded.get(key)!r} != {value!r}' for key, value in current.items() if recorded.get(key) != value
+		)
+		skipped.append(f'throughput not compared, the baseline is from another environment: {changes}')
+	if _python_release(recorded) != _python_release(current):
+		skipped.append(f'allocations not compared, the baseline is from {" ".join(_python_release(recorded))}')
+	return skipped
+
+
+def compare(
+	name: str,
+	measurement: Measurement,
+	baseline: Optional[Dict[str, Any]],
+	tolerance: float,
+	speed: Optional[float] = None
+) -> List[str]:
+	"""Check a measurement against its baseline entry.
+
+	Throughput is only compared when the baseline was recorded in the same environment,
+	allocations whenever the Python implementation and minor version match.
+
+	:param speed: The :func:`reference_speed` next to the measurement, scales the baseline throughput.
+	:type speed: Optional[float]
+	:return: A description of every regression, empty if there is none.
+	:rtype: List[str]
+	"""
+	if baseline is None or name not in baseline['results']:
+		return []
+	previous = Measurement(**baseline['results'][name])
+	current_environment = environment()
+	problems = []
+	if baseline['environment'] == current_environment:
+		expected = previous.ops_per_sec
+		previous_speed = baseline.get('reference_speed', {}).get(name)
+		if speed and previous_speed:
+			expected *= speed / previous_speed
+		if measurement.ops_per_sec < expected * (1.0 - tolerance):
+			problems.append(
+				f'{name}: {measurement.ops_per_sec:,.0f} ops/sec, '
+				f'{1.0 - measurement.ops_per_sec / expected:.0%} below the baseline {expected:,.0f}'
+			)
+	if _python_release(baseline['environment']) == _python_release(current_environment):
+		if measurement.allocations_per_op > previous.allocations_per_op + ALLOCATION_TOLERANCE:
+			problems.append(
+				f'{name}: {measurement.allocations_per_op} allocations per op, '
+				f'the baseline is {previous.allocations_per_op}'
+			)
+	return problems
+
+
+def load_baseline(path: Path) -> Optional[Dict[str, Any]]:
+	"""Read a baseline file, None if there is none."""
+	if not path.exists():
+		return None
+	with open(path) as file:
+		return json.load(file)
+
+
+def save_baseline(path: Path, results: Dict[str, Measurement], speeds: Optional[Dict[str, float]] = None) -> None:
+	"""Write measurements, and the :func:`reference_speed` next to each, as the new baseline.
+
+	Entries of benchmarks that did not run are kept if the baseline comes from the same environment.
+	"""
+	baseline = load_baseline(path)
+	entries, reference = {}, {}
+	if baseline is not None and baseline['environment'] == environment():
+		entries.update(baseline['results'])
+		reference.update(baseline.get('reference_speed', {}))
+	entries.update({name: measurement._asdict() for name, measurement in results.items()})
+	reference.update(speeds or {})
+	content = {
+		'environment': environment(),
+		'reference_speed': dict(sorted(reference.items())),
+		'results': dict(sorted(entries.items())),
+	}
+	with open(path, 'w') as file:
+		json.dump(content, file, indent=2)
+		file.write('\n')
+	return
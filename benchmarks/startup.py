@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""benchmarks/startup.py.
+
+Startup benchmarks: import time per module, grid build time per size, and the time to the
+first rendered frame of the :class:`gui.gui.TileMap`.
+
+Every measurement runs in fresh interpreters on a private copy of ``hex_system``, so nothing
+already imported or cached by this process leaks into the numbers:
+
+	cold    the copy has no bytecode, its modules compile from source (first run after an upgrade)
+	warm    bytecode is cached, the usual start of a process
+
+Results are printed, or written to ``--output``, as JSON. Comparing them with an earlier run
+lists every metric that got slower by more than ``--tolerance`` and exits with status 1::
+
+	python -m benchmarks.startup --output startup.json
+	python -m benchmarks.startup --baseline startup.json
+"""
+# Standard Library
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import (
+	Any,
+	Dict,
+	List,
+	Optional,
+	Sequence,
+	Tuple,
+)
+
+
+__all__ = ['compare', 'flatten', 'run_benchmarks']
+
+PROJECT_DIR: Path = Path(__file__).parent.parent.absolute()
+SOURCE_DIR: Path = PROJECT_DIR / 'hex_system'
+
+MODULES: Tuple[str, ...] = (
+	'hex_system',
+	'config',
+	'loggers',
+	'geometry',
+	'grid',
+	'storage',
+	'hex_grid',
+	'algorithms',
+	'terrain',
+	'render',
+	'gui',
+)
+GRID_SIZES: Tuple[int, ...] = (10, 100, 1000)
+REPEAT: int = 5
+# Slowdown, as a fraction of the baseline, above which a metric counts as a regression.
+TOLERANCE: float = 0.25
+
+# Every script writes its result as JSON to the file named by its first argument.
+IMPORT_SCRIPT: str = '''
+import json, sys, time
+start = time.perf_counter()
+import {module}
+json.dump(time.perf_counter() - start, open(sys.argv[1], 'w'))
+'''
+
+GRID_SCRIPT: str = '''
+import json, sys, time
+from hex_grid import get_hex_grid
+# The first grid also pays for one-time setup, such as opening the log file.
+get_hex_grid(1, 1)
+timings = {{}}
+for size in {sizes!r}:
+	timings[size] = []
+	for _ in range({repeat}):
+		start = time.perf_counter()
+		get_hex_grid(size, size)
+		timings[size].append(time.perf_counter() - start)
+json.dump(timings, open(sys.argv[1], 'w'))
+'''
+
+FRAME_SCRIPT: str = '''
+import json, sys, time
+start = time.perf_counter()
+try:
+	import tkinter
+except ImportError as error:
+	result = {'skipped': str(error)}
+else:
+	from gui.gui import get_app
+	imported = time.perf_counter()
+	try:
+		app = get_app()
+	except tkinter.TclError as error:
+		result = {'skipped': str(error)}
+	else:
+		created = time.perf_counter()
+		# Process the pending draw and idle events: the first frame is on screen.
+		app.root.update()
+		painted = time.perf_counter()
+		app.close()
+		result = {'import': imported - start, 'create': created - imported, 'first_frame': painted - start}
+json.dump(result, open(sys.argv[1], 'w'))
+'''
+
+
+def _milliseconds(timings: Sequence[float]) -> Dict[str, float]:
+	return {
+		'min_ms': round(min(timings) * 1000.0, 3),
+		'median_ms': round(statistics.median(timings) * 1000.0, 3),
+	}
+
+
+class _Runner:
+	"""Runs scripts in fresh interpreters against a private copy of the package."""
+
+	def __init__(self, directory: Path) -> None:
+		self._directory: Path = directory
+		self._source: Path = directory / 'hex_system'
+		shutil.copytree(SOURCE_DIR, self._source, ignore=shutil.ignore_patterns('__pycache__'))
+		self._env: Dict[str, str] = dict(os.environ)
+		self._env['PYTHONPATH'] = os.pathsep.join([str(directory), str(self._source)])
+		# Keep log files of the benchmarked code out of the project.
+		self._env['HEX_SYSTEM_LOG_DIR'] = str(directory / 'logs')
+		self._env.pop('PYTHONDONTWRITEBYTECODE', None)
+		self._env.pop('PYTHONPYCACHEPREFIX', None)
+		return
+
+	def clear_bytecode(self) -> None:
+		"""Remove the bytecode that earlier runs cached for the package copy."""
+		for cache in list(self._source.rglob('__pycache__')):
+			shutil.rmtree(cache)
+		return
+
+	def run(self, script: str, cached: bool = True) -> Any:
+		result = self._directory / 'result.json'
+		if not cached:
+			# -B only stops writing bytecode, the bytecode of earlier warm runs would still be read.
+			self.clear_bytecode()
+		arguments = [sys.executable] + ([] if cached else ['-B']) + ['-c', script, str(result)]
+		subprocess.run(arguments, cwd=self._directory, env=self._env, check=True, capture_output=True)
+		with open(result) as file:
+			return json.load(file)
+
+
+def _measure_imports(runner: _Runner, modules: Sequence[str], repeat: int) -> Dict[str, Dict[str, Any]]:
+	imports = {}
+	for module in modules:
+		script = IMPORT_SCRIPT.format(module=module)
+		# Without bytecode and with -B, cold runs compile the package from source, the standard library stays cached.
+		cold = [runner.run(script, cached=False) for _ in range(repeat)]
+		runner.run(script)
+		warm = [runner.run(script) for _ in range(repeat)]
+		imports[module] = {'cold': _milliseconds(cold), 'warm': _milliseconds(warm)}
+	return imports
+
+
+def run_benchmarks(
+	modules: Sequence[str] = MODULES,
+	sizes: Sequence[int] = GRID_SIZES,
+	repeat: int = REPEAT,
+	frame: bool = True
+) -> Dict[str, Any]:
+	"""Run every startup benchmark.
+
+	:param modules: The modules to time the import of.
+	:type modules: Sequence[str]
+	:param sizes: Build square grids with these amounts of columns and rows.
+	:type sizes: Sequence[int]
+	:param repeat: The amount of runs per measurement.
+	:type repeat: int
+	:param frame: Time the first frame of the GUI, skipped anyway without a display.
+	:type frame: bool
+	:return: The JSON-serializable results, with the environment they were measured in.
+	:rtype: Dict[str, Any]
+	"""
+	sys.path.insert(0, str(PROJECT_DIR))
+	try:
+		from hex_system import __version__
+	finally:
+		sys.path.remove(str(PROJECT_DIR))
+
+	results: Dict[str, Any] = {
+		'version': __version__,
+		'python': platform.python_version(),
+		'implementation': platform.python_implementation(),
+		'platform': platform.platform(),
+		'cpu_count': os.cpu_count(),
+		'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+		'repeat': repeat,
+	}
+	with tempfile.TemporaryDirectory() as directory:
+		runner = _Runner(Path(directory))
+		results['imports'] = _measure_imports(runner, modules, repeat)
+
+		timings = runner.run(GRID_SCRIPT.format(sizes=tuple(sizes), repeat=repeat))
+		results['grid_build'] = {f'{size}x{size}': _milliseconds(timings[str(size)]) for size in sizes}
+
+		if frame:
+			frame_result = runner.run(FRAME_SCRIPT)
+			if 'skipped' not in frame_result:
+				frame_result = {name: round(seconds * 1000.0, 3) for name, seconds in frame_result.items()}
+			results['first_frame'] = frame_result
+		else:
+			results['first_frame'] = {'skipped': 'disabled'}
+	return results
+
+
+def flatten(results: Dict[str, Any]) -> Dict[str, float]:
+	"""Get every timing of a result as ``{'imports.grid.cold.median_ms': 12.3, ...}``."""
+	metrics: Dict[str, float] = {}
+
+	def visit(prefix: str, value: Any) -> None:
+		if isinstance(value, dict):
+			for key, item in value.items():
+				visit(f'{prefix}.{key}' if prefix else key, item)
+		elif isinstance(value, (int, float)) and not isinstance(value, bool):
+			metrics[prefix] = float(value)
+		return
+
+	for section in ('imports', 'grid_build', 'first_frame'):
+		visit(section, results.get(section, {}))
+	return metrics
+
+
+def compare(
+	results: Dict[str, Any],
+	baseline: Dict[str, Any],
+	tolerance: float = TOLERANCE
+) -> List[Tuple[str, float, float]]:
+	"""Find the timings that got slower than the baseline by more than ``tolerance``.
+
+	Only median timings are compared, metrics missing from either side are ignored.
+
+	:return: ``(metric, baseline, current)`` of every regression.
+	:rtype: List[Tuple[str, float, float]]
+	"""
+	current, previous = flatten(results), flatten(baseline)
+	regressions = []
+	for name, value in current.items():
+		if name.endswith('min_ms') or name not in previous:
+			continue
+		if value > previous[name] * (1.0 + tolerance):
+			regressions.append((name, previous[name], value))
+	return regressions
+
+
+def main(arguments: Optional[Sequence[str]] = None) -> int:
+	parser = argparse.ArgumentParser(description='Measure import, grid build and first frame times.')
+	parser.add_argument('--modules', nargs='+', default=MODULES, help='modules to time the import of')
+	parser.add_argument('--sizes', nargs='+', type=int, default=GRID_SIZES, help='square grid sizes to build')
+	parser.add_argument('--repeat', type=int, default=REPEAT, help='runs per measurement')
+	parser.add_argument('--no-frame', action='store_true', help='skip the first frame benchmark')
+	parser.add_argument('--output', type=Path, help='write the results to this file instead of printing them')
+	parser.add_argument('--baseline', type=Path, help='compare with the results of an earlier run')
+	parser.add_argument('--tolerance', type=float, default=TOLERANCE, help='allowed slowdown, 0.25 is 25%%')
+	options = parser.parse_args(arguments)
+
+	results = run_benchmarks(options.modules, options.sizes, options.repeat, frame=not options.no_frame)
+	if options.output:
+		options.output.write_text(json.dumps(results, indent=2) + '\n')
+	else:
+		print(json.dumps(results, indent=2))
+
+	if options.baseline:
+		regressions = compare(results, json.loads(options.baseline.read_text()), options.tolerance)
+		for name, previous, value in regressions:
+			print(f'{name}: {previous:.3f} -> {value:.3f} ({value / previous - 1.0:+.0%})', file=sys.stderr)
+		return 1 if regressions else 0
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
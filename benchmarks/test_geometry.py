@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""benchmarks/test_geometry.py.
+
+Microbenchmarks of the geometry primitives, see ``benchmarks/conftest.py``.
+"""
+# Third Party Library
+import numpy as np
+import pytest
+
+# First Party Library
+from geometry import (
+	Hexagon,
+	Line,
+	Point,
+	Rectangle,
+)
+
+
+@pytest.fixture
+def point_a() -> Point:
+	return Point(120, 340)
+
+
+@pytest.fixture
+def point_b() -> Point:
+	return Point(56, 48)
+
+
+def test_point_add(bench, point_a: Point, point_b: Point) -> None:
+	bench(lambda: point_a + point_b)
+	return
+
+
+def test_point_sub(bench, point_a: Point, point_b: Point) -> None:
+	bench(lambda: point_a - point_b)
+	return
+
+
+def test_point_mul_scalar(bench, point_a: Point) -> None:
+	bench(lambda: point_a * 3)
+	return
+
+
+def test_point_neg(bench, point_a: Point) -> None:
+	bench(lambda: -point_a)
+	return
+
+
+def test_point_eq(bench, point_a: Point) -> None:
+	other = Point(120, 340)
+	bench(lambda: point_a == other)
+	return
+
+
+def test_point_hash(bench, point_a: Point) -> None:
+	bench(lambda: hash(point_a))
+	return
+
+
+def test_point_set_lookup(bench, point_a: Point) -> None:
+	points = {Point(x, y) for x in range(32) for y in range(32)}
+	probe = Point(17, 9)
+	bench(lambda: probe in points)
+	return
+
+
+def test_hexagon_new(bench, point_a: Point) -> None:
+	bench(lambda: Hexagon(point_a))
+	return
+
+
+def test_hexagon_corners(bench, point_a: Point) -> None:
+	hexagon = Hexagon(point_a)
+	bench(lambda: hexagon.corners)
+	return
+
+
+def test_hexagon_corners_batch_1000(bench) -> None:
+	xs, ys = np.arange(1000) * 56, np.arange(1000) * 48
+	bench(lambda: Hexagon.corners_batch(xs, ys))
+	return
+
+
+def test_line_length(bench, point_a: Point, point_b: Point) -> None:
+	line = Line(point_a, point_b)
+	bench(lambda: line.length)
+	return
+
+
+def test_line_midpoint(bench, point_a: Point, point_b: Point) -> None:
+	line = Line(point_a, point_b)
+	bench(lambda: line.midpoint())
+	return
+
+
+@pytest.mark.parametrize('x, y', [(300, 200), (900, 200)], ids=['inside', 'outside'])
+def test_rectangle_contains(bench, x: int, y: int) -> None:
+	rectangle, point = Rectangle(Point(0, 0), Point(640, 480)), Point(x, y)
+	bench(lambda: rectangle.contains(point))
+	return
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""algorithms/__init__.py."""
+# App
+from algorithms.field_of_view import (
+	FieldOfView,
+	field_of_view,
+)
+from algorithms.line_of_sight import (
+	VisibilityCache,
+	has_line_of_sight,
+	hex_line,
+	line_of_sight,
+)
+from algorithms.pathfinding import (
+	astar,
+	bidirectional,
+	dijkstra,
+	dijkstra_costs,
+)
+from algorithms.regions import (
+	distance_field,
+	flood_fill,
+	label_regions,
+	territories,
+)
+
+
+__all__ = [
+	'FieldOfView',
+	'VisibilityCache',
+	'astar',
+	'bidirectional',
+	'dijkstra',
+	'dijkstra_costs',
+	'distance_field',
+	'field_of_view',
+	'flood_fill',
+	'has_line_of_sight',
+	'hex_line',
+	'label_regions',
+	'line_of_sight',
+	'territories',
+]
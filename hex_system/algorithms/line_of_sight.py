@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""algorithms/line_of_sight.py.
+
+Hex lines and line-of-sight tests over a :class:`storage.ColumnarGrid`.
+
+A hex line samples the straight segment between two cube coordinates once per step and rounds
+each sample to the nearest hex. A target is visible when no cell strictly between the origin and
+the target blocks sight. The endpoints never block, so walls themselves can be seen. Samples
+that fall off the grid do not block.
+
+Which cells block is a per-cell boolean column, by default the ``'blocking'`` column of the grid.
+"""
+# Standard Library
+from collections import OrderedDict
+from itertools import islice
+from typing import (
+	Iterator,
+	Optional,
+	Tuple,
+)
+
+# Third Party Library
+import numpy as np
+
+# App
+from grid.conversions import (
+	axial_round,
+	axial_round_array,
+	axial_to_oddr,
+)
+from grid.cube import Cube
+from grid.shapes import hex_range_array
+from loggers import get_logger
+from storage.columnar import ColumnarGrid
+
+
+__all__ = ['BLOCKING_COLUMN', 'VisibilityCache', 'has_line_of_sight', 'hex_line', 'hex_line_array', 'line_of_sight']
+
+LOG = get_logger(__name__)
+
+BLOCKING_COLUMN: str = 'blocking'
+
+# Nudge lines off hex edges so rounding never has to break a tie.
+_NUDGE: Tuple[float, float] = (1e-6, 2e-6)
+
+
+def hex_line(origin: Cube, target: Cube) -> Iterator[Cube]:
+	"""Lazily yield the Cubes on the line from ``origin`` to ``target``, both included.
+
+	:param origin: The first coordinate.
+	:type origin: Cube
+	:param target: The last coordinate.
+	:type target: Cube
+	"""
+	steps = origin.distance(target)
+	if steps == 0:
+		yield origin
+		return
+
+	origin_q, origin_r = origin[0] + _NUDGE[0], origin[1] + _NUDGE[1]
+	delta_q = target[0] + _NUDGE[0] - origin_q
+	delta_r = target[1] + _NUDGE[1] - origin_r
+
+	for step in range(steps + 1):
+		t = step / steps
+		q, r = axial_round(origin_q + delta_q * t, origin_r + delta_r * t)
+		yield Cube._make(q, r, -q - r)
+	return
+
+
+def hex_line_array(origin: Cube, target: Cube) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+	"""Vectorized :func:`hex_line`, returning ``(q, r, s)`` arrays."""
+	steps = origin.distance(target)
+	t = np.arange(steps + 1) / max(steps, 1)
+	origin_q, origin_r = origin[0] + _NUDGE[0], origin[1] + _NUDGE[1]
+	q, r = axial_round_array(
+		origin_q + (target[0] + _NUDGE[0] - origin_q) * t,
+		origin_r + (target[1] + _NUDGE[1] - origin_r) * t,
+	)
+	return q, r, -q - r
+
+
+def _get_blocking(storage: ColumnarGrid, blocking) -> np.ndarray:
+	if blocking is None:
+		return storage.column(BLOCKING_COLUMN)
+	return np.asarray(blocking)
+
+
+def _cube_at(storage: ColumnarGrid, index: int) -> Cube:
+	q, r = int(storage.q[index]), int(storage.r[index])
+	return Cube._make(q, r, -q - r)
+
+
+def has_line_of_sight(storage: ColumnarGrid, origin: int, target: int, blocking=None) -> bool:
+	"""Check if ``target`` can be seen from ``origin``, stopping at the first blocker.
+
+	:param storage: The grid.
+	:type storage: ColumnarGrid
+	:param origin: Index of the viewing cell.
+	:type origin: int
+	:param target: Index of the viewed cell.
+	:type target: int
+	:param blocking: Optional per-cell booleans, defaults to the grid's ``'blocking'`` column.
+	:type blocking: array_like
+	:rtype: bool
+	"""
+	blocking = _get_blocking(storage, blocking)
+	cols, rows = storage.size
+
+	origin_cube, target_cube = _cube_at(storage, origin), _cube_at(storage, target)
+	steps = origin_cube.distance(target_cube)
+
+	# Only the cells strictly between the endpoints can block.
+	for q, r, _ in islice(hex_line(origin_cube, target_cube), 1, steps):
+		col = q + ((r - (r & 1)) >> 1)
+		if 0 <= col < cols and 0 <= r < rows and blocking[r * cols + col]:
+			return False
+	return True
+
+
+def line_of_sight(storage: ColumnarGrid, origin: int, targets, blocking=None) -> np.ndarray:
+	"""Check which of many targets can be seen from one origin.
+
+	All lines advance together one step at a time. A line is dropped as soon as it hits a
+	blocker or reaches its target, so the work shrinks as lines finish.
+
+	:param storage: The grid.
+	:type storage: ColumnarGrid
+	:param origin: Index of the viewing cell.
+	:type origin: int
+	:param targets: Indices of the viewed cells.
+	:type targets: array_like
+	:param blocking: Optional per-cell booleans, defaults to the grid's ``'blocking'`` column.
+	:type blocking: array_like
+	:return: One boolean per target.
+	:rtype: np.ndarray
+	"""
+	blocking = _get_blocking(storage, blocking)
+	targets = np.asarray(targets, dtype=np.int64)
+	cols, rows = storage.size
+
+	origin_q = int(storage.q[origin]) + _NUDGE[0]
+	origin_r = int(storage.r[origin]) + _NUDGE[1]
+	target_q = storage.q[targets] + _NUDGE[0]
+	target_r = storage.r[targets] + _NUDGE[1]
+
+	dq = storage.q[targets] - storage.q[origin]
+	dr = storage.r[targets] - storage.r[origin]
+	steps = (np.abs(dq) + np.abs(dr) + np.abs(dq + dr)) >> 1
+
+	visible = np.ones(len(targets), dtype=bool)
+	# Lines still being walked: positions into `targets`.
+	alive = np.flatnonzero(steps > 1)
+	step = 1
+	while alive.size:
+		t = step / steps[alive]
+		q, r = axial_round_array(
+			origin_q + (target_q[alive] - origin_q) * t,
+			origin_r + (target_r[alive] - origin_r) * t,
+		)
+		col, row = axial_to_oddr(q, r)
+		on_grid = (col >= 0) & (col < cols) & (row >= 0) & (row < rows)
+		blocked = np.zeros(alive.size, dtype=bool)
+		blocked[on_grid] = blocking[row[on_grid] * cols + col[on_grid]]
+
+		visible[alive[blocked]] = False
+		step += 1
+		alive = alive[~blocked & (steps[alive] > step)]
+
+	return visible
+
+
+class VisibilityCache:
+	"""Cache of the cells visible from each origin, within a fixed radius.
+
+	Holds the sorted visible indices of the most recently used origins. When a cell's blocking
+	state changes, call :meth:`invalidate` so every origin that could see it is recomputed.
+	"""
+
+	def __init__(self, storage: ColumnarGrid, radius: int, blocking=None, max_origins: int = 1024) -> None:
+		"""Create an empty cache.
+
+		:param storage: The grid.
+		:type storage: ColumnarGrid
+		:param radius: The view distance.
+		:type radius: int
+		:param blocking: Optional per-cell booleans, defaults to the grid's ``'blocking'`` column.
+		:type blocking: array_like
+		:param max_origins: How many origins to keep before evicting the least recently used.
+		:type max_origins: int
+		:rtype: None
+		"""
+		self._storage: ColumnarGrid = storage
+		self._radius: int = radius
+		self._blocking = blocking
+		self._max_origins: int = max_origins
+		self._visible: 'OrderedDict[int, np.ndarray]' = OrderedDict()
+		return
+
+	def __repr__(self) -> str:
+		return f'<{self.__class__.__name__}(radius: {self._radius}, origins: {len(self._visible)})>'
+
+	def __len__(self) -> int:
+		return len(self._visible)
+
+	def __contains__(self, origin: int) -> bool:
+		return origin in self._visible
+
+	@property
+	def radius(self) -> int:
+		return self._radius
+
+	def cells_in_range(self, origin: int) -> np.ndarray:
+		"""Get the sorted indices of the on-grid cells within the view distance of ``origin``."""
+		storage = self._storage
+		q, r, _ = hex_range_array(_cube_at(storage, origin), self._radius)
+		col, row = axial_to_oddr(q, r)
+		on_grid = (col >= 0) & (col < storage.cols) & (row >= 0) & (row < storage.rows)
+		return np.sort(row[on_grid].astype(np.int64) * storage.cols + col[on_grid])
+
+	def visible_cells(self, origin: int) -> np.ndarray:
+		"""Get the sorted indices of the cells visible from ``origin``."""
+		visible = self._visible.get(origin)
+		if visible is not None:
+			self._visible.move_to_end(origin)
+			return visible
+
+		candidates = self.cells_in_range(origin)
+		visible = candidates[line_of_sight(self._storage, origin, candidates, self._blocking)]
+		visible.flags.writeable = False
+
+		self._visible[origin] = visible
+		if len(self._visible) > self._max_origins:
+			self._visible.popitem(last=False)
+		return visible
+
+	def mask(self, origin: int) -> np.ndarray:
+		"""Get a boolean per cell of the grid, True where visible from ``origin``."""
+		mask = np.zeros(len(self._storage), dtype=bool)
+		mask[self.visible_cells(origin)] = True
+		return mask
+
+	def is_visible(self, origin: int, target: int) -> bool:
+		visible = self.visible_cells(origin)
+		position = np.searchsorted(visible, target)
+		return bool(position < visible.size and visible[position] == target)
+
+	def invalidate(self, index: Optional[int] = None) -> None:
+		"""Forget cached origins after a blocking change.
+
+		:param index: The cell that changed, or None to forget every origin.
+		:type index: Optional[int]
+		:rtype: None
+		"""
+		if index is None:
+			self._visible.clear()
+			return
+
+		storage = self._storage
+		changed_q, changed_r = int(storage.q[index]), int(storage.r[index])
+		for origin in list(self._visible):
+			dq = int(storage.q[origin]) - changed_q
+			dr = int(storage.r[origin]) - changed_r
+			if (abs(dq) + abs(dr) + abs(dq + dr)) >> 1 <= self._radius:
+				del self._visible[origin]
+		return
@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""algorithms/pathfinding.py.
+
+Shortest paths over the cells of a :class:`storage.ColumnarGrid`.
+
+Every search works on flat cell indices and the grid's :class:`storage.Adjacency` table. Open sets
+are binary heaps, and the search state (g-scores, parents, closed set) lives in compact typed arrays
+sized to the grid.
+
+Movement costs are per cell: ``costs[index]`` is the price of entering that cell.
+A cost of ``math.inf`` marks a cell as impassable. Without costs, every step costs 1.
+"""
+# Standard Library
+import math
+from array import array
+from heapq import (
+	heappop,
+	heappush,
+)
+from typing import (
+	List,
+	Optional,
+	Tuple,
+)
+
+# Third Party Library
+import numpy as np
+
+# App
+from loggers import get_logger
+from storage.adjacency import (
+	SENTINEL,
+	SLOTS,
+)
+from storage.columnar import ColumnarGrid
+
+
+__all__ = ['astar', 'bidirectional', 'dijkstra', 'dijkstra_costs']
+
+LOG = get_logger(__name__)
+
+INF: float = math.inf
+
+
+def _check_index(storage: ColumnarGrid, index: int) -> None:
+	if not 0 <= index < len(storage):
+		raise IndexError(f'<index: {index}> is outside of {storage}.')
+	return
+
+
+def _prepare_costs(storage: ColumnarGrid, costs) -> Optional[np.ndarray]:
+	if costs is None:
+		return None
+	costs = np.asarray(costs, dtype=np.float64)
+	if costs.shape != (len(storage),):
+		raise ValueError(f'<costs: {costs.shape}> must have one entry per cell of {storage}.')
+	if np.any(costs < 0):
+		raise ValueError('Movement costs must not be negative.')
+	return costs
+
+
+def _axial(index: int, cols: int) -> Tuple[int, int]:
+	"""Get the axial (q, r) coordinate of a cell index in an odd-r layout."""
+	row, col = divmod(index, cols)
+	return col - ((row - (row & 1)) >> 1), row
+
+
+def _reconstruct(parent: array, start: int, goal: int) -> List[int]:
+	path: List[int] = [goal]
+	index = goal
+	while index != start:
+		index = parent[index]
+		path.append(index)
+	path.reverse()
+	return path
+
+
+def _search(storage: ColumnarGrid, start: int, goal: int, costs, use_heuristic: bool) -> Optional[List[int]]:
+	_check_index(storage, start)
+	_check_index(storage, goal)
+	costs = _prepare_costs(storage, costs)
+
+	if start == goal:
+		return [start]
+	if costs is not None and costs[goal] == INF:
+		return None
+
+	# The heuristic is the cube distance, scaled by the cheapest step so it never overestimates.
+	scale: float = 0.0
+	if use_heuristic:
+		if costs is None:
+			scale = 1.0
+		else:
+			finite = costs[np.isfinite(costs)]
+			scale = float(finite.min()) if finite.size else 0.0
+
+	cols: int = storage.cols
+	goal_q, goal_r = _axial(goal, cols)
+	size: int = len(storage)
+
+	slots = storage.adjacency.slots
+	g_score = array('d', [INF]) * size
+	parent = array('i', [-1]) * size
+	closed = bytearray(size)
+
+	g_score[start] = 0.0
+	# Entries are (f-score, h-score, index): ties on f prefer the cell closest to the goal.
+	heap: List[Tuple[float, float, int]] = [(0.0, 0.0, start)]
+
+	while heap:
+		_, _, current = heappop(heap)
+		if closed[current]:
+			continue
+		if current == goal:
+			return _reconstruct(parent, start, goal)
+		closed[current] = 1
+
+		current_score = g_score[current]
+		base = current * SLOTS
+		for neighbour in slots[base:base + SLOTS]:
+			if neighbour == SENTINEL or closed[neighbour]:
+				continue
+
+			step = 1.0 if costs is None else costs[neighbour]
+			if step == INF:
+				continue
+
+			score = current_score + step
+			if score < g_score[neighbour]:
+				g_score[neighbour] = score
+				parent[neighbour] = current
+				estimate = 0.0
+				if scale:
+					q, r = _axial(neighbour, cols)
+					dq, dr = q - goal_q, r - goal_r
+					estimate = scale * ((abs(dq) + abs(dr) + abs(dq + dr)) >> 1)
+				heappush(heap, (score + estimate, estimate, neighbour))
+
+	return None
+
+
+def astar(storage: ColumnarGrid, start: int, goal: int, costs=None) -> Optional[List[int]]:
+	"""Find the cheapest path between two cells with A*.
+
+	The heuristic is the cube distance between cells, the same measure as :meth:`grid.Cube.distance`.
+
+	:param storage: The grid to search.
+	:type storage: ColumnarGrid
+	:param start: Index of the first cell.
+	:type start: int
+	:param goal: Index of the last cell.
+	:type goal: int
+	:param costs: Optional per-cell cost of entering a cell, ``math.inf`` for impassable.
+	:type costs: array_like
+	:return: The cell indices from start to goal inclusive, or None if the goal is unreachable.
+	:rtype: Optional[List[int]]
+	"""
+	return _search(storage, start, goal, costs, use_heuristic=True)
+
+
+def dijkstra(storage: ColumnarGrid, start: int, goal: int, costs=None) -> Optional[List[int]]:
+	"""Find the cheapest path between two cells with Dijkstra's algorithm.
+
+	Takes the same arguments as :func:`astar`.
+
+	:rtype: Optional[List[int]]
+	"""
+	return _search(storage, start, goal, costs, use_heuristic=False)
+
+
+def dijkstra_costs(storage: ColumnarGrid, start: int, costs=None) -> np.ndarray:
+	"""Compute the cheapest cost from one cell to every other cell.
+
+	:param storage: The grid to search.
+	:type storage: ColumnarGrid
+	:param start: Index of the source cell.
+	:type start: int
+	:param costs: Optional per-cell cost of entering a cell, ``math.inf`` for impassable.
+	:type costs: array_like
+	:return: A float array with the path cost to each cell, ``inf`` where unreachable.
+	:rtype: np.ndarray
+	"""
+	_check_index(storage, start)
+	costs = _prepare_costs(storage, costs)
+
+	size: int = len(storage)
+	slots = storage.adjacency.slots
+	g_score = array('d', [INF]) * size
+	closed = bytearray(size)
+
+	g_score[start] = 0.0
+	heap: List[Tuple[float, int]] = [(0.0, start)]
+
+	while heap:
+		current_score, current = heappop(heap)
+		if closed[current]:
+			continue
+		closed[current] = 1
+
+		base = current * SLOTS
+		for neighbour in slots[base:base + SLOTS]:
+			if neighbour == SENTINEL or closed[neighbour]:
+				continue
+			score = current_score + (1.0 if costs is None else costs[neighbour])
+			if score < g_score[neighbour]:
+				g_score[neighbour] = score
+				heappush(heap, (score, neighbour))
+
+	return np.frombuffer(g_score, dtype=np.float64).copy()
+
+
+def bidirectional(storage: ColumnarGrid, start: int, goal: int, costs=None) -> Optional[List[int]]:
+	"""Find the cheapest path between two cells by searching from both ends at once.
+
+	Runs Dijkstra forward from ``start`` and backward from ``goal``, always growing the smaller
+	frontier, and stops once no shorter meeting point is possible. Takes the same arguments as :func:`astar`.
+
+	:rtype: Optional[List[int]]
+	"""
+	_check_index(storage, start)
+	_check_index(storage, goal)
+	costs = _prepare_costs(storage, costs)
+
+	if start == goal:
+		return [start]
+	if costs is not None and costs[goal] == INF:
+		return None
+
+	size: int = len(storage)
+	slots = storage.adjacency.slots
+	g_scores = (array('d', [INF]) * size, array('d', [INF]) * size)
+	parents = (array('i', [-1]) * size, array('i', [-1]) * size)
+	closed = (bytearray(size), bytearray(size))
+	heaps: Tuple[List[Tuple[float, int]], ...] = ([(0.0, start)], [(0.0, goal)])
+
+	g_scores[0][start] = 0.0
+	g_scores[1][goal] = 0.0
+
+	best: float = INF
+	meeting: int = -1
+
+	while heaps[0] and heaps[1]:
+		if heaps[0][0][0] + heaps[1][0][0] >= best:
+			break
+
+		side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+		current_score, current = heappop(heaps[side])
+		if closed[side][current]:
+			continue
+		closed[side][current] = 1
+
+		g_score, other_score, parent = g_scores[side], g_scores[1 - side], parents[side]
+
+		# Forward steps pay for the cell they enter, backward steps for the cell they leave.
+		if side and costs is not None:
+			backward_step = costs[current]
+			if backward_step == INF:
+				continue
+
+		base = current * SLOTS
+		for neighbour in slots[base:base + SLOTS]:
+			if neighbour == SENTINEL or closed[side][neighbour]:
+				continue
+
+			if costs is None:
+				step = 1.0
+			else:
+				step = backward_step if side else costs[neighbour]
+				if step == INF:
+					continue
+
+			score = current_score + step
+			if score < g_score[neighbour]:
+				g_score[neighbour] = score
+				parent[neighbour] = current
+				heappush(heaps[side], (score, neighbour))
+
+				total = score + other_score[neighbour]
+				if total < best:
+					best = total
+					meeting = neighbour
+
+	if meeting == -1:
+		return None
+
+	path = _reconstruct(parents[0], start, meeting)
+	index = meeting
+	while index != goal:
+		index = parents[1][index]
+		path.append(index)
+	return path
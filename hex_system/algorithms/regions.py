@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""algorithms/regions.py.
+
+Connected regions and distance fields over the cells of a :class:`storage.ColumnarGrid`.
+
+Nothing here recurses or loops per cell in Python. Flood fills and distance fields advance a
+whole BFS frontier per step through the grid's :class:`storage.Adjacency` table, and labeling
+merges regions with a vectorized union-find over every edge at once.
+
+Two neighbouring cells are connected when their ``values`` are equal. A ``mask`` excludes cells:
+they belong to no region and nothing passes through them.
+"""
+# Standard Library
+from typing import (
+	Optional,
+	Sequence,
+	Tuple,
+)
+
+# Third Party Library
+import numpy as np
+
+# App
+from loggers import get_logger
+from storage.adjacency import SENTINEL
+from storage.columnar import ColumnarGrid
+
+
+__all__ = ['distance_field', 'flood_fill', 'label_regions', 'territories']
+
+LOG = get_logger(__name__)
+
+# Label and distance of cells outside every region or out of reach.
+UNLABELED: int = -1
+UNREACHED: int = -1
+
+# East, South-West and South-East: every edge of the grid exactly once.
+FORWARD_DIRECTIONS: Tuple[int, ...] = (0, 4, 5)
+
+# A flood fill labels the whole grid instead once it took this many BFS steps with frontiers of
+# fewer cells on average. Every step costs a few NumPy calls however small its frontier, labeling
+# costs the same however long and winding the region is.
+MAX_FILL_STEPS: int = 256
+MIN_FILL_FRONTIER: int = 64
+
+
+def _check_index(storage: ColumnarGrid, index: int) -> None:
+	if not 0 <= index < len(storage):
+		raise IndexError(f'<index: {index}> is outside of {storage}.')
+	return
+
+
+def _prepare_cells(storage: ColumnarGrid, array, name: str) -> Optional[np.ndarray]:
+	if array is None:
+		return None
+	array = np.asarray(array)
+	if array.shape != (len(storage),):
+		raise ValueError(f'<{name}: {array.shape}> must have one entry per cell of {storage}.')
+	return array
+
+
+def _prepare_mask(storage: ColumnarGrid, mask) -> Optional[np.ndarray]:
+	mask = _prepare_cells(storage, mask, 'mask')
+	return None if mask is None else mask.astype(bool, copy=False)
+
+
+def _edges(storage: ColumnarGrid, values, mask) -> Tuple[np.ndarray, np.ndarray]:
+	"""Get both ends of every edge between two connected cells."""
+	table = storage.adjacency.table
+	starts, ends = [], []
+	for direction in FORWARD_DIRECTIONS:
+		neighbour = table[:, direction]
+		start = np.flatnonzero(neighbour != SENTINEL)
+		end = neighbour[start]
+		connected = np.ones(start.size, dtype=bool)
+		if values is not None:
+			connected &= values[start] == values[end]
+		if mask is not None:
+			connected &= mask[start] & mask[end]
+		starts.append(start[connected])
+		ends.append(end[connected])
+	return np.concatenate(starts), np.concatenate(ends)
+
+
+def _compress(parent: np.ndarray) -> np.ndarray:
+	"""Point every cell straight at the root of its tree."""
+	while True:
+		grandparent = parent[parent]
+		if np.array_equal(grandparent, parent):
+			return parent
+		parent = grandparent
+
+
+def label_regions(storage: ColumnarGrid, values=None, mask=None) -> Tuple[np.ndarray, int]:
+	"""Label the connected regions of a grid, e.g. landmasses and bodies of water.
+
+	Regions are numbered from 0 in the order of their first cell.
+
+	:param storage: The grid.
+	:type storage: ColumnarGrid
+	:param values: Per-cell values, neighbours with equal values share a region. Without, only ``mask`` separates.
+	:type values: array_like
+	:param mask: Per-cell booleans, False for cells outside every region.
+	:type mask: array_like
+	:return: An int32 label per cell, :data:`UNLABELED` for masked cells, and the amount of regions.
+	:rtype: Tuple[np.ndarray, int]
+	"""
+	values = _prepare_cells(storage, values, 'values')
+	mask = _prepare_mask(storage, mask)
+	starts, ends = _edges(storage, values, mask)
+
+	# Hook the larger root of every edge onto the smaller one until the edges join no more trees.
+	parent = np.arange(len(storage), dtype=np.int64)
+	while starts.size:
+		start_roots, end_roots = parent[starts], parent[ends]
+		apart = start_roots != end_roots
+		starts, ends = starts[apart], ends[apart]
+		start_roots, end_roots = start_roots[apart], end_roots[apart]
+		np.minimum.at(parent, np.maximum(start_roots, end_roots), np.minimum(start_roots, end_roots))
+		parent = _compress(parent)
+
+	# Roots are the smallest index of their region, numbering them in order keeps labels stable.
+	if mask is not None:
+		parent = np.where(mask, parent, len(storage))
+	roots, labels = np.unique(parent, return_inverse=True)
+	labels = labels.astype(np.int32).reshape(-1)
+	count = roots.size
+	if mask is not None and not mask.all():
+		count -= 1
+		labels[~mask] = UNLABELED
+	return labels, int(count)
+
+
+def _frontier_steps(storage: ColumnarGrid, frontier: np.ndarray, passable: np.ndarray, owners=None):
+	"""Advance a BFS frontier one step at a time, marking reached cells not passable.
+
+	Yields the cells reached in every step. With ``owners``, every reached cell also takes the
+	smallest owner of the frontier cells it was reached from.
+	"""
+	table = storage.adjacency.table
+	passable[frontier] = False
+	while frontier.size:
+		neighbours = table[frontier]
+		origins = np.repeat(frontier, neighbours.shape[1])
+		neighbours = neighbours.reshape(-1)
+		open_ = neighbours != SENTINEL
+		open_[open_] = passable[neighbours[open_]]
+		neighbours, origins = neighbours[open_], origins[open_]
+		if owners is None:
+			frontier = np.unique(neighbours)
+		else:
+			candidates = owners[origins]
+			order = np.lexsort((candidates, neighbours))
+			frontier, first = np.unique(neighbours[order], return_index=True)
+			owners[frontier] = candidates[order[first]]
+		passable[frontier] = False
+		yield frontier
+
+
+def flood_fill(storage: ColumnarGrid, start: int, values=None, mask=None) -> np.ndarray:
+	"""Find every cell connected to a start cell, the bucket fill of a map editor.
+
+	Fills advance a BFS frontier, long thin ones such as corridors label the grid instead.
+
+	:param storage: The grid.
+	:type storage: ColumnarGrid
+	:param start: Index of the cell to fill from.
+	:type start: int
+	:param values: Per-cell values, the fill spreads over cells equal to ``values[start]``.
+	:type values: array_like
+	:param mask: Per-cell booleans, the fill never enters cells that are False.
+	:type mask: array_like
+	:return: The sorted indices of the filled cells, empty if the start cell is masked.
+	:rtype: np.ndarray
+	"""
+	_check_index(storage, start)
+	values = _prepare_cells(storage, values, 'values')
+	mask = _prepare_mask(storage, mask)
+
+	passable = np.ones(len(storage), dtype=bool) if mask is None else mask.copy()
+	if values is not None:
+		passable &= values == values[start]
+	if not passable[start]:
+		return np.empty(0, dtype=np.int64)
+
+	region = passable.copy()
+	filled = [np.array([start], dtype=np.int64)]
+	count = 1
+	for step, frontier in enumerate(_frontier_steps(storage, filled[0], passable), start=1):
+		filled.append(frontier)
+		count += frontier.size
+		if step >= MAX_FILL_STEPS and count < step * MIN_FILL_FRONTIER:
+			# A long corridor or spiral, finish in one go.
+			labels, _ = label_regions(storage, mask=region)
+			return np.flatnonzero(labels == labels[start])
+	return np.sort(np.concatenate(filled))
+
+
+def _prepare_sources(storage: ColumnarGrid, sources: Sequence[int]) -> np.ndarray:
+	sources = np.asarray(sources, dtype=np.int64).reshape(-1)
+	if sources.size == 0:
+		raise ValueError('<sources> is not allowed to be empty.')
+	for source in sources[(sources < 0) | (sources >= len(storage))]:
+		_check_index(storage, int(source))
+	return sources
+
+
+def _search_sources(
+	storage: ColumnarGrid,
+	sources: Sequence[int],
+	mask,
+	max_distance: Optional[int]
+) -> Tuple[np.ndarray, np.ndarray]:
+	sources = _prepare_sources(storage, sources)
+	mask = _prepare_mask(storage, mask)
+	passable = np.ones(len(storage), dtype=bool) if mask is None else mask.copy()
+
+	distances = np.full(len(storage), UNREACHED, dtype=np.int32)
+	owners = np.full(len(storage), UNREACHED, dtype=np.int32)
+	# A cell listed twice belongs to its first listing, masked sources still spread.
+	frontier, first = np.unique(sources, return_index=True)
+	distances[frontier] = 0
+	owners[frontier] = first
+
+	steps = _frontier_steps(storage, frontier, passable, owners) if max_distance != 0 else ()
+	for distance, frontier in enumerate(steps, start=1):
+		distances[frontier] = distance
+		if distance == max_distance:
+			break
+	return distances, owners
+
+
+def distance_field(
+	storage: ColumnarGrid,
+	sources: Sequence[int],
+	mask=None,
+	max_distance: Optional[int] = None
+) -> np.ndarray:
+	"""Compute the amount of steps from every cell to its nearest source, a multi-source BFS.
+
+	:param storage: The grid.
+	:type storage: ColumnarGrid
+	:param sources: Indices of the source cells.
+	:type sources: Sequence[int]
+	:param mask: Per-cell booleans, paths never pass through cells that are False.
+	:type mask: array_like
+	:param max_distance: Stop searching this many steps from the sources.
+	:type max_distance: Optional[int]
+	:return: An int32 distance per cell, :data:`UNREACHED` where no source is in reach.
+	:rtype: np.ndarray
+	"""
+	distances, _ = _search_sources(storage, sources, mask, max_distance)
+	return distances
+
+
+def territories(
+	storage: ColumnarGrid,
+	sources: Sequence[int],
+	mask=None,
+	max_distance: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+	"""Assign every cell to its nearest source, e.g. the territory of each city.
+
+	Takes the same arguments as :func:`distance_field`. Cells at equal distance from several
+	sources go to the source listed first.
+
+	:return: The int32 position in ``sources`` of the owner of every cell, and the distance field,
+		both :data:`UNREACHED` where no source is in reach.
+	:rtype: Tuple[np.ndarray, np.ndarray]
+	"""
+	distances, owners = _search_sources(storage, sources, mask, max_distance)
+	return owners, distances
@@ -3,11 +3,15 @@
 """config.py."""
 # Standard Library
 import math
+import os
 from datetime import tzinfo
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
-from typing import Union
-from zoneinfo import ZoneInfo
+from typing import (
+	Dict,
+	Union,
+)
 
 
 # Values used for common typing
@@ -17,8 +21,8 @@
 # This goes up two directories to the root of the project/repo folder.
 PROJECT_DIR: Path = Path(__file__).parent.parent.absolute()
 
-LOG_DIR: Path = PROJECT_DIR / 'logs'
-LOG_DIR.mkdir(exist_ok=True)
+# Created on first use by `get_log_dir`, importing never touches the filesystem.
+LOG_DIR: Path = Path(os.environ.get('HEX_SYSTEM_LOG_DIR', PROJECT_DIR / 'logs'))
 
 ENCODING: str = 'utf-8'
 
@@ -26,10 +30,10 @@
 # TODO: Find out how to pull from Windows environment locale and check for that as well.
 TIMEZONE_LOCAL: str = 'America/Chicago'
 TIMEZONE_UTC: str = 'Etc/UTC'
-TZ_LOCAL: ZoneInfo = ZoneInfo(TIMEZONE_LOCAL)
-TZ_UTC: ZoneInfo = ZoneInfo(TIMEZONE_UTC)
+DEFAULT_TIMEZONE: str = TIMEZONE_LOCAL
 
-DEFAULT_TZ: ZoneInfo = TZ_LOCAL
+# `TZ_LOCAL`, `TZ_UTC` and `DEFAULT_TZ` are loaded on first access, see `__getattr__`.
+_LAZY_TIMEZONES: Dict[str, str] = {'TZ_LOCAL': TIMEZONE_LOCAL, 'TZ_UTC': TIMEZONE_UTC, 'DEFAULT_TZ': DEFAULT_TIMEZONE}
 
 # Universal Math Constants
 PI: float = math.pi
@@ -48,3 +52,23 @@
 # Hex Grid Configuration
 HEX_GRID_COLUMNS: int = 15
 HEX_GRID_ROWS: int = 11
+
+
+@lru_cache(maxsize=None)
+def get_timezone(key: str) -> tzinfo:
+	"""Load a timezone once, the tz database is only read on first use."""
+	# Standard Library
+	from zoneinfo import ZoneInfo
+	return ZoneInfo(key)
+
+
+def get_log_dir() -> Path:
+	"""Get the log directory, creating it if missing."""
+	LOG_DIR.mkdir(parents=True, exist_ok=True)
+	return LOG_DIR
+
+
+def __getattr__(name: str):
+	if name in _LAZY_TIMEZONES:
+		return get_timezone(_LAZY_TIMEZONES[name])
+	raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
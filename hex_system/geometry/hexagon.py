@@ -27,6 +27,7 @@
 """
 # Standard Library
 import math
+from functools import lru_cache
 from typing import (
 	Any,
 	Dict,
@@ -34,6 +35,9 @@
 	Tuple,
 )
 
+# Third Party Library
+import numpy as np
+
 # First Party Library
 from geometry.point import Point
 
@@ -49,6 +53,29 @@
 
 __all__ = ['Hexagon']
 
+# To coerce drawing vertices clockwise starting North.
+CORNER_ANGLE_DEGREES: Tuple[int, ...] = (270, -30, 30, 90, 150, 210)
+
+# Unit-corner table: one (cos, sin) row per corner of a hexagon with a side of 1.
+UNIT_CORNERS: np.ndarray = np.array(
+	[(math.cos(math.radians(degree)), math.sin(math.radians(degree))) for degree in CORNER_ANGLE_DEGREES]
+)
+UNIT_CORNERS.flags.writeable = False
+
+
+@lru_cache(maxsize=None)
+def get_corner_offsets(side: int) -> np.ndarray:
+	"""Get the pixel offsets from a hexagon's center to each of its corners.
+
+	:param side: The length of a side of the hexagon.
+	:type side: int
+	:return: A read-only (6, 2) integer array, clockwise starting North.
+	:rtype: np.ndarray
+	"""
+	offsets = np.rint(side * UNIT_CORNERS).astype(np.int32)
+	offsets.flags.writeable = False
+	return offsets
+
 
 class Hexagon:
 	"""A hex position in cube coordinates.
@@ -86,7 +113,7 @@ def __init__(self, point: Point) -> None:
 		self._y = self._center.y
 
 		# To coerce drawing vertices clockwise starting North.
-		self._angle_degrees: List[int] = [270, -30, 30, 90, 150, 210]
+		self._angle_degrees: List[int] = list(CORNER_ANGLE_DEGREES)
 
 		# List comprehension to dynamically create Hex's radians based on the `ANGLE_DEGREES` list.
 		self._angle_radians: List[float] = [math.radians(degree) for degree in self.angle_degrees]
@@ -163,9 +190,24 @@ def _get_corners(self) -> List[Point]:
 
 		corners: List[Point] = []
 
-		for angle_radian in self.angle_radians:
-			corner_offset: Point = self._get_corner_offset(angle_radian)
-			corner: Point = self.center + corner_offset
+		for corner_x, corner_y in get_corner_offsets(self.side).tolist():
+			corner: Point = Point(self.x + corner_x, self.y + corner_y)
 			corners.append(corner)
 
 		return corners
+
+	@classmethod
+	def corners_batch(cls, xs, ys) -> np.ndarray:
+		"""Compute the corner vertices of many hexagons at once.
+
+		Uses the precomputed unit-corner table, so no trigonometry happens per hexagon.
+
+		:param xs: The x coordinates of the hexagon centers.
+		:type xs: array_like
+		:param ys: The y coordinates of the hexagon centers.
+		:type ys: array_like
+		:return: An (N, 6, 2) array of corner vertices, clockwise starting North.
+		:rtype: np.ndarray
+		"""
+		centers = np.stack((np.asarray(xs), np.asarray(ys)), axis=-1).reshape(-1, 1, 2)
+		return centers + get_corner_offsets(round_to_int(cls._side))
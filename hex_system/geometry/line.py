@@ -11,12 +11,15 @@
 
 # App
 from config import Number
-from loggers import get_logger
+from loggers import (
+	HOT_PATH_LOG_LEVEL,
+	get_logger,
+)
 
 
 __all__ = ['Line']
 
-LOG = get_logger('Line')
+LOG = get_logger('Line', level=HOT_PATH_LOG_LEVEL)
 
 
 @dataclass(frozen=True)
@@ -121,7 +124,8 @@ def midpoint(self, ratio: float = 0.5) -> Point:
 			of the LineSegment instance as the starting point and the
 			'end2' attribute as the end point
 		"""
-		LOG.debug(f"<ratio: {ratio}>.")
+		if LOG.debug_enabled:
+			LOG.debug(f"<ratio: {ratio}>.")
 		# if 0.0 < ratio < 1.0:
 			# raise RuntimeError("the given ratio should have a value between zero and one")
 
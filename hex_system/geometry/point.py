@@ -142,7 +142,7 @@ def __hash__(self) -> int:
 		:return: An integer as a representation of the Point's hash.
 		:rtype: int
 		"""
-		return hash((self.x + self.y))
+		return hash((self.x, self.y))
 
 	def __bool__(self) -> bool:
 		"""A boolean indicating if this point is defined.
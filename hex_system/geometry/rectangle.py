@@ -96,7 +96,7 @@ def right(self) -> int:
 		return self.end.x
 
 	@property
-	def top(self) -> int:
+	def bottom(self) -> int:
 		return self.end.y
 
 	@property
@@ -135,3 +135,10 @@ def to_dict(self) -> Dict[str, Any]:
 	def contains(self, point: Point) -> bool:
 		"""Return true if a point is inside the rectangle."""
 		return (self.left <= point.x <= self.right and self.top <= point.y <= self.bottom)
+
+	def contains_points(self, xs, ys):
+		"""Test many points at once, given as NumPy arrays of x and y coordinates.
+
+		For repeated queries over the same points, see :class:`storage.SpatialIndex`.
+		"""
+		return (xs >= self.left) & (xs <= self.right) & (ys >= self.top) & (ys <= self.bottom)
@@ -4,7 +4,8 @@
 # App
 from grid.cube import Cube
 from grid.hex_cell import HexCell
+from grid.layout import GridLayout
 from grid.offset import Offset
 
 
-__all__ = ['Cube', 'HexCell', 'Offset']
+__all__ = ['Cube', 'GridLayout', 'HexCell', 'Offset']
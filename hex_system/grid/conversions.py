@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""grid/conversions.py.
+
+Array-in / array-out conversions between cube, axial, odd-r offset and pixel coordinates.
+
+Every function takes array_like inputs and returns NumPy arrays of the same shape, so a whole
+batch of positions converts in one call. Integer inputs stay integers: only shifts, masks and
+integer arithmetic are used, never float division. Only :func:`pixel_to_axial` and
+:func:`pixel_to_oddr` go through floats, because pixels are continuous.
+
+Odd-r offset is the layout of :class:`hex_grid.HexGrid`: pointy-top hexes with odd rows
+shoved right by half a hex.
+"""
+# Standard Library
+from typing import Tuple
+
+# Third Party Library
+import numpy as np
+
+# App
+from grid.layout import GridLayout
+
+
+__all__ = [
+	'axial_round',
+	'axial_round_array',
+	'axial_to_cube',
+	'axial_to_oddr',
+	'axial_to_pixel',
+	'cube_to_axial',
+	'cube_to_oddr',
+	'oddr_to_axial',
+	'oddr_to_cube',
+	'oddr_to_pixel',
+	'pixel_to_axial',
+	'pixel_to_oddr',
+]
+
+
+def axial_to_cube(q, r) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+	q, r = np.asarray(q), np.asarray(r)
+	return q, r, -q - r
+
+
+def cube_to_axial(q, r, s) -> Tuple[np.ndarray, np.ndarray]:
+	"""Drop the redundant ``s`` axis.
+
+	:raises ValueError: If any coordinate does not sum to zero.
+	"""
+	q, r, s = np.asarray(q), np.asarray(r), np.asarray(s)
+	if np.any(q + r + s):
+		raise ValueError("Attributes 'q', 'r', 's' must have a sum of 0.")
+	return q, r
+
+
+def axial_to_oddr(q, r) -> Tuple[np.ndarray, np.ndarray]:
+	q, r = np.asarray(q), np.asarray(r)
+	return q + ((r - (r & 1)) >> 1), r
+
+
+def oddr_to_axial(col, row) -> Tuple[np.ndarray, np.ndarray]:
+	col, row = np.asarray(col), np.asarray(row)
+	return col - ((row - (row & 1)) >> 1), row
+
+
+def cube_to_oddr(q, r, s) -> Tuple[np.ndarray, np.ndarray]:
+	return axial_to_oddr(*cube_to_axial(q, r, s))
+
+
+def oddr_to_cube(col, row) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+	return axial_to_cube(*oddr_to_axial(col, row))
+
+
+def oddr_to_pixel(col, row, layout: GridLayout) -> Tuple[np.ndarray, np.ndarray]:
+	"""Get the pixel centers of odd-r offset coordinates.
+
+	:param col: The columns.
+	:param row: The rows.
+	:param layout: Pixel placement of the cell centers.
+	:type layout: GridLayout
+	:return: The ``(x, y)`` centers.
+	"""
+	col, row = np.asarray(col), np.asarray(row)
+	x = layout.x_start + col * layout.x_step + (row & 1) * layout.x_shift
+	y = layout.y_start + row * layout.y_step
+	return x, y
+
+
+def axial_to_pixel(q, r, layout: GridLayout) -> Tuple[np.ndarray, np.ndarray]:
+	return oddr_to_pixel(*axial_to_oddr(q, r), layout)
+
+
+def axial_round(q: float, r: float) -> Tuple[int, int]:
+	"""Round one fractional axial coordinate to the axial coordinate of the hex containing it."""
+	s = -q - r
+	round_q, round_r, round_s = round(q), round(r), round(s)
+	diff_q, diff_r, diff_s = abs(round_q - q), abs(round_r - r), abs(round_s - s)
+	if diff_q > diff_r and diff_q > diff_s:
+		round_q = -round_r - round_s
+	elif diff_r > diff_s:
+		round_r = -round_q - round_s
+	return round_q, round_r
+
+
+def axial_round_array(q, r) -> Tuple[np.ndarray, np.ndarray]:
+	"""Vectorized :func:`axial_round`."""
+	q, r = np.asarray(q, dtype=np.float64), np.asarray(r, dtype=np.float64)
+	s = -q - r
+	round_q, round_r, round_s = np.rint(q), np.rint(r), np.rint(s)
+	diff_q, diff_r, diff_s = np.abs(round_q - q), np.abs(round_r - r), np.abs(round_s - s)
+	fix_q = (diff_q > diff_r) & (diff_q > diff_s)
+	fix_r = ~fix_q & (diff_r > diff_s)
+	round_q = np.where(fix_q, -round_r - round_s, round_q)
+	round_r = np.where(fix_r, -round_q - round_s, round_r)
+	return round_q.astype(np.int64), round_r.astype(np.int64)
+
+
+def pixel_to_axial(x, y, layout: GridLayout) -> Tuple[np.ndarray, np.ndarray]:
+	"""Get the axial coordinates of the hexes containing pixels.
+
+	:param x: The pixel x coordinates.
+	:param y: The pixel y coordinates.
+	:param layout: Pixel placement of the cell centers.
+	:type layout: GridLayout
+	:return: The ``(q, r)`` coordinates, as int64 arrays.
+	"""
+	r = (np.asarray(y, dtype=np.float64) - layout.y_start) / layout.y_step
+	q = (np.asarray(x, dtype=np.float64) - layout.x_start) / layout.x_step - r / 2
+	return axial_round_array(q, r)
+
+
+def pixel_to_oddr(x, y, layout: GridLayout) -> Tuple[np.ndarray, np.ndarray]:
+	return axial_to_oddr(*pixel_to_axial(x, y, layout))
@@ -2,11 +2,10 @@
 # vim: ft=python
 """grid/cube.py."""
 # Standard Library
+from operator import itemgetter
 from typing import (
-	Generator,
+	Dict,
 	Iterator,
-	List,
-	NamedTuple,
 	Tuple,
 )
 
@@ -15,122 +14,212 @@
 from loggers import get_logger
 
 
-__all__ = ['Cube']
+__all__ = ['CUBE_DIRECTIONS', 'Cube']
 
+LOG = get_logger(__name__)
 
-class Cube:
+_tuple_new = tuple.__new__
 
-	def __new__(cls, q: int, r: int, s: int):
-		if q + r + s != 0:
-			raise ValueError(f"Attributes 'q', 'r', 's' must have a sum of 0, not {q + r + s}")
-		return super().__new__(cls, q, r, s)
+# Cubes within this distance of the origin are pre-built and shared by :meth:`Cube.intern`.
+INTERN_RADIUS: int = 8
+
+
+class Cube(tuple):
+	"""An immutable (q, r, s) hex coordinate.
 
-	def __init__(self, q: int, r: int, s: int) -> None:
-		"""Initialize a new Cube coordinate.
+	A Cube is a tuple subclass without instance ``__dict__``, so it is as small as a 3-tuple and
+	hashes and compares with the speed of one. A Cube compares equal to the plain tuple ``(q, r, s)``.
 
-		.. note:: To be lenient we accept floats and turn them into ints, but only if they pass the new validation.
+	q, r, and s must always total to zero.
+	See https://www.redblobgames.com/grids/hexagons/ for details.
+	"""
+
+	__slots__ = ()
+
+	def __new__(cls, q: int, r: int, s: int):
+		"""Create a new Cube coordinate.
+
+		.. note:: To be lenient we accept floats and turn them into ints, but only if they pass the validation.
 
 		:param q: Rightward axes.
 		:param r: Axes two.
 		:param s: Axes three.
 		"""
-		self._q: int = q
-		self._r: int = r
-		self._s: int = s
+		return _tuple_new(cls, cls._validate(q, r, s))
 
-		return
+	@classmethod
+	def _make(cls, q: int, r: int, s: int) -> 'Cube':
+		"""Create a Cube from values already known to be valid ints, skipping validation."""
+		return _tuple_new(cls, (q, r, s))
+
+	@classmethod
+	def intern(cls, q: int, r: int, s: int) -> 'Cube':
+		"""Get a shared Cube for coordinates near the origin, or a new one otherwise.
+
+		Useful in hot loops that repeatedly produce the same small offsets.
+		"""
+		cube = _INTERNED.get((q, r, s))
+		if cube is None:
+			cube = cls(q, r, s)
+		return cube
 
 	def __str__(self) -> str:
 		return f"{self.__class__.__name__}({self.q}, {self.r}, {self.s})"
 
 	def __repr__(self) -> str:
-		return f"<{self.__class__.__name__}(x: {self.q}, y: {self.r}, s: {self.s})>"
-
-	def __abs__(self):
-		return (abs(self.q) + abs(self.r) + abs(self.s)) // 2
+		return f"<{self.__class__.__name__}(q: {self.q}, r: {self.r}, s: {self.s})>"
 
-	def __iter__(self):
-		yield self.q
-		yield self.r
-		yield self.s
+	def __getnewargs__(self) -> Tuple[int, int, int]:
+		return tuple(self)
 
-	def __eq__(self, other) -> bool:
-		if self.__class__ == other.__class:
-			return self.q == other.q and self.r == other.r and self.s == other.s
-		return False
-
-	def __ne__(self, other) -> bool:
-		return not self.__eq__(other)
+	def __abs__(self) -> int:
+		q, r, s = self
+		return (abs(q) + abs(r) + abs(s)) >> 1
 
 	def __neg__(self):
-		return Cube(-self.q, -self.r, -self.s)
+		q, r, s = self
+		return self._make(-q, -r, -s)
 
 	def __lt__(self, other) -> bool:
-		if self.q < other.q and self.r < other.r and self.s < other.s:
-			return True
-		return False
+		return self[0] < other[0] and self[1] < other[1] and self[2] < other[2]
+
+	def __le__(self, other) -> bool:
+		return self[0] <= other[0] and self[1] <= other[1] and self[2] <= other[2]
 
 	def __gt__(self, other) -> bool:
-		if self.q > other.q and self.r > other.r and self.s > other.s:
-			return True
-		return False
+		return self[0] > other[0] and self[1] > other[1] and self[2] > other[2]
 
-	def __hash__(self) -> int:
-		return hash(self.qrs)
+	def __ge__(self, other) -> bool:
+		return self[0] >= other[0] and self[1] >= other[1] and self[2] >= other[2]
 
 	def __add__(self, other):
-		return Cube(self.q + other.q, self.r + other.r, self.s + other.s)
+		q1, r1, s1 = self
+		q2, r2, s2 = other
+		return self._make(q1 + q2, r1 + r2, s1 + s2)
 
 	def __sub__(self, other):
-		return Cube(self.q - other.q, self.r - other.r, self.s - other.s)
+		q1, r1, s1 = self
+		q2, r2, s2 = other
+		return self._make(q1 - q2, r1 - r2, s1 - s2)
 
 	def __mul__(self, k):
 		if isinstance(k, Cube):
-			return Cube(self.r * k.r, self.r * k.r, self.s * k.s)
+			return Cube(self.q * k.q, self.r * k.r, self.s * k.s)
 		elif isinstance(k, int):
-			return Cube(self.q * k, self.r * k, self.s * k)
+			q, r, s = self
+			return self._make(q * k, r * k, s * k)
 		else:
 			raise ValueError("Cube multiplier must be Cube or scalar")
 
-	def __iter__(self):
-		yield self.q
-		yield self.r
-		yield self.s
+	# Without, `3 * cube` falls back to tuple repetition.
+	__rmul__ = __mul__
 
-	def __getitem__(self, idx: int) -> int:
-		return self.qrs[idx]
-
-	@property
-	def q(self) -> int:
-		return self._q
-
-	@property
-	def r(self) -> int:
-		return self._r
-
-	@property
-	def s(self) -> int:
-		return self._s
+	q = property(itemgetter(0))
+	r = property(itemgetter(1))
+	s = property(itemgetter(2))
 
 	@property
 	def qr(self) -> Tuple[int, int]:
-		return self.q, self.r
+		return self[0], self[1]
 
 	@property
 	def qrs(self) -> Tuple[int, int, int]:
-		return self.q, self.r, self.s
+		return tuple(self)
 
 	@staticmethod
-	def _validate(q: Number, r: Number, s: Number) -> None:
-		if q + r + s != 0:
-			raise ValueError(f"attributes 'q', 'r', 's' must have a sum of 0, not {q + r + s}")
-		return
+	def _validate(q: Number, r: Number, s: Number) -> Tuple[int, int, int]:
+		"""Get the coordinates as ints, if they are whole numbers totaling zero."""
+		values = (int(q), int(r), int(s))
+		if values != (q, r, s):
+			raise ValueError(f"Attributes 'q', 'r', 's' must be whole numbers, not {(q, r, s)}")
+		if sum(values) != 0:
+			raise ValueError(f"Attributes 'q', 'r', 's' must have a sum of 0, not {sum(values)}")
+		return values
 
 	def distance(self, other) -> int:
-		return (abs(self.q - other.q) + abs(self.r - other.r) + abs(self.s - other.s)) / 2
+		q1, r1, s1 = self
+		q2, r2, s2 = other
+		return (abs(q1 - q2) + abs(r1 - r2) + abs(s1 - s2)) >> 1
+
+	def neighbour(self, direction: int):
+		"""Get the adjacent Cube in one of the six :data:`CUBE_DIRECTIONS`."""
+		q, r, s = self
+		dq, dr, ds = CUBE_DIRECTIONS[direction]
+		return self._make(q + dq, r + dr, s + ds)
+
+	def neighbours(self) -> Iterator['Cube']:
+		q, r, s = self
+		for dq, dr, ds in CUBE_DIRECTIONS:
+			yield self._make(q + dq, r + dr, s + ds)
+
+	def range(self, radius: int) -> Iterator['Cube']:
+		"""Lazily yield every Cube within ``radius`` steps of this one, including itself.
+
+		:param radius: The maximum distance.
+		:type radius: int
+		"""
+		q, r, s = self
+		make = self._make
+		for dq in range(-radius, radius + 1):
+			for dr in range(max(-radius, -dq - radius), min(radius, -dq + radius) + 1):
+				yield make(q + dq, r + dr, s - dq - dr)
+
+	def ring(self, radius: int) -> Iterator['Cube']:
+		"""Lazily yield the Cubes exactly ``radius`` steps away, clockwise starting West.
+
+		:param radius: The distance of the ring, a radius of 0 yields only this Cube.
+		:type radius: int
+		"""
+		if radius == 0:
+			yield self
+			return
+
+		q, r, s = self
+		make = self._make
+		# Start on the West corner, then walk each side, turning clockwise from North-East.
+		q, r, s = q - radius, r, s + radius
+		for dq, dr, ds in CUBE_DIRECTIONS:
+			for _ in range(radius):
+				yield make(q, r, s)
+				q, r, s = q + dq, r + dr, s + ds
+		return
+
+	def spiral(self, radius: int) -> Iterator['Cube']:
+		"""Lazily yield this Cube, then every ring out to ``radius``."""
+		for ring_radius in range(radius + 1):
+			yield from self.ring(ring_radius)
+		return
+
+	def range_intersection(self, radius: int, other, other_radius: int) -> Iterator['Cube']:
+		"""Lazily yield the Cubes within ``radius`` of this Cube and within ``other_radius`` of ``other``."""
+		q1, r1, s1 = self
+		q2, r2, s2 = other
+		make = self._make
+
+		q_min, q_max = max(q1 - radius, q2 - other_radius), min(q1 + radius, q2 + other_radius)
+		r_min, r_max = max(r1 - radius, r2 - other_radius), min(r1 + radius, r2 + other_radius)
+		s_min, s_max = max(s1 - radius, s2 - other_radius), min(s1 + radius, s2 + other_radius)
+
+		for q in range(q_min, q_max + 1):
+			for r in range(max(r_min, -q - s_max), min(r_max, -q - s_min) + 1):
+				yield make(q, r, -q - r)
 
 	def rotate_clockwise(self):
-		return Cube(-self.r, -self.s, -self.q)
+		q, r, s = self
+		return self._make(-r, -s, -q)
 
 	def rotate_counterclockwise(self):
-		return Cube(-self.s, -self.q, -self.r)
+		q, r, s = self
+		return self._make(-s, -q, -r)
+
+
+_INTERNED: Dict[Tuple[int, int, int], Cube] = {
+	(q, r, -q - r): Cube._make(q, r, -q - r)
+	for q in range(-INTERN_RADIUS, INTERN_RADIUS + 1)
+	for r in range(max(-INTERN_RADIUS, -q - INTERN_RADIUS), min(INTERN_RADIUS, -q + INTERN_RADIUS) + 1)
+}
+
+# NE - Clockwise
+CUBE_DIRECTIONS: Tuple[Cube, ...] = tuple(
+	Cube.intern(q, r, s) for q, r, s in ((+1, -1, 0), (+1, 0, -1), (0, +1, -1), (-1, +1, 0), (-1, 0, +1), (0, -1, +1))
+)
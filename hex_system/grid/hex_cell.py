@@ -13,6 +13,7 @@
 # Standard Library
 import math
 from typing import (
+	Iterator,
 	List,
 	Optional,
 	Tuple,
@@ -36,8 +37,7 @@
 class HexCell:
 	"""A hex position in cube coordinates."""
 
-	# NE - Clockwise
-	# DIRECTION_VECTORS = {Cube(+1, -1, 0), Cube(+1, 0, -1), Cube(0, +1, -1), Cube(-1, +1, 0), Cube(-1, 0, +1), Cube(0, -1, +1)}
+	__slots__ = ('_cube', '_offset')
 
 	def __new__(cls, cube: Cube):
 		"""Ensure that created hexes have valid cube coordinates.
@@ -46,30 +46,43 @@ def __new__(cls, cube: Cube):
 		:type cube: Cube
 		"""
 		if cube.q + cube.r + cube.s != 0:
-			raise ValueError(f"<q: {q} r: {r} s: {s}> coordinate must equal 0.")
+			raise ValueError(f"<q: {cube.q} r: {cube.r} s: {cube.s}> coordinate must equal 0.")
 		return super().__new__(cls)
 
 	def __init__(self, cube: Cube) -> None:
-
-		self._q: int = int(cube.q)
-		self._r: int = int(cube.r)
-		self._s: int = int(cube.s)
-		self._cube: Cube = cube
-
-		self._col: int = int(self.q + (self.r - (self.r >> 1)) / 2)
-		self._row: int = int(self.r)
-		self._offset: Offset = Offset(self.col, self.row)
-
+		self._cube: Cube = cube if isinstance(cube, Cube) else Cube(*cube)
+		# Built on first access, most cells never need their offset coordinate.
+		self._offset: Optional[Offset] = None
 		return
 
+	@classmethod
+	def from_offset(cls, offset: Offset) -> 'HexCell':
+		"""Create a cell from an odd-r offset coordinate."""
+		col, row = offset
+		q = col - ((row - (row & 1)) >> 1)
+		cell = cls(Cube._make(q, row, -q - row))
+		cell._offset = offset if isinstance(offset, Offset) else Offset(col, row)
+		return cell
+
 	def __str__(self) -> str:
 		return f"{self.__class__.__name__}({self.q}, {self.r}, {self.s})"
 
 	def __repr__(self) -> str:
 		return f"<{self.__class__.__name__}(q: {self.q}, r: {self.r}, s: {self.s})>"
 
+	def __eq__(self, other) -> bool:
+		if isinstance(other, HexCell):
+			return self._cube == other._cube
+		return NotImplemented
+
+	def __hash__(self) -> int:
+		return hash(self._cube)
+
 	@property
 	def offset(self) -> Offset:
+		if self._offset is None:
+			q, r, _ = self._cube
+			self._offset = Offset._make(q + ((r - (r & 1)) >> 1), r)
 		return self._offset
 
 	@property
@@ -78,31 +91,52 @@ def cube(self) -> Cube:
 
 	@property
 	def col(self) -> int:
-		return self._col
+		return self.offset.col
 
 	@property
 	def row(self) -> int:
-		return self._row
+		return self._cube[1]
 
 	@property
 	def q(self) -> int:
-		return self._q
+		return self._cube[0]
 
 	@property
 	def r(self) -> int:
-		return self._r
+		return self._cube[1]
 
 	@property
 	def s(self) -> int:
-		return self._s
+		return self._cube[2]
 
 	@property
 	def qr(self) -> Tuple[int, int]:
-		return (self.q, self.r)
+		return self._cube.qr
 
 	@property
 	def qrs(self) -> Tuple[int, int, int]:
-		return (self.q, self.r, self.s)
-
-	#def direction(direction):
-		#return self.DIRECTION_VECTORS[direction]
+		return self._cube.qrs
+
+	def neighbours(self) -> Iterator['HexCell']:
+		for cube in self._cube.neighbours():
+			yield HexCell(cube)
+
+	def range(self, radius: int) -> Iterator['HexCell']:
+		"""See :meth:`grid.Cube.range`."""
+		for cube in self._cube.range(radius):
+			yield HexCell(cube)
+
+	def ring(self, radius: int) -> Iterator['HexCell']:
+		"""See :meth:`grid.Cube.ring`."""
+		for cube in self._cube.ring(radius):
+			yield HexCell(cube)
+
+	def spiral(self, radius: int) -> Iterator['HexCell']:
+		"""See :meth:`grid.Cube.spiral`."""
+		for cube in self._cube.spiral(radius):
+			yield HexCell(cube)
+
+	def range_intersection(self, radius: int, other: 'HexCell', other_radius: int) -> Iterator['HexCell']:
+		"""See :meth:`grid.Cube.range_intersection`."""
+		for cube in self._cube.range_intersection(radius, other.cube, other_radius):
+			yield HexCell(cube)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""grid/layout.py."""
+# Standard Library
+from typing import NamedTuple
+
+# First Party Library
+from geometry import Hexagon
+
+# App
+from utils import round_to_int
+
+
+__all__ = ['GridLayout', 'get_layout']
+
+
+class GridLayout(NamedTuple):
+	"""Pixel placement of cell centers.
+
+	The center of cell (col, row) is::
+
+		x = x_start + col * x_step + (row & 1) * x_shift
+		y = y_start + row * y_step
+	"""
+
+	x_start: int
+	y_start: int
+	x_step: int
+	y_step: int
+	x_shift: int
+
+
+def get_layout(hexagon: Hexagon) -> GridLayout:
+	"""Compute the pixel layout used by :class:`hex_grid.HexGrid` for a given hexagon size.
+
+	:param hexagon: The hexagon whose dimensions define the spacing.
+	:type hexagon: Hexagon
+	:rtype: GridLayout
+	"""
+	return GridLayout(
+		x_start=round_to_int(hexagon.width / 2),
+		y_start=round_to_int(hexagon.height / 2),
+		x_step=round_to_int(((hexagon.width + hexagon.width) / 2) + 1),
+		y_step=round_to_int(hexagon.height * (3 / 4)),
+		# Nudge odd rows to the right.
+		x_shift=round_to_int(hexagon.width / 2),
+	)
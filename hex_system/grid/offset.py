@@ -2,12 +2,10 @@
 # vim: ft=python
 """coordinates.py."""
 # Standard Library
-from dataclasses import dataclass
+from operator import itemgetter
 from typing import (
-	Generator,
-	Iterator,
+	Dict,
 	List,
-	NamedTuple,
 	Tuple,
 )
 
@@ -16,93 +14,105 @@
 from loggers import get_logger
 
 
-__all__ = ['Cube', 'Offset']
+__all__ = ['Offset']
 
+LOG = get_logger(__name__)
 
-@dataclass
-class Offset:
-	"""Create x, y coordinates.
+_tuple_new = tuple.__new__
+
+# Offsets with both values in ``range(-INTERN_LIMIT, INTERN_LIMIT + 1)`` are pre-built and shared by :meth:`Offset.intern`.
+INTERN_LIMIT: int = 8
+
+
+class Offset(tuple):
+	"""An immutable (col, row) coordinate.
 
 	col = horizontal
 	row = vertical
+
+	An Offset is a tuple subclass without instance ``__dict__``, so it hashes and compares with the speed of
+	a 2-tuple. An Offset compares equal to the plain tuple ``(col, row)``.
 	"""
-	__slots__ = ('col', 'row')
-	col: int
-	row: int
 
-	def __init__(self, col: int, row: int) -> None:
-		self.col = col
-		self.row = row
-		return
+	__slots__ = ()
+
+	def __new__(cls, col: int, row: int):
+		return _tuple_new(cls, (int(col), int(row)))
+
+	@classmethod
+	def _make(cls, col: int, row: int) -> 'Offset':
+		"""Create an Offset from values already known to be ints."""
+		return _tuple_new(cls, (col, row))
+
+	@classmethod
+	def intern(cls, col: int, row: int) -> 'Offset':
+		"""Get a shared Offset for small coordinates, or a new one otherwise."""
+		offset = _INTERNED.get((col, row))
+		if offset is None:
+			offset = cls(col, row)
+		return offset
 
 	def __repr__(self) -> str:
 		return f"<{self.__class__.__name__}(col: {self.col}, row: {self.row})>"
 
 	def __str__(self) -> str:
-		return f"{self.__class__}({self.col}, {self.row})"
+		return f"{self.__class__.__name__}({self.col}, {self.row})"
 
-	def __hash__(self) -> int:
-		"""
-		.. note:: Maybe 31 * hash(self.col) + hash(self.row)
-		:return: a unique hash
-		"""
-		return hash((self.col, self.row))
+	def __getnewargs__(self) -> Tuple[int, int]:
+		return tuple(self)
 
-	def __eq__(self, other) -> bool:
+	def __lt__(self, other) -> bool:
 		if isinstance(other, Offset):
-			return self.col == other.col and self.row == other.row
+			return self[0] < other[0] and self[1] < other[1]
 		else:
 			raise TypeError('Other object is not an Offset')
 
-	def __ne__(self, other) -> bool:
+	def __le__(self, other) -> bool:
 		if isinstance(other, Offset):
-			return not self.__eq__(other)
+			return self[0] <= other[0] and self[1] <= other[1]
 		else:
 			raise TypeError('Other object is not an Offset')
 
-	def __lt__(self, other) -> bool:
+	def __gt__(self, other) -> bool:
 		if isinstance(other, Offset):
-			return self.col < other.col and self.row < other.row
+			return self[0] > other[0] and self[1] > other[1]
 		else:
 			raise TypeError('Other object is not an Offset')
 
-	def __gt__(self, other) -> bool:
+	def __ge__(self, other) -> bool:
 		if isinstance(other, Offset):
-			return self.col > other.col and self.row > other.row
+			return self[0] >= other[0] and self[1] >= other[1]
 		else:
 			raise TypeError('Other object is not an Offset')
 
 	def __add__(self, other):
 		if isinstance(other, Offset):
-			return Offset(self.col + other.col, self.row + other.row)
+			return self._make(self[0] + other[0], self[1] + other[1])
 		else:
 			raise TypeError(f'Unable to add {other}')
 
 	def __sub__(self, other):
 		if isinstance(other, Offset):
-			return Offset(self.col - other.col, self.row - other.row)
+			return self._make(self[0] - other[0], self[1] - other[1])
 		else:
 			raise TypeError(f'Unable to subtract {other}')
 
-	def __iter__(self) -> Iterator[int]:
-		return iter((self.col, self.row))
-
-	def __setattr__(self, key, value) -> None:
-		object.__setattr__(self, key, value)
-		return
-
-	def __getitem__(self, item) -> int:
-		return self.list[item]
+	def __mul__(self, other):
+		# Offsets do not scale, and tuple repetition would give a 4-tuple.
+		raise TypeError(f'Unable to multiply {self} by {other}')
 
-	def __setitem__(self, key, value) -> None:
-		self.list[key] = value
-		return
+	__rmul__ = __mul__
 
-	def __len__(self) -> int:
-		return len(self.list)
+	col = property(itemgetter(0))
+	row = property(itemgetter(1))
 
 	@property
 	def list(self) -> List[int]:
 		return [self.col, self.row]
 
 
+_INTERNED: Dict[Tuple[int, int], Offset] = {
+	(col, row): Offset._make(col, row)
+	for col in range(-INTERN_LIMIT, INTERN_LIMIT + 1)
+	for row in range(-INTERN_LIMIT, INTERN_LIMIT + 1)
+}
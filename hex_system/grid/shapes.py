@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""grid/shapes.py.
+
+Vectorized counterparts of :meth:`grid.Cube.range`, :meth:`grid.Cube.ring` and :meth:`grid.Cube.spiral`.
+
+Each shape is built once per radius around the origin, cached read-only, then shifted to the
+requested center. Every function returns ``(q, r, s)`` int32 arrays, in the same order as the
+matching :class:`grid.Cube` generator.
+"""
+# Standard Library
+from functools import lru_cache
+from typing import Tuple
+
+# Third Party Library
+import numpy as np
+
+# App
+from grid.cube import Cube
+
+
+__all__ = ['hex_range_array', 'hex_ring_array', 'hex_spiral_array']
+
+_ORIGIN: Cube = Cube(0, 0, 0)
+
+CubeArrays = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _to_template(cubes) -> np.ndarray:
+	template = np.array(list(cubes), dtype=np.int32).reshape(-1, 3)
+	template.flags.writeable = False
+	return template
+
+
+@lru_cache(maxsize=64)
+def _range_template(radius: int) -> np.ndarray:
+	return _to_template(_ORIGIN.range(radius))
+
+
+@lru_cache(maxsize=64)
+def _ring_template(radius: int) -> np.ndarray:
+	return _to_template(_ORIGIN.ring(radius))
+
+
+@lru_cache(maxsize=64)
+def _spiral_template(radius: int) -> np.ndarray:
+	return _to_template(_ORIGIN.spiral(radius))
+
+
+def _shift(template: np.ndarray, center) -> CubeArrays:
+	q, r, s = center
+	return template[:, 0] + np.int32(q), template[:, 1] + np.int32(r), template[:, 2] + np.int32(s)
+
+
+def hex_range_array(center, radius: int) -> CubeArrays:
+	"""Get every coordinate within ``radius`` steps of ``center``.
+
+	:param center: The (q, r, s) center.
+	:type center: Cube
+	:param radius: The maximum distance.
+	:type radius: int
+	:rtype: Tuple[np.ndarray, np.ndarray, np.ndarray]
+	"""
+	return _shift(_range_template(radius), center)
+
+
+def hex_ring_array(center, radius: int) -> CubeArrays:
+	"""Get the coordinates exactly ``radius`` steps from ``center``."""
+	return _shift(_ring_template(radius), center)
+
+
+def hex_spiral_array(center, radius: int) -> CubeArrays:
+	"""Get ``center`` followed by every ring out to ``radius``."""
+	return _shift(_spiral_template(radius), center)
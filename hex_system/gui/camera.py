@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""gui/camera.py.
+
+A scrolling, zooming view onto the pixel plane of a grid.
+
+World coordinates are the pixel coordinates the grid was laid out in. The camera's position is
+the world point drawn at the top left corner of the screen::
+
+	screen = (world - position) * zoom
+"""
+# Standard Library
+from typing import (
+	Tuple,
+)
+
+# Third Party Library
+import numpy as np
+
+# First Party Library
+from geometry import (
+	Point,
+	Rectangle,
+)
+
+# App
+from config import Number
+from loggers import get_logger
+
+
+__all__ = ['Camera']
+
+LOG = get_logger(__name__)
+
+MIN_ZOOM: float = 0.25
+MAX_ZOOM: float = 4.0
+
+
+class Camera:
+	"""Position and zoom of the part of the world shown on a screen of a fixed size."""
+
+	def __init__(
+		self,
+		width: int,
+		height: int,
+		x: Number = 0,
+		y: Number = 0,
+		zoom: float = 1.0,
+		min_zoom: float = MIN_ZOOM,
+		max_zoom: float = MAX_ZOOM
+	) -> None:
+		"""Create a camera.
+
+		:param width: The screen width in pixels.
+		:type width: int
+		:param height: The screen height in pixels.
+		:type height: int
+		:param x: The world x coordinate at the left edge of the screen.
+		:type x: Number
+		:param y: The world y coordinate at the top edge of the screen.
+		:type y: Number
+		:param zoom: Screen pixels per world pixel.
+		:type zoom: float
+		:param min_zoom: The smallest zoom allowed.
+		:type min_zoom: float
+		:param max_zoom: The largest zoom allowed.
+		:type max_zoom: float
+		:rtype: None
+		"""
+		if width <= 0 or height <= 0:
+			raise ValueError(f"Attributes 'width' and 'height' must be greater than 0.")
+		if not 0 < min_zoom <= max_zoom:
+			raise ValueError(f"Attributes 'min_zoom' and 'max_zoom' must satisfy 0 < min_zoom <= max_zoom.")
+
+		self._width: int = width
+		self._height: int = height
+		self._x: float = float(x)
+		self._y: float = float(y)
+		self._min_zoom: float = min_zoom
+		self._max_zoom: float = max_zoom
+		self._zoom: float = self._clamp_zoom(zoom)
+		return
+
+	def __repr__(self) -> str:
+		return f'<{self.__class__.__name__}(x: {self._x}, y: {self._y}, zoom: {self._zoom})>'
+
+	@property
+	def x(self) -> float:
+		return self._x
+
+	@property
+	def y(self) -> float:
+		return self._y
+
+	@property
+	def zoom(self) -> float:
+		return self._zoom
+
+	@property
+	def size(self) -> Tuple[int, int]:
+		"""The screen size in pixels."""
+		return self._width, self._height
+
+	@property
+	def state(self) -> Tuple[float, float, float]:
+		"""``(x, y, zoom)``, compare two states to know if the view moved."""
+		return self._x, self._y, self._zoom
+
+	@property
+	def viewport(self) -> Rectangle:
+		"""The part of the world on screen, in world coordinates."""
+		return Rectangle(
+			Point(self._x, self._y),
+			Point(self._x + self._width / self._zoom, self._y + self._height / self._zoom)
+		)
+
+	def _clamp_zoom(self, zoom: float) -> float:
+		return min(max(zoom, self._min_zoom), self._max_zoom)
+
+	def resize(self, width: int, height: int) -> None:
+		"""Change the screen size, keeping the top left corner in place."""
+		if width <= 0 or height <= 0:
+			raise ValueError(f"Attributes 'width' and 'height' must be greater than 0.")
+		self._width, self._height = width, height
+		return
+
+	def move_to(self, x: Number, y: Number) -> None:
+		"""Put the world point ``(x, y)`` at the top left corner of the screen."""
+		self._x, self._y = float(x), float(y)
+		return
+
+	def pan(self, dx: Number, dy: Number) -> None:
+		"""Scroll the view by a distance in screen pixels.
+
+		Positive values scroll right and down, so the world appears to move left and up.
+		"""
+		self._x += dx / self._zoom
+		self._y += dy / self._zoom
+		return
+
+	def zoom_at(self, factor: float, screen_x: Number, screen_y: Number) -> None:
+		"""Multiply the zoom, keeping the world point under ``(screen_x, screen_y)`` in place.
+
+		:param factor: The zoom multiplier, above 1 zooms in.
+		:type factor: float
+		:param screen_x: The fixed point's x coordinate on screen, e.g. the mouse.
+		:type screen_x: Number
+		:param screen_y: The fixed point's y coordinate on screen.
+		:type screen_y: Number
+		:rtype: None
+		"""
+		world_x, world_y = self.to_world(screen_x, screen_y)
+		self._zoom = self._clamp_zoom(self._zoom * factor)
+		self._x = world_x - screen_x / self._zoom
+		self._y = world_y - screen_y / self._zoom
+		return
+
+	def to_world(self, screen_x, screen_y):
+		"""Convert screen coordinates to world coordinates, works on scalars and arrays."""
+		return self._x + screen_x / self._zoom, self._y + screen_y / self._zoom
+
+	def to_screen(self, world_x, world_y):
+		"""Convert world coordinates to screen coordinates, works on scalars and arrays."""
+		return (world_x - self._x) * self._zoom, (world_y - self._y) * self._zoom
+
+	def points_to_screen(self, points: np.ndarray) -> np.ndarray:
+		"""Convert an array of ``(..., 2)`` world points to screen points."""
+		return (np.asarray(points) - (self._x, self._y)) * self._zoom
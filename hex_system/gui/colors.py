@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""gui/colors.py."""
+
+
+BACKGROUND_2 = '#fdf6e3'
+BACKGROUND_1 = '#eee8d5'
+
+FOREGROUND_3 = '#93a1a1'
+FOREGROUND_2 = '#657b83'
+FOREGROUND_1 = '#586e75'
+
+BLACK = '#002b36'
+
+WHITE = '#fdf6e3'
+YELLOW = '#b58900'
+ORANGE = '#cb4b16'
+RED = '#dc322f'
+MAGENTA = '#d33682'
+VIOLET = '#6c71c4'
+BLUE = '#268bd2'
+CYAN = '#2aa198'
+GREEN = '#859900'
@@ -8,20 +8,17 @@
 # Standard Library
 import tkinter as tk
 from typing import (
-	List,
 	Optional,
 	Tuple,
 )
 
-# First Party Library
-from geometry import (
-	Hexagon,
-	Line,
-	Point,
-	Rectangle,
-)
-
 # App
+from gui.colors import (
+	BLACK,
+	GREEN,
+)
+from gui.camera import Camera
+from gui.viewport import ViewportRenderer
 from hex_grid import (
 	HexGrid,
 	get_hex_grid,
@@ -44,24 +41,8 @@
 XPAD: int = 32
 YPAD: int = 32
 
-BACKGROUND_2 = '#fdf6e3'
-BACKGROUND_1 = '#eee8d5'
-
-FOREGROUND_3 = '#93a1a1'
-FOREGROUND_2 = '#657b83'
-FOREGROUND_1 = '#586e75'
-
-BLACK = '#002b36'
-
-WHITE = '#fdf6e3'
-YELLOW = '#b58900'
-ORANGE = '#cb4b16'
-RED = '#dc322f'
-MAGENTA = '#d33682'
-VIOLET = '#6c71c4'
-BLUE = '#268bd2'
-CYAN = '#2aa198'
-GREEN = '#859900'
+# Zoom multiplier of one mouse wheel notch.
+ZOOM_STEP: float = 1.1
 
 
 class Root(tk.Tk):
@@ -107,6 +88,10 @@ def __init__(self, root, width=WINDOW_WIDTH, height=WINDOW_HEIGHT, bg=BLACK) ->
 		# in both x and y direction
 		self.pack(expand=1, fill='both')
 		self._hex_grid = get_hex_grid(GRID_WIDTH, GRID_HEIGHT)
+		self._camera = Camera(width, height)
+		self._renderer = ViewportRenderer(self, self._hex_grid, self._camera, fill=GREEN, outline=BLACK)
+		self._drag_from: Optional[Tuple[int, int]] = None
+		self._bind_camera()
 		self._draw_hex_map()
 		LOG.debug(f'TileMap: {self} created.')
 		return
@@ -126,65 +111,59 @@ def rows(self) -> int:
 	def hex_grid(self) -> HexGrid:
 		return self._hex_grid
 
-	def _draw_hexagon(
-		self,
-		corners: List[Point],
-		color: str = BLACK,
-		color1: Optional[str] = None,
-		color2: Optional[str] = None,
-		color3: Optional[str] = None,
-		color4: Optional[str] = None,
-		color5: Optional[str] = None,
-		color6: Optional[str] = None,
-		fill: str = GREEN,
-		width: int = 2
-	) -> None:
-
-		vertex_north: Point = corners[0]
-		vertex_northeast: Point = corners[1]
-		vertex_southeast: Point = corners[2]
-		vertex_south: Point = corners[3]
-		vertex_southwest: Point = corners[4]
-		vertex_northwest: Point = corners[5]
-
-		# this setting allow to specify a different color for each edge between vertices.
-		if color1 is None:
-			color1 = color
-		if color2 is None:
-			color2 = color
-		if color3 is None:
-			color3 = color
-		if color4 is None:
-			color4 = color
-		if color5 is None:
-			color5 = color
-		if color6 is None:
-			color6 = color
-
-		self.create_line(vertex_north.x, vertex_north.y, vertex_northeast.x, vertex_northeast.y, fill=color1, width=width)
-		self.create_line(vertex_northeast.x, vertex_northeast.y, vertex_southeast.x, vertex_southeast.y, fill=color2, width=width)
-		self.create_line(vertex_southeast.x, vertex_southeast.y, vertex_south.x, vertex_south.y, fill=color3, width=width)
-		self.create_line(vertex_south.x, vertex_south.y, vertex_southwest.x, vertex_southwest.y, fill=color4, width=width)
-		self.create_line(vertex_southwest.x, vertex_southwest.y, vertex_northwest.x, vertex_northwest.y, fill=color5, width=width)
-		self.create_line(vertex_northwest.x, vertex_northwest.y, vertex_north.x, vertex_north.y, fill=color6, width=width)
-
-		# Maybe you don't want to fill a hex, only some edges.
-		if fill is not None:
-			self.create_polygon(
-				vertex_north.xy,
-				vertex_northeast.xy,
-				vertex_southeast.xy,
-				vertex_south.xy,
-				vertex_southwest.xy,
-				vertex_northwest.xy,
-				fill=fill
-			)
+	@property
+	def camera(self) -> Camera:
+		return self._camera
+
+	@property
+	def renderer(self) -> ViewportRenderer:
+		return self._renderer
+
+	def _bind_camera(self) -> None:
+		self.bind('<ButtonPress-1>', self._on_drag_start)
+		self.bind('<B1-Motion>', self._on_drag)
+		self.bind('<ButtonRelease-1>', self._on_drag_end)
+		# Windows and macOS send <MouseWheel>, X11 sends buttons 4 and 5.
+		self.bind('<MouseWheel>', self._on_wheel)
+		self.bind('<Button-4>', self._on_wheel)
+		self.bind('<Button-5>', self._on_wheel)
+		self.bind('<Configure>', self._on_resize)
+		return
+
+	def _on_drag_start(self, event) -> None:
+		self._drag_from = (event.x, event.y)
+		return
+
+	def _on_drag(self, event) -> None:
+		if self._drag_from is None:
+			return
+		from_x, from_y = self._drag_from
+		self._drag_from = (event.x, event.y)
+		# Dragging pulls the map along with the mouse, so the camera moves the other way.
+		self.camera.pan(from_x - event.x, from_y - event.y)
+		self.renderer.request_render()
+		return
+
+	def _on_drag_end(self, event) -> None:
+		self._drag_from = None
+		return
+
+	def _on_wheel(self, event) -> None:
+		zoom_in = event.num == 4 or event.delta > 0
+		self.camera.zoom_at(ZOOM_STEP if zoom_in else 1 / ZOOM_STEP, event.x, event.y)
+		self.renderer.request_render()
+		return
+
+	def _on_resize(self, event) -> None:
+		if event.width > 1 and event.height > 1:
+			self.camera.resize(event.width, event.height)
+			self.renderer.request_render()
 		return
 
 	def _draw_hex_map(self) -> None:
-		for hexagon in self.hex_grid.hexes:
-			# Hexagons have a property to easily get the x, y of all their vertices.
-			self._draw_hexagon(hexagon.corners)
+		# Only the hexes in view are drawn, scrolling and zooming recycle their polygons.
+		# Later changes go through `renderer.set_style`.
+		self.renderer.render()
 		return
 
 
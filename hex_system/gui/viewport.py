@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""gui/viewport.py.
+
+Draw only the part of a :class:`hex_grid.HexGrid` a :class:`gui.camera.Camera` can see.
+
+Each render asks the grid for the cells overlapping the viewport, which costs as much as the
+cells on screen, however large the grid. Cells scrolling out of view hand their canvas polygon
+to a pool, and cells scrolling in take one from it, so scrolling moves and restyles a bounded
+set of items instead of creating and deleting them.
+
+Style changes of cells on screen are queued and applied together on the next idle callback, and
+only if they change what is drawn.
+"""
+# Standard Library
+from typing import (
+	Dict,
+	List,
+	Optional,
+	Tuple,
+)
+
+# App
+from gui.camera import Camera
+from gui.colors import (
+	BLACK,
+	GREEN,
+)
+from hex_grid import HexGrid
+from loggers import get_logger
+
+
+__all__ = ['ViewportRenderer']
+
+LOG = get_logger(__name__)
+
+# Item options the renderer keeps track of per cell.
+STYLE_OPTIONS: Tuple[str, ...] = ('fill', 'outline')
+
+
+class ViewportRenderer:
+	"""Draw the cells in view of a camera with a recycled pool of canvas polygons."""
+
+	def __init__(
+		self,
+		canvas,
+		hex_grid: HexGrid,
+		camera: Camera,
+		fill: str = GREEN,
+		outline: str = BLACK,
+		width: int = 2
+	) -> None:
+		"""Prepare a renderer, nothing is drawn until :meth:`render`.
+
+		:param canvas: The canvas to draw on.
+		:type canvas: tkinter.Canvas
+		:param hex_grid: The grid to draw.
+		:type hex_grid: HexGrid
+		:param camera: The view onto the grid.
+		:type camera: Camera
+		:param fill: The default fill color of a hex.
+		:type fill: str
+		:param outline: The default outline color of a hex.
+		:type outline: str
+		:param width: The outline width.
+		:type width: int
+		:rtype: None
+		"""
+		self._canvas = canvas
+		self._hex_grid: HexGrid = hex_grid
+		self._camera: Camera = camera
+		self._defaults: Dict[str, str] = {'fill': fill, 'outline': outline}
+		self._width: int = width
+		# Styles that differ from the defaults, by cell index.
+		self._styles: Dict[int, Dict[str, str]] = {}
+		# Canvas item of every cell on screen, by cell index.
+		self._active: Dict[int, int] = {}
+		# Hidden canvas items ready for reuse.
+		self._pool: List[int] = []
+		self._pending: Dict[int, Dict[str, str]] = {}
+		self._drawn_state: Optional[Tuple[float, float, float]] = None
+		self._render_id: Optional[str] = None
+		return
+
+	def __repr__(self) -> str:
+		return f'<{self.__class__.__name__}(active: {len(self._active)}, pooled: {len(self._pool)})>'
+
+	@property
+	def camera(self) -> Camera:
+		return self._camera
+
+	@property
+	def active(self) -> Dict[int, int]:
+		"""Canvas item id of every cell currently drawn, by cell index."""
+		return self._active
+
+	@property
+	def pool_size(self) -> int:
+		return len(self._pool)
+
+	def style(self, index: int) -> Dict[str, str]:
+		"""Get the style of a cell, whether or not it is on screen."""
+		return {**self._defaults, **self._styles.get(index, {})}
+
+	def set_style(self, index: int, **style: str) -> None:
+		"""Change the style of a cell. On screen cells are updated on the next idle callback.
+
+		:param index: The cell index.
+		:type index: int
+		:param style: New values for ``fill`` and/or ``outline``.
+		:rtype: None
+		"""
+		for option in style:
+			if option not in STYLE_OPTIONS:
+				raise TypeError(f'<option: {option}> is not allowed, Must be of {STYLE_OPTIONS}.')
+		current = self.style(index)
+		changes = {option: value for option, value in style.items() if current[option] != value}
+		if not changes:
+			return
+		self._styles.setdefault(index, {}).update(changes)
+		if index in self._active:
+			self._pending.setdefault(index, {}).update(changes)
+			self.request_render()
+		return
+
+	def set_fill(self, index: int, fill: str) -> None:
+		self.set_style(index, fill=fill)
+		return
+
+	def set_outline(self, index: int, outline: str) -> None:
+		self.set_style(index, outline=outline)
+		return
+
+	def request_render(self) -> None:
+		"""Render on the next idle callback, coalescing any number of requests into one."""
+		if self._render_id is None:
+			self._render_id = self._canvas.after_idle(self.render)
+		return
+
+	def render(self) -> int:
+		"""Bring the canvas in line with the camera and the queued style changes now.
+
+		:return: The amount of cells on screen.
+		:rtype: int
+		"""
+		if self._render_id is not None:
+			self._canvas.after_cancel(self._render_id)
+			self._render_id = None
+
+		canvas, active, pool = self._canvas, self._active, self._pool
+		visible = self._hex_grid.indices_in_rect(self._camera.viewport).tolist()
+		visible_set = set(visible)
+
+		for index in [index for index in active if index not in visible_set]:
+			item = active.pop(index)
+			canvas.itemconfigure(item, state='hidden')
+			pool.append(item)
+
+		# Cells that stayed on screen only need new coordinates when the camera moved.
+		moved = self._camera.state != self._drawn_state
+		placed = visible if moved else [index for index in visible if index not in active]
+		if placed:
+			corners = self._camera.points_to_screen(self._hex_grid.corners(placed))
+			for index, coords in zip(placed, corners.reshape(len(placed), -1).tolist()):
+				item = active.get(index)
+				if item is not None:
+					canvas.coords(item, *coords)
+				elif pool:
+					item = active[index] = pool.pop()
+					canvas.coords(item, *coords)
+					canvas.itemconfigure(item, state='normal', **self.style(index))
+				else:
+					active[index] = canvas.create_polygon(*coords, width=self._width, **self.style(index))
+
+		pending, self._pending = self._pending, {}
+		for index, style in pending.items():
+			item = active.get(index)
+			if item is not None:
+				canvas.itemconfigure(item, **style)
+
+		self._drawn_state = self._camera.state
+		return len(active)
+
+	def clear(self) -> None:
+		"""Delete every item this renderer created, on screen or pooled."""
+		if self._render_id is not None:
+			self._canvas.after_cancel(self._render_id)
+			self._render_id = None
+		items = [*self._active.values(), *self._pool]
+		if items:
+			self._canvas.delete(*items)
+		self._active = {}
+		self._pool = []
+		self._pending = {}
+		self._drawn_state = None
+		return
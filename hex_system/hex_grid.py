@@ -2,6 +2,7 @@
 # vim: ft=python
 """hex_grid.py."""
 # Standard Library
+import math
 from typing import (
 	Dict,
 	List,
@@ -9,6 +10,9 @@
 	Tuple,
 )
 
+# Third Party Library
+import numpy as np
+
 # First Party Library
 from geometry import (
 	Hexagon,
@@ -17,8 +21,29 @@
 )
 
 # App
+from algorithms.pathfinding import astar
+from algorithms.regions import (
+	flood_fill,
+	label_regions,
+)
+from config import PathType
+from grid.layout import (
+	GridLayout,
+	get_layout,
+)
 from loggers import get_logger
-from utils import round_to_int
+from storage.adjacency import Adjacency
+from storage.columnar import (
+	ColumnarGrid,
+	HexagonMapping,
+	HexagonView,
+)
+from storage.mapped import (
+	open_grid,
+	save_grid,
+)
+from storage.parallel import build_columnar_parallel
+from storage.spatial import SpatialIndex
 
 
 LOG = get_logger(__name__)
@@ -27,20 +52,23 @@
 class HexGrid:
 	"""Manage the container for all Hexagons."""
 
-	def __new__(cls, cols: int, rows: int, rect: Rectangle):
+	def __new__(cls, cols: int, rows: int, rect: Rectangle, storage: Optional[ColumnarGrid] = None):
 		if cols == 0 or rows == 0:
 			raise ValueError(f"Attributes 'cols' and 'rows' must be greater than 0.")
 		return super().__new__(cls)
 
-	def __init__(self, cols: int, rows: int, rect: Rectangle) -> None:
+	def __init__(self, cols: int, rows: int, rect: Rectangle, storage: Optional[ColumnarGrid] = None) -> None:
 		"""Create rectangular hexagon grid based on desired amount of rows and columns.
 
 		This will automatically compute pixel friendly coordinates based on the settings of :class:`geometry.Hexagon`.
+		Cells are kept in a :class:`storage.ColumnarGrid`, :class:`geometry.Hexagon` objects are only created on access.
 
 		:param cols: The desired amount of columns.
 		:type cols: int
 		:param rows: The desired amount of rows.
 		:type rows: int
+		:param storage: Existing cell storage to use instead of building one, e.g. from :func:`open_hex_grid`.
+		:type storage: Optional[ColumnarGrid]
 		:return: A hex grid configured in a rectangle shape.
 		:rtype: None
 		"""
@@ -49,8 +77,10 @@ def __init__(self, cols: int, rows: int, rect: Rectangle) -> None:
 		self._rows: int = rows
 		self._rect: Rectangle = rect
 		self._hexagon: Hexagon = Hexagon(Point(0, 0))
-		self._hexes: List[Hexagons] = []
-		self._grid = self._create_grid()
+		self._storage: ColumnarGrid = self._create_grid() if storage is None else storage
+		self._hexes: HexagonView = HexagonView(self._storage)
+		self._grid: HexagonMapping = HexagonMapping(self._storage)
+		self._spatial_index: Optional[SpatialIndex] = None
 		self._log.debug(f'HexGrid: {self} created.')
 		return
 
@@ -62,47 +92,9 @@ def __str__(self) -> str:
 		"""Output name in a human-friendly form."""
 		return f'{self.__class__.__name__}({self.size}, {self.rect})'
 
-	def _create_grid(self) -> Dict[Point, Hexagon]:
-		"""Create HexGrid based on pixel coordinates."""
-
-		grid: Dict[Point, Hexagon] = {}
-		hexagons: List[Hexagon] = []
-
-		x_start = round_to_int(self.hexagon.width / 2)
-		# self._log.debug(f"<x_start: {x_start}>.")
-
-		x_end = round_to_int(self.rect.width)
-		# self._log.debug(f"<x_end: {x_end}>.")
-
-		x_step = round_to_int(((self.hexagon.width + self.hexagon.width) / 2) + 1)
-		# self._log.debug(f"<x_step: {x_step}>.")
-
-		y_start = round_to_int(self.hexagon.height / 2)
-		# self._log.debug(f"<y_start: {y_start}>.")
-
-		y_end = round_to_int(self.rect.height)
-		# self._log.debug(f"<y_end: {y_end}>.")
-
-		y_step = round_to_int(self.hexagon.height * (3 / 4))
-		# self._log.debug(f"<y_step: {y_step}>.")
-
-		shift: bool = True
-
-		for y in range(y_start, y_end, y_step):
-			# Brilliant way to nudge odd columns to the right.
-			# Toggles shift on for every other column (y position).
-			shift: boot = not shift
-
-			x_shift_val: int = round_to_int(self.hexagon.width / 2) if shift else 0
-
-			for x in range(x_start, x_end, x_step):
-				x += x_shift_val
-				point: Point = Point(x, y)
-				hexagon = Hexagon(point)
-				# self._log.debug(hexagon)
-				grid[point] = hexagon
-				self._hexes.append(hexagon)
-		return grid
+	def _create_grid(self) -> ColumnarGrid:
+		"""Create the columnar cell storage based on pixel coordinates."""
+		return ColumnarGrid(self.cols, self.rows, get_layout(self.hexagon))
 
 	@property
 	def origin(self) -> Point:
@@ -117,7 +109,7 @@ def hexagon(self) -> Hexagon:
 		return self._hexagon
 
 	@property
-	def hexes(self) -> List[Hexagon]:
+	def hexes(self) -> HexagonView:
 		return self._hexes
 
 	@property
@@ -142,27 +134,68 @@ def rect(self) -> Rectangle:
 		return self._rect
 
 	@property
-	def grid(self) -> Dict[Point, Hexagon]:
+	def grid(self) -> HexagonMapping:
 		return self._grid
 
-	def populate_neighbours(self, tile) -> None:
-		x, y = tile.grid_position
+	@property
+	def storage(self) -> ColumnarGrid:
+		return self._storage
 
-		if x > 0:
-			tile.neighbours.append(self.hexes[(x - 1, y)])
+	@property
+	def spatial_index(self) -> SpatialIndex:
+		"""Bucket grid over the hex centers, built on first use. Every hex is boxed by its width and height."""
+		if self._spatial_index is None:
+			self._spatial_index = SpatialIndex(
+				self.storage.x,
+				self.storage.y,
+				extent=(self.hexagon.width / 2, self.hexagon.height / 2),
+				bucket_size=self.hexagon.height * 2,
+			)
+		return self._spatial_index
+
+	def index_at_pixel(self, x: float, y: float) -> Optional[int]:
+		"""Get the index of the cell under a pixel, e.g. for mouse picking.
+
+		:param x: The pixel x coordinate.
+		:type x: float
+		:param y: The pixel y coordinate.
+		:type y: float
+		:return: The cell index, or None if the pixel lies outside of the grid.
+		:rtype: Optional[int]
+		"""
+		return self.storage.index_at_pixel(x, y)
+
+	def indices_at_pixels(self, xs, ys):
+		"""Get the indices of the cells under many pixels at once, -1 for pixels outside of the grid."""
+		return self.storage.indices_at_pixels(xs, ys)
+
+	def indices_in_rect(self, rect: Rectangle):
+		"""Get the indices of the cells whose bounding box overlaps a pixel rectangle, e.g. a viewport."""
+		return self.storage.indices_in_box(
+			rect.left, rect.top, rect.right, rect.bottom,
+			margin_x=self.hexagon.width / 2,
+			margin_y=self.hexagon.height / 2,
+		)
+
+	def corners(self, indices=None):
+		"""Get the corner vertices of every cell, or only of ``indices``, as an (N, 6, 2) array."""
+		if indices is None:
+			return self.hexagon.corners_batch(self.storage.x, self.storage.y)
+		return self.hexagon.corners_batch(self.storage.x[indices], self.storage.y[indices])
 
-		if x < self.cols - 1:
-			tile.neighbours.append(self.hexes[(x + 1, y)])
+	@property
+	def adjacency(self) -> Adjacency:
+		"""The precomputed neighbour table of every cell."""
+		return self.storage.adjacency
 
-		if y > 0:
-			tile.neighbours.append(self.hexes[(x, y - 1)])
-			if x < self.cols - 1:
-				tile.neighbours.append(self.hexes[(x + 1, y - 1)])
+	def neighbours(self, index: int) -> List[int]:
+		"""Get the indices of the on-grid neighbours of a cell."""
+		return self.adjacency.neighbours(index)
 
-		if y < self.rows - 1:
-			tile.neighbours.append(self.hexes[(x, y + 1)])
-			if x > 0:
-				tile.neighbours.append(self.hexes[(x - 1, y + 1)])
+	def populate_neighbours(self, tile) -> None:
+		col, row = tile.grid_position
+		index = self.storage.index(col, row)
+		tile.neighbours.extend(self.hexes[neighbour] for neighbour in self.neighbours(index))
 		return
 
 	def find_path(self, from_tile, to_tiles, filter, visited=None):
@@ -186,41 +219,92 @@ def find_path(self, from_tile, to_tiles, filter, visited=None):
 
 		return None
 
-	def top_row(self):
-		return [self.grid[Point(x, 0)] for x in range(self.cols)]
-
-	def bottom_row(self):
-		return [self.grid[Point(x, self.rows - 1)] for x in range(self.cols)]
+	def shortest_path(self, start: int, goal: int, costs=None) -> Optional[List[int]]:
+		"""Find the cheapest path between two cells with A*.
 
-	def left_column(self):
-		return [self.hexes[(0, y)] for y in range(self.height)]
+		See :func:`algorithms.pathfinding.astar`.
 
-	def right_column(self):
-		return [self.hexes[(self.width-1, y)] for y in range(self.height)]
-
-
-def _create_hex_grid_rect(cols: int, rows: int) -> Rectangle:
-	rect_origin = Point(0, 0)
-	hexagon = Hexagon(rect_origin)
-
-	rect_height_offset = 0 if rows & 1 else round(hexagon.height * (1 / 4))
-	# LOG.debug(f"<rect_height_offset: {rect_height_offset}>.")
-
-	rect_width: int = round_to_int(hexagon.width * cols)
-	# LOG.debug(f"<rect_width: {rect_width}>.")
-
-	rect_height: int = round_to_int((hexagon.height * rows) - rect_height_offset)
-	# LOG.debug(f"<rect_height: {rect_height}>.")
+		:param start: Index of the first cell.
+		:type start: int
+		:param goal: Index of the last cell.
+		:type goal: int
+		:param costs: Optional per-cell cost of entering a cell, ``math.inf`` for impassable.
+		:type costs: array_like
+		:return: The cell indices from start to goal inclusive, or None if the goal is unreachable.
+		:rtype: Optional[List[int]]
+		"""
+		return astar(self.storage, start, goal, costs)
 
-	rect_end: Point = Point(rect_width, rect_height)
-	# LOG.debug(f"<rect_end: {rect_end}>.")
+	def flood_fill(self, start: int, values=None, mask=None) -> np.ndarray:
+		"""Find every cell connected to a start cell, see :func:`algorithms.regions.flood_fill`."""
+		return flood_fill(self.storage, start, values, mask)
 
-	rect = Rectangle(rect_origin, rect_end)
-	# LOG.debug(f"<rect: {rect}>.")
-	return rect
+	def label_regions(self, values=None, mask=None) -> Tuple[np.ndarray, int]:
+		"""Label the connected regions of the grid, see :func:`algorithms.regions.label_regions`."""
+		return label_regions(self.storage, values, mask)
 
+	def save(self, path: PathType) -> None:
+		"""Write the grid to a memory-mappable file, see :mod:`storage.mapped`."""
+		save_grid(path, self.storage, self.hexagon.side)
+		return
 
-def get_hex_grid(cols: int, rows: int) -> HexGrid:
-	rect: Rectangle = _create_hex_grid_rect(cols, rows)
-	return HexGrid(cols, rows, rect)
+	def top_row(self) -> List[Hexagon]:
+		return [self.hexes[self.storage.index(col, 0)] for col in range(self.cols)]
+
+	def bottom_row(self) -> List[Hexagon]:
+		return [self.hexes[self.storage.index(col, self.rows - 1)] for col in range(self.cols)]
+
+	def left_column(self) -> List[Hexagon]:
+		return [self.hexes[self.storage.index(0, row)] for row in range(self.rows)]
+
+	def right_column(self) -> List[Hexagon]:
+		return [self.hexes[self.storage.index(self.cols - 1, row)] for row in range(self.rows)]
+
+
+def _create_hex_grid_rect(cols: int, rows: int, layout: GridLayout, hexagon: Hexagon) -> Rectangle:
+	"""Get the pixel rectangle from the origin to the far edges of the last column and row of cells."""
+	# Odd rows are nudged right, the widest row is an odd one as soon as there are two.
+	right = layout.x_start + (cols - 1) * layout.x_step + (layout.x_shift if rows > 1 else 0) + hexagon.width / 2
+	bottom = layout.y_start + (rows - 1) * layout.y_step + hexagon.height / 2
+	return Rectangle(Point(0, 0), Point(math.ceil(right), math.ceil(bottom)))
+
+
+def get_hex_grid(cols: int, rows: int, workers: Optional[int] = None) -> HexGrid:
+	"""Create a rectangular grid.
+
+	:param cols: The amount of columns.
+	:type cols: int
+	:param rows: The amount of rows.
+	:type rows: int
+	:param workers: Build the cell storage on this many processes, see :mod:`storage.parallel`.
+		None builds it in this process, which is fastest for small grids.
+	:type workers: Optional[int]
+	:rtype: HexGrid
+	"""
+	hexagon = Hexagon(Point(0, 0))
+	layout = get_layout(hexagon)
+	rect: Rectangle = _create_hex_grid_rect(cols, rows, layout, hexagon)
+	storage = None
+	if workers is not None:
+		storage = build_columnar_parallel(cols, rows, layout, workers)
+	return HexGrid(cols, rows, rect, storage=storage)
+
+
+def open_hex_grid(path: PathType, mode: str = 'r') -> HexGrid:
+	"""Open a grid written by :meth:`HexGrid.save` without rebuilding it.
+
+	The cell columns are memory-mapped, so processes opening the same file share its pages.
+
+	:param path: The grid file.
+	:type path: PathType
+	:param mode: ``'r'`` read-only, ``'r+'`` writes go to the file, ``'c'`` writes stay private.
+	:type mode: str
+	:rtype: HexGrid
+	"""
+	storage, header = open_grid(path, mode)
+	hexagon = Hexagon(Point(0, 0))
+	if header.side != hexagon.side:
+		raise ValueError(f'<side: {header.side}> of {path} does not match the hexagon side: {hexagon.side}.')
+	rect = _create_hex_grid_rect(header.cols, header.rows, storage.layout, hexagon)
+	return HexGrid(header.cols, header.rows, rect, storage=storage)
 
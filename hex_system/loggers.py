@@ -2,11 +2,20 @@
 # vim: ft=python
 """loggers.py."""
 # Standard Library
+import atexit
 import datetime
+import json
 import logging
+import queue
+import struct
+import threading
 import time
-from copy import deepcopy
-from logging.handlers import RotatingFileHandler
+from datetime import tzinfo
+from logging.handlers import (
+	QueueHandler,
+	QueueListener,
+	RotatingFileHandler,
+)
 from pathlib import Path
 from sys import (
 	stderr,
@@ -15,9 +24,12 @@
 from types import TracebackType
 from typing import (
 	Any,
+	IO,
 	Dict,
+	Iterator,
 	List,
 	MutableMapping,
+	NamedTuple,
 	Optional,
 	TextIO,
 	Tuple,
@@ -25,14 +37,14 @@
 	TypeVar,
 	Union,
 )
-from zoneinfo import ZoneInfo
 
 # App
 from config import (
-	DEFAULT_TZ,
+	DEFAULT_TIMEZONE,
 	ENCODING,
-	LOG_DIR,
 	PathType,
+	get_log_dir,
+	get_timezone,
 )
 
 
@@ -59,6 +71,44 @@
 _DEFAULT_FILE_LOG_LEVEL: int = logging.INFO
 _DEFAULT_FILE_TIMESPEC: str = 'seconds' # seconds / milliseconds / microseconds
 
+# Structured log files, see `StructuredFormatter`.
+_STRUCTURED_LOG_MAGIC: bytes = b'HEXLOG\x00\x00'
+_STRUCTURED_LOG_VERSION: int = 1
+# File header: magic, version.
+_STRUCTURED_HEADER = struct.Struct('<8sH')
+# Every binary record: body size, then a body of timestamp in ns, level number, line number and the text fields.
+_STRUCTURED_FRAME = struct.Struct('<I')
+_STRUCTURED_FIXED = struct.Struct('<qHI')
+_STRUCTURED_TEXT_SIZE = struct.Struct('<I')
+
+# Configured loggers, by name.
+_LOGGERS: Dict[str, 'ExtraTypeAdapter'] = {}
+# Lowest level per logger name above that of its handlers, see `get_logger` and `set_log_level`.
+_LOG_LEVELS: Dict[str, int] = {}
+
+# Level of loggers in hot code: their debug messages cost nothing until enabled with `set_log_level`.
+HOT_PATH_LOG_LEVEL: int = logging.INFO
+
+# Async mode: what to do with records while the queue is full.
+DROP: str = 'drop'
+BLOCK: str = 'block'
+_ASYNC_POLICIES: Tuple[str, ...] = (DROP, BLOCK)
+_DEFAULT_QUEUE_SIZE: int = 10_000
+# Most records the writer thread takes off the queue at once.
+_DEFAULT_BATCH_SIZE: int = 256
+# Every logger shares one log file in async mode.
+_ASYNC_LOG_NAME: str = 'hex_system'
+
+# Guards replacing the handlers of a logger on its first record, see `DeferredHandler`.
+_CONFIGURE_LOCK = threading.Lock()
+
+# The running async pipeline, see `enable_async_logging`.
+_ASYNC_HANDLER: Optional['BoundedQueueHandler'] = None
+_ASYNC_LISTENER: Optional['BatchQueueListener'] = None
+
+# Reference of `relativeCreated`, kept here since the type of `logging._startTime` changes between Python versions.
+_START_NS: int = time.time_ns()
+
 # NOTE: Can add condition to check if Windows OS or ASCII and change
 CSI: str = '\x1b['
 RESET: str = f'{CSI}0m'
@@ -73,10 +123,15 @@ class NSLogRecord(logging.LogRecord):
 	Enhanced precision timestamps for log records.
 	"""
 	_NANOSECONDS_PER_SECOND: int = 1_000_000_000
+	_NANOSECONDS_PER_MILLISECOND: int = 1_000_000
 
 	def __init__(self, *args, **kwargs) -> None:
-		self.created_ns: int = time.time_ns() / self._NANOSECONDS_PER_SECOND  # Precision: nanoseconds.
 		super().__init__(*args, **kwargs)
+		self.created_ns: int = time.time_ns()  # Precision: nanoseconds, since the epoch.
+		# Derive the standard float timestamps from the same clock reading.
+		self.created = self.created_ns / self._NANOSECONDS_PER_SECOND
+		self.msecs = float(self.created_ns % self._NANOSECONDS_PER_SECOND // self._NANOSECONDS_PER_MILLISECOND)
+		self.relativeCreated = (self.created_ns - _START_NS) / self._NANOSECONDS_PER_MILLISECOND
 		return
 
 
@@ -95,7 +150,11 @@ def __init__(self, logger: logging.Logger, extra=None) -> None:
 
 	def process(self, msg: str, kwargs: MutableMapping[str, Any]):
 
-		new_kwargs: Dict[str, Any] = {'extra': deepcopy(self.extra) if self.extra is not None else {}}
+		# Records copy the extra into their own attributes, so the shared dict is safe to hand over as is.
+		if not kwargs:
+			return msg, {'extra': self.extra if self.extra is not None else {}}
+
+		new_kwargs: Dict[str, Any] = {'extra': dict(self.extra) if self.extra is not None else {}}
 
 		for key, value in kwargs.items():
 
@@ -112,6 +171,15 @@ def process(self, msg: str, kwargs: MutableMapping[str, Any]):
 
 		return msg, new_kwargs
 
+	@property
+	def debug_enabled(self) -> bool:
+		"""Whether debug messages are emitted, guard hot code with it to skip building the message.
+
+		Levels are cached by the logger, so the check is a single dictionary lookup. Loggers created
+		with :data:`HOT_PATH_LOG_LEVEL` say False until :func:`set_log_level` enables debug.
+		"""
+		return self.logger.isEnabledFor(logging.DEBUG)
+
 
 class ConsoleFormatter(logging.Formatter):
 	"""Logging Formatter to add colors and count warning / errors."""
@@ -196,24 +264,86 @@ class FileFormatter(logging.Formatter):
 
 	converter = datetime.datetime.fromtimestamp
 
-	def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None, tz: Optional[ZoneInfo] = None, timespec: Optional[str] = None) -> None:
+	def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None, tz: Optional[tzinfo] = None, timespec: Optional[str] = None) -> None:
 		if fmt is None:
 			fmt: str = _DEFAULT_FILE_FMT
-		if tz is None:
-			self._tz = DEFAULT_TZ
-		if timespec is None:
-			self._timespec: str = 'seconds'
+		# Without a timezone, the default one is loaded when the first time is formatted.
+		self._tz: Optional[tzinfo] = tz
+		self._timespec: str = _DEFAULT_FILE_TIMESPEC if timespec is None else timespec
 		super(FileFormatter, self).__init__(fmt=fmt, datefmt=datefmt)
 		return
 
 	def formatTime(self, record: NSLogRecord, datefmt: Optional[str] = None) -> str:
 		if datefmt is not None:  # Do not handle custom formats here ...
 			return super().formatTime(record, datefmt)  # ... leave to original implementation
-		converted_time = self.converter(record.created_ns, tz=self._tz)
+		if self._tz is None:
+			self._tz = get_timezone(DEFAULT_TIMEZONE)
+		converted_time = self.converter(record.created, tz=self._tz)
 		formatted_time: str = converted_time.isoformat(sep='T', timespec=self._timespec)
 		return formatted_time
 
 
+class LogEntry(NamedTuple):
+	"""One record of a structured log file."""
+
+	# Nanoseconds since the epoch.
+	ts: int
+	level: int
+	line: int
+	name: str
+	type: str
+	module: str
+	func: str
+	message: str
+	# The formatted exception, empty without one.
+	exc: str
+
+
+# Text fields of a LogEntry, in binary record order.
+_STRUCTURED_TEXT_FIELDS: Tuple[str, ...] = LogEntry._fields[3:]
+
+
+class StructuredFormatter(logging.Formatter):
+	"""Format records as compact JSON lines, or encode them as length-prefixed binary records.
+
+	Both carry the fields of :class:`LogEntry`, with the timestamp as integer nanoseconds.
+	Read them back with :func:`read_jsonl_log` and :func:`read_binary_log`.
+	"""
+
+	def entry(self, record: logging.LogRecord) -> LogEntry:
+		"""Get the structured fields of a record."""
+		created_ns = getattr(record, 'created_ns', None)
+		if created_ns is None:
+			created_ns = int(record.created * 1_000_000_000)
+		if record.exc_info and not record.exc_text:
+			record.exc_text = self.formatException(record.exc_info)
+		return LogEntry(
+			created_ns,
+			record.levelno,
+			record.lineno,
+			record.name,
+			getattr(record, 'type', _DEFAULT_RECORD_EXTRA['type']),
+			record.module,
+			record.funcName or '',
+			record.getMessage(),
+			record.exc_text or '',
+		)
+
+	def format(self, record: logging.LogRecord) -> str:
+		return json.dumps(self.entry(record)._asdict(), ensure_ascii=False, separators=(',', ':'))
+
+	def encode(self, record: logging.LogRecord) -> bytes:
+		"""Encode a record as one binary frame: its body size, then the body."""
+		entry = self.entry(record)
+		body = [_STRUCTURED_FIXED.pack(entry.ts, entry.level, entry.line)]
+		for text in entry[3:]:
+			encoded = text.encode(ENCODING)
+			body.append(_STRUCTURED_TEXT_SIZE.pack(len(encoded)))
+			body.append(encoded)
+		body = b''.join(body)
+		return _STRUCTURED_FRAME.pack(len(body)) + body
+
+
 class ConsoleHandler(logging.StreamHandler):
 	"""Console should go to sys.stdout."""
 
@@ -248,19 +378,264 @@ def flush(self) -> None:
 		return
 
 
-def get_logger(log_name: str) -> ExtraTypeAdapter:
+class BinaryFileHandler(logging.FileHandler):
+	"""Append records to a file as length-prefixed binary frames, see :class:`StructuredFormatter`."""
+
+	def __init__(self, filename: PathType, delay: bool = False) -> None:
+		super().__init__(filename, mode='ab', encoding=None, delay=delay)
+		self.setFormatter(StructuredFormatter())
+		return
+
+	def _open(self):
+		stream = super()._open()
+		# Appending to an existing file keeps its header.
+		if stream.tell() == 0:
+			stream.write(_STRUCTURED_HEADER.pack(_STRUCTURED_LOG_MAGIC, _STRUCTURED_LOG_VERSION))
+		return stream
+
+	def emit(self, record: logging.LogRecord) -> None:
+		try:
+			if self.stream is None:
+				self.stream = self._open()
+			self.stream.write(self.formatter.encode(record))
+			self.flush()
+		except RecursionError:
+			raise
+		except Exception:
+			self.handleError(record)
+		return
+
+
+class BoundedQueueHandler(QueueHandler):
+	"""Hand records to a bounded queue instead of writing them from the calling thread.
+
+	With the ``drop`` policy a full queue drops the record, with ``block`` the caller waits for
+	room, up to ``timeout`` seconds if given, then drops it. Dropped records are counted.
+	"""
+
+	def __init__(self, log_queue: queue.Queue, policy: str = DROP, timeout: Optional[float] = None) -> None:
+		if policy not in _ASYNC_POLICIES:
+			raise ValueError(f'<policy: {policy}> is not allowed, Must be of {_ASYNC_POLICIES}.')
+		super().__init__(log_queue)
+		self.policy: str = policy
+		self.timeout: Optional[float] = timeout
+		self.dropped: int = 0
+		return
+
+	def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+		# Merge the arguments now, they may change before the writer thread gets to them.
+		# Other handlers get the same message from it, so it is updated in place instead of copied.
+		record.msg = record.getMessage()
+		record.args = None
+		return record
+
+	def enqueue(self, record: logging.LogRecord) -> None:
+		try:
+			if self.policy == BLOCK:
+				self.queue.put(record, timeout=self.timeout)
+			else:
+				self.queue.put_nowait(record)
+		except queue.Full:
+			self.dropped += 1
+		return
+
+
+class BatchQueueListener(QueueListener):
+	"""The single writer thread of the async pipeline, it drains the queue in batches.
+
+	A batch is every record waiting in the queue, up to ``batch_size``, so a burst of records
+	wakes the thread once instead of once per record.
+	"""
+
+	def __init__(
+		self,
+		log_queue: queue.Queue,
+		*handlers: logging.Handler,
+		batch_size: int = _DEFAULT_BATCH_SIZE
+	) -> None:
+		super().__init__(log_queue, *handlers, respect_handler_level=True)
+		self.batch_size: int = batch_size
+		return
+
+	def enqueue_sentinel(self) -> None:
+		# Wait for room, a full queue must still be written before the thread stops.
+		self.queue.put(self._sentinel)
+		return
+
+	def _monitor(self) -> None:
+		log_queue = self.queue
+		while True:
+			batch = [log_queue.get()]
+			try:
+				while len(batch) < self.batch_size:
+					batch.append(log_queue.get_nowait())
+			except queue.Empty:
+				pass
+
+			for record in batch:
+				if record is not self._sentinel:
+					self.handle(record)
+				log_queue.task_done()
+			if self._sentinel in batch:
+				return
+
+
+def enable_async_logging(
+	max_size: int = _DEFAULT_QUEUE_SIZE,
+	policy: str = DROP,
+	timeout: Optional[float] = None,
+	batch_size: int = _DEFAULT_BATCH_SIZE
+) -> BoundedQueueHandler:
+	"""Switch every logger, current and future, to the async pipeline.
+
+	Loggers only put records on a bounded queue, one writer thread formats them and writes them
+	to the console and to a single shared log file. Records still waiting are written when
+	:func:`disable_async_logging` is called, at the latest at exit.
+
+	:param max_size: The amount of records the queue holds.
+	:type max_size: int
+	:param policy: ``'drop'`` records while the queue is full, or ``'block'`` the caller until there is room.
+	:type policy: str
+	:param timeout: With ``'block'``, drop the record after waiting this many seconds.
+	:type timeout: Optional[float]
+	:param batch_size: Most records the writer thread takes off the queue at once.
+	:type batch_size: int
+	:return: The handler every logger shares, its ``dropped`` attribute counts dropped records.
+	:rtype: BoundedQueueHandler
+	"""
+	global _ASYNC_HANDLER, _ASYNC_LISTENER
+	if _ASYNC_HANDLER is not None:
+		disable_async_logging()
+
+	log_queue = queue.Queue(maxsize=max_size)
+	handler = BoundedQueueHandler(log_queue, policy, timeout)
+	writers = (get_console_handler(), get_rotating_file_handler(_ASYNC_LOG_NAME))
+	handler.setLevel(min(writer.level for writer in writers))
+	listener = BatchQueueListener(log_queue, *writers, batch_size=batch_size)
+
+	for adapter in _LOGGERS.values():
+		_set_handlers(adapter.logger, [handler])
+	listener.start()
+	_ASYNC_HANDLER, _ASYNC_LISTENER = handler, listener
+	return handler
+
+
+def disable_async_logging() -> None:
+	"""Write every queued record, stop the writer thread and switch loggers back to writing directly."""
+	global _ASYNC_HANDLER, _ASYNC_LISTENER
+	if _ASYNC_LISTENER is None:
+		return
+	handler, listener = _ASYNC_HANDLER, _ASYNC_LISTENER
+	_ASYNC_HANDLER = _ASYNC_LISTENER = None
+
+	for name, adapter in _LOGGERS.items():
+		_set_handlers(adapter.logger, _get_handlers(name))
+	listener.stop()
+	for writer in listener.handlers:
+		writer.close()
+	handler.close()
+	return
+
+
+class DeferredHandler(logging.Handler):
+	"""Stands in for the console and file handlers of a logger until its first record.
+
+	Modules create their loggers at import, this keeps that free of open files and directories.
+	"""
+
+	def __init__(self, log_name: str) -> None:
+		super().__init__(level=_DEFAULT_LOG_LEVEL)
+		self.log_name: str = log_name
+		self._handlers: Optional[List[logging.Handler]] = None
+		return
+
+	def handle(self, record: logging.LogRecord) -> bool:
+		with _CONFIGURE_LOCK:
+			# Threads that still hold the old handler list get here too, they share the same handlers.
+			if self._handlers is None:
+				self._handlers = [get_console_handler(), get_rotating_file_handler(self.log_name)]
+				logger = logging.getLogger(self.log_name)
+				# Handlers added by others stay, the caller still passes this record on to them.
+				_set_handlers(logger, [handler for handler in logger.handlers if handler is not self] + self._handlers)
+		for handler in self._handlers:
+			if record.levelno >= handler.level:
+				handler.handle(record)
+		return True
+
+	def emit(self, record: logging.LogRecord) -> None:
+		self.handle(record)
+		return
+
+
+def _get_handlers(log_name: str) -> List[logging.Handler]:
+	if _ASYNC_HANDLER is not None:
+		return [_ASYNC_HANDLER]
+	return [DeferredHandler(log_name)]
+
+
+def _set_handlers(logger: logging.Logger, handlers: List[logging.Handler]) -> None:
+	old_handlers = logger.handlers
+	# Swap in a new list, a logger may be iterating the old one right now.
+	logger.handlers = list(handlers)
+	for handler in old_handlers:
+		if not isinstance(handler, QueueHandler) and handler not in handlers:
+			handler.close()
+	logger.setLevel(_logger_level(logger.name, handlers))
+	return
+
+
+def _logger_level(log_name: str, handlers: List[logging.Handler]) -> int:
+	"""Get the lowest level any handler emits, raised to the level set for the logger."""
+	# Level 0 (NOTSET) would defer to the root logger instead of letting everything through.
+	level = max(min((handler.level for handler in handlers), default=1), 1)
+	return max(level, _LOG_LEVELS.get(log_name, 0))
+
+
+atexit.register(disable_async_logging)
+
+
+def get_logger(log_name: str, level: Optional[int] = None) -> ExtraTypeAdapter:
 	"""Configure log settings for the app.
 
+	Loggers are configured once per name, later calls return the same adapter.
+	The logger level is the lowest of its handler levels, so messages no handler would emit
+	are dropped before a record is built, the extra is processed or anything is formatted.
+
+	:param level: Drop messages below this level even if a handler would emit them,
+		e.g. :data:`HOT_PATH_LOG_LEVEL` for loggers in hot code. Only the first call for a name sets it.
+	:type level: Optional[int]
 	:rtype: ExtraTypeAdapter
 	"""
+	adapter = _LOGGERS.get(log_name)
+	if adapter is not None:
+		return adapter
+
+	if level is not None:
+		_LOG_LEVELS.setdefault(log_name, level)
+
 	logging.setLogRecordFactory(NSLogRecord)
 
 	logger = logging.getLogger(log_name)
+	if not logger.handlers:
+		_set_handlers(logger, _get_handlers(log_name))
+
+	adapter = _LOGGERS[log_name] = ExtraTypeAdapter(logger)
+	return adapter
+
 
-	logger.setLevel(logging.DEBUG)
-	logger.addHandler(get_console_handler())
-	logger.addHandler(get_rotating_file_handler(log_name))
-	return ExtraTypeAdapter(logger)
+def set_log_level(log_name: str, level: int) -> None:
+	"""Change the lowest level a logger emits, e.g. DEBUG to see the debug messages of hot code.
+
+	:param log_name: The name given to :func:`get_logger`.
+	:type log_name: str
+	:param level: The logging level.
+	:type level: int
+	:rtype: None
+	"""
+	_LOG_LEVELS[log_name] = level
+	logger = logging.getLogger(log_name)
+	logger.setLevel(_logger_level(log_name, logger.handlers))
+	return
 
 
 def get_console_handler() -> ConsoleHandler:
@@ -277,7 +652,7 @@ def get_console_handler() -> ConsoleHandler:
 def get_rotating_file_handler(log_name: str) -> RotatingFileHandler:
 	"""Get a log file handler."""
 	extension: str = '.log'
-	log_file: PathType = LOG_DIR / (log_name + extension)
+	log_file: PathType = get_log_dir() / (log_name + extension)
 	backup_count: int = 100
 	max_bytes: int = 100 * 1024 * 1024  # 100 * 1MB * 1kB: 100MB
 
@@ -296,3 +671,64 @@ def get_rotating_file_handler(log_name: str) -> RotatingFileHandler:
 	file_handler.setLevel(_DEFAULT_LOG_LEVEL)
 	return file_handler
 
+
+def get_structured_file_handler(log_name: str, binary: bool = False) -> logging.Handler:
+	"""Get a handler writing structured records, JSON lines or binary, to the log directory.
+
+	:param log_name: The name of the log file, without extension.
+	:type log_name: str
+	:param binary: Write length-prefixed binary records instead of JSON lines.
+	:type binary: bool
+	:rtype: logging.Handler
+	"""
+	if binary:
+		handler = BinaryFileHandler(get_log_dir() / (log_name + '.bin'))
+	else:
+		handler = RotatingFileHandler(
+			get_log_dir() / (log_name + '.jsonl'),
+			mode='a',
+			maxBytes=100 * 1024 * 1024,
+			backupCount=100,
+			encoding=ENCODING,
+		)
+		handler.setFormatter(StructuredFormatter())
+	handler.setLevel(_DEFAULT_LOG_LEVEL)
+	return handler
+
+
+def read_jsonl_log(file: IO[str]) -> Iterator[LogEntry]:
+	"""Yield the records of a JSON lines log, one line in memory at a time."""
+	for line in file:
+		if line.strip():
+			yield LogEntry(**json.loads(line))
+
+
+def read_binary_log(file: IO[bytes]) -> Iterator[LogEntry]:
+	"""Yield the records of a binary log, one record in memory at a time."""
+	header = file.read(_STRUCTURED_HEADER.size)
+	if len(header) != _STRUCTURED_HEADER.size:
+		raise ValueError(f'Unexpected end of file, read {len(header)} of {_STRUCTURED_HEADER.size} bytes.')
+	magic, version = _STRUCTURED_HEADER.unpack(header)
+	if magic != _STRUCTURED_LOG_MAGIC:
+		raise ValueError(f'<magic: {magic!r}> is not a structured log file.')
+	if version != _STRUCTURED_LOG_VERSION:
+		raise ValueError(f'<version: {version}> is not supported, Must be {_STRUCTURED_LOG_VERSION}.')
+
+	text_count = len(_STRUCTURED_TEXT_FIELDS)
+	while True:
+		frame = file.read(_STRUCTURED_FRAME.size)
+		if not frame:
+			return
+		size = _STRUCTURED_FRAME.unpack(frame)[0] if len(frame) == _STRUCTURED_FRAME.size else -1
+		body = file.read(size) if size >= 0 else b''
+		if size < 0 or len(body) != size:
+			raise ValueError('Unexpected end of file, the last record is incomplete.')
+
+		fields = list(_STRUCTURED_FIXED.unpack_from(body))
+		position = _STRUCTURED_FIXED.size
+		for _ in range(text_count):
+			length = _STRUCTURED_TEXT_SIZE.unpack_from(body, position)[0]
+			position += _STRUCTURED_TEXT_SIZE.size
+			fields.append(body[position:position + length].decode(ENCODING))
+			position += length
+		yield LogEntry(*fields)
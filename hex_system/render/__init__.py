@@ -0,0 +1,18 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""render/__init__.py."""
+# App
+from render.image import (
+	encode_png,
+	encode_ppm,
+	write_png,
+	write_ppm,
+)
+from render.raster import (
+	image_size,
+	parse_color,
+	rasterize,
+)
+
+
+__all__ = ['encode_png', 'encode_ppm', 'image_size', 'parse_color', 'rasterize', 'write_png', 'write_ppm']
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""render/image.py.
+
+Encode RGBA buffers as PPM or PNG files with the standard library only.
+"""
+# Standard Library
+import struct
+import zlib
+
+# Third Party Library
+import numpy as np
+
+# App
+from config import PathType
+from loggers import get_logger
+
+
+__all__ = ['encode_png', 'encode_ppm', 'write_png', 'write_ppm']
+
+LOG = get_logger(__name__)
+
+PNG_SIGNATURE: bytes = b'\x89PNG\r\n\x1a\n'
+# PNG color type of 8 bit RGBA pixels.
+PNG_COLOR_RGBA: int = 6
+
+
+def _check_image(image: np.ndarray) -> np.ndarray:
+	image = np.asarray(image)
+	if image.ndim != 3 or image.shape[2] != 4 or image.dtype != np.uint8:
+		raise ValueError(f'<image: {image.dtype}{image.shape}> is not allowed, Must be a (height, width, 4) uint8 array.')
+	return image
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+	return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+def encode_png(image: np.ndarray, level: int = 6) -> bytes:
+	"""Encode an RGBA image as PNG.
+
+	:param image: A (height, width, 4) uint8 array.
+	:type image: np.ndarray
+	:param level: The zlib compression level, 0 to 9.
+	:type level: int
+	:rtype: bytes
+	"""
+	image = _check_image(image)
+	height, width, _ = image.shape
+	# Every scanline starts with its filter type, 0 is no filter.
+	scanlines = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+	scanlines[:, 1:] = image.reshape(height, width * 4)
+
+	header = struct.pack('>IIBBBBB', width, height, 8, PNG_COLOR_RGBA, 0, 0, 0)
+	return b''.join((
+		PNG_SIGNATURE,
+		_png_chunk(b'IHDR', header),
+		_png_chunk(b'IDAT', zlib.compress(scanlines.tobytes(), level)),
+		_png_chunk(b'IEND', b''),
+	))
+
+
+def encode_ppm(image: np.ndarray) -> bytes:
+	"""Encode an RGBA image as binary PPM, which has no alpha channel so it is dropped."""
+	image = _check_image(image)
+	height, width, _ = image.shape
+	return f'P6\n{width} {height}\n255\n'.encode('ascii') + np.ascontiguousarray(image[..., :3]).tobytes()
+
+
+def write_png(path: PathType, image: np.ndarray, level: int = 6) -> None:
+	with open(path, 'wb') as file:
+		file.write(encode_png(image, level))
+	LOG.debug(f'Wrote PNG: {path}')
+	return
+
+
+def write_ppm(path: PathType, image: np.ndarray) -> None:
+	with open(path, 'wb') as file:
+		file.write(encode_ppm(image))
+	LOG.debug(f'Wrote PPM: {path}')
+	return
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""storage/__init__.py."""
+# App
+from storage.adjacency import Adjacency
+from storage.cell_io import (
+	iter_cells,
+	load_cells,
+)
+from storage.chunked import ChunkedGrid
+from storage.columnar import (
+	ColumnarGrid,
+	HexagonView,
+)
+from storage.mapped import (
+	open_grid,
+	save_grid,
+)
+from storage.spatial import SpatialIndex
+
+
+__all__ = [
+	'Adjacency',
+	'ChunkedGrid',
+	'ColumnarGrid',
+	'HexagonView',
+	'SpatialIndex',
+	'iter_cells',
+	'load_cells',
+	'open_grid',
+	'save_grid',
+]
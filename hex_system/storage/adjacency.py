@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""storage/adjacency.py.
+
+Precomputed neighbour table for rectangular odd-r hex grids.
+
+Every cell owns six consecutive slots in one flat int32 array, in the direction order of
+:data:`ODD_R_DIRECTIONS`. A slot holding :data:`SENTINEL` points off-grid::
+
+	neighbour = slots[index * SLOTS + direction]
+"""
+# Standard Library
+from typing import (
+	List,
+	Tuple,
+)
+
+# Third Party Library
+import numpy as np
+
+# App
+from loggers import get_logger
+
+
+__all__ = ['Adjacency', 'ODD_R_DIRECTIONS', 'SENTINEL', 'SLOTS', 'build_adjacency']
+
+LOG = get_logger(__name__)
+
+SLOTS: int = 6
+SENTINEL: int = -1
+
+# (col, row) steps to the six neighbours of a cell in an odd-r layout, indexed by row parity.
+# Directions: East, North-East, North-West, West, South-West, South-East.
+ODD_R_DIRECTIONS: Tuple[Tuple[Tuple[int, int], ...], ...] = (
+	((+1, 0), (0, -1), (-1, -1), (-1, 0), (-1, +1), (0, +1)),
+	((+1, 0), (+1, -1), (0, -1), (-1, 0), (0, +1), (+1, +1)),
+)
+
+
+def build_adjacency(cols: int, rows: int) -> np.ndarray:
+	"""Build the neighbour table of a grid without a per-cell Python loop.
+
+	:param cols: The amount of columns.
+	:type cols: int
+	:param rows: The amount of rows.
+	:type rows: int
+	:return: An int32 array of shape (cols * rows, 6), :data:`SENTINEL` where a neighbour is off-grid.
+	:rtype: np.ndarray
+	"""
+	col = np.arange(cols, dtype=np.int32)
+	row = np.arange(rows, dtype=np.int32)
+	table = np.empty((rows, cols, SLOTS), dtype=np.int32)
+
+	# Every row of the same parity shares its steps, so fill each (parity, direction) plane at once.
+	for parity, steps in enumerate(ODD_R_DIRECTIONS):
+		parity_row = row[parity::2]
+		for direction, (col_step, row_step) in enumerate(steps):
+			neighbour_col = col + col_step
+			neighbour_row = parity_row + row_step
+			col_on_grid = (neighbour_col >= 0) & (neighbour_col < cols)
+			row_on_grid = (neighbour_row >= 0) & (neighbour_row < rows)
+			table[parity::2, :, direction] = np.where(
+				row_on_grid[:, np.newaxis] & col_on_grid,
+				neighbour_row[:, np.newaxis] * np.int32(cols) + neighbour_col,
+				SENTINEL
+			)
+	table = table.reshape(rows * cols, SLOTS)
+	return table
+
+
+class Adjacency:
+	"""Fixed six-slot neighbour table of a rectangular grid."""
+
+	def __new__(cls, cols: int, rows: int):
+		if cols <= 0 or rows <= 0:
+			raise ValueError(f"Attributes 'cols' and 'rows' must be greater than 0.")
+		return super().__new__(cls)
+
+	def __init__(self, cols: int, rows: int) -> None:
+		self._cols: int = cols
+		self._rows: int = rows
+		self._table: np.ndarray = build_adjacency(cols, rows)
+		# Flat view of the same buffer, indexing it yields plain ints for tight loops.
+		self._slots: memoryview = memoryview(self._table.reshape(-1))
+		return
+
+	def __repr__(self) -> str:
+		return f'<{self.__class__.__name__}(cols: {self._cols}, rows: {self._rows})>'
+
+	def __len__(self) -> int:
+		return self._cols * self._rows
+
+	@property
+	def table(self) -> np.ndarray:
+		"""The (N, 6) neighbour table."""
+		return self._table
+
+	@property
+	def slots(self) -> memoryview:
+		"""The flat neighbour table, six slots per cell."""
+		return self._slots
+
+	@property
+	def degree(self) -> np.ndarray:
+		"""The amount of on-grid neighbours of every cell."""
+		return np.count_nonzero(self._table != SENTINEL, axis=1)
+
+	def neighbours(self, index: int) -> List[int]:
+		"""Get the indices of the on-grid neighbours of a cell."""
+		start = index * SLOTS
+		return [neighbour for neighbour in self._slots[start:start + SLOTS] if neighbour != SENTINEL]
+
+	def to_csr(self) -> Tuple[np.ndarray, np.ndarray]:
+		"""Compact the table into CSR form, dropping off-grid slots.
+
+		:return: ``(indptr, indices)``, the neighbours of cell ``i`` are ``indices[indptr[i]:indptr[i + 1]]``.
+		:rtype: Tuple[np.ndarray, np.ndarray]
+		"""
+		on_grid = self._table != SENTINEL
+		indptr = np.zeros(len(self) + 1, dtype=np.int64)
+		np.cumsum(np.count_nonzero(on_grid, axis=1), out=indptr[1:])
+		return indptr, self._table[on_grid]
@@ -0,0 +1,388 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""storage/cell_io.py.
+
+Streaming import and export of per-cell attributes as CSV, JSON Lines or a compact binary form.
+
+A record is one cell: its coordinate, a :class:`grid.Offset` or a :class:`grid.Cube`, and a dict
+of attribute values. Readers and writers are generators over records, and grids are read and
+written a batch at a time, so memory use stays flat however large the file.
+
+CSV and JSON Lines name the coordinate fields ``col``/``row`` or ``q``/``r``/``s``. The binary
+form is a header followed by blocks of packed rows::
+
+	header   MAGIC, version, key kind, column count, then per column: name, dtype string
+	block    row count (uint32), then that many rows of the packed record dtype
+"""
+# Standard Library
+import csv
+import json
+import struct
+from itertools import islice
+from typing import (
+	IO,
+	Any,
+	Dict,
+	Iterable,
+	Iterator,
+	List,
+	Optional,
+	Sequence,
+	Tuple,
+	Union,
+)
+
+# Third Party Library
+import numpy as np
+
+# App
+from grid.conversions import (
+	cube_to_oddr,
+	oddr_to_cube,
+)
+from grid.cube import Cube
+from grid.offset import Offset
+from loggers import get_logger
+from storage.columnar import ColumnarGrid
+
+
+__all__ = [
+	'CUBE',
+	'OFFSET',
+	'iter_cells',
+	'load_cells',
+	'read_binary',
+	'read_csv',
+	'read_jsonl',
+	'write_binary',
+	'write_csv',
+	'write_jsonl',
+]
+
+LOG = get_logger(__name__)
+
+Coordinate = Union[Offset, Cube]
+Record = Tuple[Coordinate, Dict[str, Any]]
+
+OFFSET: str = 'offset'
+CUBE: str = 'cube'
+KEY_FIELDS: Dict[str, Tuple[str, ...]] = {OFFSET: ('col', 'row'), CUBE: ('q', 'r', 's')}
+
+# Rows read from or written to a grid at once.
+BATCH_SIZE: int = 65536
+
+MAGIC: bytes = b'HEXCELLS'
+VERSION: int = 1
+# magic, version, key kind (0 offset, 1 cube), column count
+HEADER_FORMAT: str = '<8sHBH'
+BLOCK_FORMAT: str = '<I'
+KEY_KINDS: Tuple[str, ...] = (OFFSET, CUBE)
+
+# Text spellings of booleans, CSV writes them as ``True`` and ``False``.
+BOOL_STRINGS: Dict[str, bool] = {'True': True, 'False': False, 'true': True, 'false': False, '1': True, '0': False}
+
+
+def _check_key(key: str) -> Tuple[str, ...]:
+	if key not in KEY_FIELDS:
+		raise ValueError(f'<key: {key}> is not allowed, Must be of {tuple(KEY_FIELDS)}.')
+	return KEY_FIELDS[key]
+
+
+def _make_coordinate(key: str, fields: Sequence[int]) -> Coordinate:
+	return Offset(*fields) if key == OFFSET else Cube(*fields)
+
+
+def _detect_key(fields: Iterable[str]) -> str:
+	fields = set(fields)
+	for key, key_fields in KEY_FIELDS.items():
+		if fields.issuperset(key_fields):
+			return key
+	raise ValueError(f'<fields: {sorted(fields)}> have no coordinate, Must contain col/row or q/r/s.')
+
+
+def _batches(iterable: Iterable, size: int) -> Iterator[List]:
+	iterator = iter(iterable)
+	while True:
+		batch = list(islice(iterator, size))
+		if not batch:
+			return
+		yield batch
+
+
+def _parse_bool(value: Any) -> Any:
+	if not isinstance(value, str):
+		return value
+	if value not in BOOL_STRINGS:
+		raise ValueError(f'<value: {value!r}> is not allowed, Must be of {tuple(BOOL_STRINGS)}.')
+	return BOOL_STRINGS[value]
+
+
+def _column_values(values: List[Any], dtype: np.dtype) -> np.ndarray:
+	"""Cast the values of a column, parsing bool strings instead of taking any non-empty one as True."""
+	if dtype.kind == 'b':
+		values = [_parse_bool(value) for value in values]
+	return np.array(values, dtype=dtype)
+
+
+def iter_cells(
+	storage: ColumnarGrid,
+	columns: Sequence[str],
+	key: str = OFFSET,
+	batch_size: int = BATCH_SIZE
+) -> Iterator[Record]:
+	"""Yield a record for every cell of a grid, in cell index order.
+
+	:param storage: The grid.
+	:type storage: ColumnarGrid
+	:param columns: The attribute columns to include.
+	:type columns: Sequence[str]
+	:param key: The coordinate of each record, :data:`OFFSET` or :data:`CUBE`.
+	:type key: str
+	:param batch_size: Cells converted at once.
+	:type batch_size: int
+	"""
+	_check_key(key)
+	arrays = [storage.column(name) for name in columns]
+	for start in range(0, len(storage), batch_size):
+		row, col = np.divmod(np.arange(start, min(start + batch_size, len(storage))), storage.cols)
+		fields = (col, row) if key == OFFSET else oddr_to_cube(col, row)
+		keys = zip(*(field.tolist() for field in fields))
+		values = [array[start:start + len(col)].tolist() for array in arrays]
+		for key_values, *row_values in zip(keys, *values):
+			yield _make_coordinate(key, key_values), dict(zip(columns, row_values))
+
+
+def load_cells(
+	storage: ColumnarGrid,
+	records: Iterable[Record],
+	dtypes: Optional[Dict[str, Any]] = None,
+	batch_size: int = BATCH_SIZE
+) -> int:
+	"""Write records into a grid's attribute columns, a batch at a time.
+
+	Values are cast to the column dtype, so the strings read from CSV load as numbers and bools.
+	Every record must have the columns of the first one.
+
+	:param storage: The grid.
+	:type storage: ColumnarGrid
+	:param records: Records keyed on Offset or Cube coordinates.
+	:type records: Iterable[Record]
+	:param dtypes: Dtypes of columns to add to the grid if they are missing.
+	:type dtypes: Optional[Dict[str, Any]]
+	:param batch_size: Records applied at once.
+	:type batch_size: int
+	:raises KeyError: If a record has a column the grid lacks and ``dtypes`` does not name.
+	:raises ValueError: If a record has other columns than the first one.
+	:raises IndexError: If a record lies outside of the grid.
+	:return: The amount of records loaded.
+	:rtype: int
+	"""
+	dtypes = dtypes or {}
+	names: List[str] = []
+	expected = None
+	loaded = 0
+	for batch in _batches(records, batch_size):
+		if expected is None:
+			names = list(batch[0][1])
+			expected = set(names)
+		for position, (coordinate, values) in enumerate(batch):
+			if values.keys() != expected:
+				raise ValueError(
+					f'<record: {loaded + position}> at {coordinate} has columns {sorted(values)}, Must be {sorted(names)}.'
+				)
+		coordinates = np.array([coordinate for coordinate, _ in batch], dtype=np.int64)
+		if coordinates.shape[1] == 3:
+			col, row = cube_to_oddr(coordinates[:, 0], coordinates[:, 1], coordinates[:, 2])
+		else:
+			col, row = coordinates[:, 0], coordinates[:, 1]
+		outside = (col < 0) | (col >= storage.cols) | (row < 0) | (row >= storage.rows)
+		if outside.any():
+			position = int(np.flatnonzero(outside)[0])
+			raise IndexError(f'<coordinate: {batch[position][0]}> is outside of {storage}.')
+		indices = row * storage.cols + col
+
+		for name in names:
+			if name not in storage.columns:
+				if name not in dtypes:
+					raise KeyError(f'<column: {name}> does not exist in {storage}.')
+				storage.add_column(name, dtype=dtypes[name])
+			column = storage.column(name)
+			column[indices] = _column_values([values[name] for _, values in batch], column.dtype)
+		loaded += len(batch)
+	return loaded
+
+
+def write_csv(file: IO[str], records: Iterable[Record], columns: Sequence[str], key: str = OFFSET) -> int:
+	"""Write records as CSV with a header row.
+
+	:param file: A text file opened with ``newline=''``.
+	:type file: IO[str]
+	:param records: The records to write.
+	:type records: Iterable[Record]
+	:param columns: The attribute columns to include, in order.
+	:type columns: Sequence[str]
+	:param key: The coordinate fields to write, :data:`OFFSET` or :data:`CUBE`.
+	:type key: str
+	:return: The amount of records written.
+	:rtype: int
+	"""
+	key_fields = _check_key(key)
+	writer = csv.writer(file)
+	writer.writerow([*key_fields, *columns])
+	written = 0
+	for batch in _batches(records, BATCH_SIZE):
+		writer.writerows(
+			[*_convert(coordinate, key), *(values[name] for name in columns)] for coordinate, values in batch
+		)
+		written += len(batch)
+	return written
+
+
+def read_csv(file: IO[str]) -> Iterator[Record]:
+	"""Yield the records of a CSV file, values are left as strings."""
+	reader = csv.reader(file)
+	header = next(reader)
+	key = _detect_key(header)
+	key_positions = [header.index(field) for field in KEY_FIELDS[key]]
+	value_positions = [(position, name) for position, name in enumerate(header) if name not in KEY_FIELDS[key]]
+	for row in reader:
+		coordinate = _make_coordinate(key, [int(row[position]) for position in key_positions])
+		yield coordinate, {name: row[position] for position, name in value_positions}
+
+
+def write_jsonl(file: IO[str], records: Iterable[Record], columns: Sequence[str], key: str = OFFSET) -> int:
+	"""Write records as JSON Lines, one object per cell.
+
+	:param file: A text file.
+	:type file: IO[str]
+	:param records: The records to write.
+	:type records: Iterable[Record]
+	:param columns: The attribute columns to include.
+	:type columns: Sequence[str]
+	:param key: The coordinate fields to write, :data:`OFFSET` or :data:`CUBE`.
+	:type key: str
+	:return: The amount of records written.
+	:rtype: int
+	"""
+	key_fields = _check_key(key)
+	encode = json.JSONEncoder(separators=(',', ':')).encode
+	written = 0
+	for batch in _batches(records, BATCH_SIZE):
+		file.writelines(
+			encode({**dict(zip(key_fields, _convert(coordinate, key))), **{name: values[name] for name in columns}})
+			+ '\n'
+			for coordinate, values in batch
+		)
+		written += len(batch)
+	return written
+
+
+def read_jsonl(file: IO[str]) -> Iterator[Record]:
+	"""Yield the records of a JSON Lines file, skipping blank lines."""
+	key, key_fields = None, ()
+	for line in file:
+		if not line.strip():
+			continue
+		values = json.loads(line)
+		if key is None:
+			key = _detect_key(values)
+			key_fields = KEY_FIELDS[key]
+		yield _make_coordinate(key, [values.pop(field) for field in key_fields]), values
+
+
+def _convert(coordinate: Coordinate, key: str) -> Tuple[int, ...]:
+	"""Get the fields of a coordinate in the ``key`` kind, converting Offset and Cube as needed."""
+	if len(coordinate) == len(KEY_FIELDS[key]):
+		return tuple(coordinate)
+	if key == OFFSET:
+		col, row = cube_to_oddr(*coordinate)
+		return int(col), int(row)
+	q, r, s = oddr_to_cube(*coordinate)
+	return int(q), int(r), int(s)
+
+
+def _record_dtype(key: str, dtypes: Dict[str, Any]) -> np.dtype:
+	fields = [(field, '<i4') for field in KEY_FIELDS[key]]
+	fields += [(name, np.dtype(dtype).newbyteorder('<')) for name, dtype in dtypes.items()]
+	return np.dtype(fields)
+
+
+def write_binary(
+	file: IO[bytes],
+	records: Iterable[Record],
+	dtypes: Dict[str, Any],
+	key: str = OFFSET,
+	batch_size: int = BATCH_SIZE
+) -> int:
+	"""Write records as packed fixed-width rows, in blocks of ``batch_size``.
+
+	:param file: A binary file.
+	:type file: IO[bytes]
+	:param records: The records to write.
+	:type records: Iterable[Record]
+	:param dtypes: The attribute columns to include and their NumPy dtypes.
+	:type dtypes: Dict[str, Any]
+	:param key: The coordinate fields to write, :data:`OFFSET` or :data:`CUBE`.
+	:type key: str
+	:param batch_size: Records per block.
+	:type batch_size: int
+	:return: The amount of records written.
+	:rtype: int
+	"""
+	key_fields = _check_key(key)
+	record_dtype = _record_dtype(key, dtypes)
+	columns = list(dtypes)
+
+	file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, KEY_KINDS.index(key), len(columns)))
+	for name in columns:
+		encoded_name, dtype = name.encode('utf-8'), record_dtype[name].str.encode('ascii')
+		file.write(struct.pack('<B', len(encoded_name)) + encoded_name + struct.pack('<B', len(dtype)) + dtype)
+
+	written = 0
+	for batch in _batches(records, batch_size):
+		block = np.array(
+			[(*_convert(coordinate, key), *(values[name] for name in columns)) for coordinate, values in batch],
+			dtype=record_dtype
+		)
+		file.write(struct.pack(BLOCK_FORMAT, len(block)))
+		file.write(block.tobytes())
+		written += len(batch)
+	LOG.debug(f'Wrote {written} records with fields: {[*key_fields, *columns]}')
+	return written
+
+
+def _read_exactly(file: IO[bytes], size: int) -> bytes:
+	data = file.read(size)
+	if len(data) != size:
+		raise ValueError(f'Unexpected end of file, read {len(data)} of {size} bytes.')
+	return data
+
+
+def read_binary(file: IO[bytes]) -> Iterator[Record]:
+	"""Yield the records of a binary file, one block in memory at a time."""
+	header = _read_exactly(file, struct.calcsize(HEADER_FORMAT))
+	magic, version, key_kind, count = struct.unpack(HEADER_FORMAT, header)
+	if magic != MAGIC:
+		raise ValueError(f'<magic: {magic!r}> is not a hex cell file.')
+	if version != VERSION:
+		raise ValueError(f'<version: {version}> is not supported, Must be {VERSION}.')
+
+	key = KEY_KINDS[key_kind]
+	dtypes = {}
+	for _ in range(count):
+		name = _read_exactly(file, _read_exactly(file, 1)[0]).decode('utf-8')
+		dtypes[name] = np.dtype(_read_exactly(file, _read_exactly(file, 1)[0]).decode('ascii'))
+	record_dtype = _record_dtype(key, dtypes)
+	key_size, columns = len(KEY_FIELDS[key]), list(dtypes)
+
+	block_size = struct.calcsize(BLOCK_FORMAT)
+	while True:
+		block_header = file.read(block_size)
+		if not block_header:
+			return
+		if len(block_header) != block_size:
+			raise ValueError(f'Unexpected end of file, read {len(block_header)} of {block_size} bytes.')
+		rows = struct.unpack(BLOCK_FORMAT, block_header)[0]
+		block = np.frombuffer(_read_exactly(file, rows * record_dtype.itemsize), dtype=record_dtype)
+		for row in block.tolist():
+			yield _make_coordinate(key, row[:key_size]), dict(zip(columns, row[key_size:]))
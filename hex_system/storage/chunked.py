@@ -0,0 +1,330 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""storage/chunked.py.
+
+Unbounded hex grid made of fixed-size rectangular chunks.
+
+Cells keep their global odd-r offset coordinates, which may be negative. Cell ``(col, row)``
+lives in chunk ``(col // chunk_cols, row // chunk_rows)``::
+
+	local = (row % chunk_rows) * chunk_cols + col % chunk_cols
+
+A chunk is allocated the first time one of its cells is written. At most ``max_chunks`` are
+kept in memory, the least recently used one is written to disk and dropped when more are needed,
+and read back on its next use. Reading a cell of a chunk that was never written gives the
+column's fill value without allocating anything.
+"""
+# Standard Library
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import (
+	Dict,
+	Iterator,
+	List,
+	Optional,
+	Set,
+	Tuple,
+)
+
+# Third Party Library
+import numpy as np
+
+# App
+from config import PathType
+from grid.conversions import cube_to_oddr
+from loggers import get_logger
+from storage.adjacency import ODD_R_DIRECTIONS
+
+
+__all__ = ['Chunk', 'ChunkedGrid']
+
+LOG = get_logger(__name__)
+
+ChunkKey = Tuple[int, int]
+
+
+class Chunk:
+	"""The attribute columns of one rectangle of cells."""
+
+	__slots__ = ('key', 'columns', 'dirty')
+
+	def __init__(self, key: ChunkKey, columns: Dict[str, np.ndarray], dirty: bool = False) -> None:
+		self.key: ChunkKey = key
+		self.columns: Dict[str, np.ndarray] = columns
+		# True when the chunk changed since it was last written to disk.
+		self.dirty: bool = dirty
+		return
+
+	def __repr__(self) -> str:
+		return f'<{self.__class__.__name__}(key: {self.key}, dirty: {self.dirty})>'
+
+
+class ChunkedGrid:
+	"""Lazily allocated, LRU-evicted chunks of per-cell attribute columns."""
+
+	def __init__(
+		self,
+		chunk_cols: int = 64,
+		chunk_rows: int = 64,
+		max_chunks: int = 64,
+		directory: Optional[PathType] = None
+	) -> None:
+		"""Create an empty grid, add attributes with :meth:`add_column`.
+
+		:param chunk_cols: The amount of columns of a chunk.
+		:type chunk_cols: int
+		:param chunk_rows: The amount of rows of a chunk.
+		:type chunk_rows: int
+		:param max_chunks: How many chunks to keep in memory before evicting the least recently used.
+		:type max_chunks: int
+		:param directory: Where evicted chunks are written, defaults to a temporary directory.
+		:type directory: Optional[PathType]
+		:rtype: None
+		"""
+		if chunk_cols <= 0 or chunk_rows <= 0:
+			raise ValueError(f"Attributes 'chunk_cols' and 'chunk_rows' must be greater than 0.")
+		if max_chunks <= 0:
+			raise ValueError(f"Attribute 'max_chunks' must be greater than 0.")
+
+		self._chunk_cols: int = chunk_cols
+		self._chunk_rows: int = chunk_rows
+		self._max_chunks: int = max_chunks
+		self._temporary: Optional[tempfile.TemporaryDirectory] = None
+		if directory is None:
+			self._temporary = tempfile.TemporaryDirectory(prefix='hex_chunks_')
+			directory = self._temporary.name
+		self._directory: Path = Path(directory)
+		self._directory.mkdir(parents=True, exist_ok=True)
+
+		self._dtypes: Dict[str, np.dtype] = {}
+		self._fills: Dict[str, object] = {}
+		self._chunks: 'OrderedDict[ChunkKey, Chunk]' = OrderedDict()
+		# Chunks written to disk, whether or not they are also in memory.
+		self._stored: Set[ChunkKey] = {self._parse_key(path) for path in self._directory.glob('chunk_*.npz')}
+		return
+
+	def __repr__(self) -> str:
+		return (
+			f'<{self.__class__.__name__}(chunk: {self._chunk_cols}x{self._chunk_rows}, '
+			f'loaded: {len(self._chunks)}, stored: {len(self._stored)}, columns: {list(self._dtypes)})>'
+		)
+
+	@property
+	def chunk_size(self) -> Tuple[int, int]:
+		return self._chunk_cols, self._chunk_rows
+
+	@property
+	def directory(self) -> Path:
+		return self._directory
+
+	@property
+	def columns(self) -> Dict[str, np.dtype]:
+		return self._dtypes
+
+	@property
+	def loaded(self) -> List[ChunkKey]:
+		"""The keys of the chunks in memory, least recently used first."""
+		return list(self._chunks)
+
+	@property
+	def keys(self) -> Set[ChunkKey]:
+		"""The keys of every allocated chunk, in memory or on disk."""
+		return set(self._chunks) | self._stored
+
+	def add_column(self, name: str, dtype=np.int32, fill=0) -> None:
+		"""Add a per-cell attribute, every cell starts at ``fill``.
+
+		:param name: The attribute name.
+		:type name: str
+		:param dtype: The NumPy dtype of the attribute.
+		:param fill: The value of cells never written.
+		:rtype: None
+		"""
+		if name in self._dtypes:
+			raise ValueError(f'<column: {name}> already exists.')
+		self._dtypes[name] = np.dtype(dtype)
+		self._fills[name] = fill
+		# Chunks on disk get the column when loaded, either stored or at its fill value.
+		for chunk in self._chunks.values():
+			chunk.columns[name] = np.full(self._chunk_cols * self._chunk_rows, fill, dtype=dtype)
+			chunk.dirty = True
+		return
+
+	def chunk_key(self, col: int, row: int) -> ChunkKey:
+		return col // self._chunk_cols, row // self._chunk_rows
+
+	def _local(self, col: int, row: int) -> int:
+		return (row % self._chunk_rows) * self._chunk_cols + col % self._chunk_cols
+
+	def _path(self, key: ChunkKey) -> Path:
+		return self._directory / f'chunk_{key[0]}_{key[1]}.npz'
+
+	@staticmethod
+	def _parse_key(path: Path) -> ChunkKey:
+		_, chunk_col, chunk_row = path.stem.split('_')
+		return int(chunk_col), int(chunk_row)
+
+	def _allocate(self, key: ChunkKey) -> Chunk:
+		size = self._chunk_cols * self._chunk_rows
+		columns = {name: np.full(size, self._fills[name], dtype=dtype) for name, dtype in self._dtypes.items()}
+		return Chunk(key, columns, dirty=True)
+
+	def _load(self, key: ChunkKey) -> Chunk:
+		size = self._chunk_cols * self._chunk_rows
+		with np.load(self._path(key)) as stored:
+			columns = {name: stored[name] for name in stored.files if name in self._dtypes}
+		# Columns added after the chunk was written start at their fill value.
+		for name, dtype in self._dtypes.items():
+			if name not in columns:
+				columns[name] = np.full(size, self._fills[name], dtype=dtype)
+		return Chunk(key, columns)
+
+	def _write(self, chunk: Chunk) -> None:
+		np.savez(self._path(chunk.key), **chunk.columns)
+		self._stored.add(chunk.key)
+		chunk.dirty = False
+		return
+
+	def chunk(self, key: ChunkKey, create: bool = True) -> Optional[Chunk]:
+		"""Get a chunk, loading it from disk or allocating it if needed.
+
+		:param key: The chunk coordinates.
+		:type key: ChunkKey
+		:param create: Allocate the chunk if it does not exist yet, otherwise return None.
+		:type create: bool
+		:rtype: Optional[Chunk]
+		"""
+		chunk = self._chunks.get(key)
+		if chunk is not None:
+			self._chunks.move_to_end(key)
+			return chunk
+
+		if key in self._stored:
+			chunk = self._load(key)
+		elif create:
+			chunk = self._allocate(key)
+		else:
+			return None
+
+		self._chunks[key] = chunk
+		while len(self._chunks) > self._max_chunks:
+			self.evict()
+		return chunk
+
+	def evict(self) -> Optional[ChunkKey]:
+		"""Drop the least recently used chunk from memory, writing it to disk if it changed.
+
+		:return: The key of the evicted chunk, None if no chunk is loaded.
+		:rtype: Optional[ChunkKey]
+		"""
+		if not self._chunks:
+			return None
+		key, chunk = self._chunks.popitem(last=False)
+		if chunk.dirty:
+			self._write(chunk)
+		LOG.debug(f'Evicted chunk: {key}')
+		return key
+
+	def flush(self) -> int:
+		"""Write every changed chunk to disk, keeping them in memory.
+
+		:return: The amount of chunks written.
+		:rtype: int
+		"""
+		dirty = [chunk for chunk in self._chunks.values() if chunk.dirty]
+		for chunk in dirty:
+			self._write(chunk)
+		return len(dirty)
+
+	def close(self) -> None:
+		"""Write every changed chunk, then drop them all. A temporary directory is deleted."""
+		if self._temporary is None:
+			self.flush()
+		self._chunks.clear()
+		if self._temporary is not None:
+			self._temporary.cleanup()
+			self._temporary = None
+			self._stored.clear()
+		return
+
+	def get(self, col: int, row: int, column: str):
+		"""Get an attribute of a cell, the column's fill value if its chunk was never written."""
+		chunk = self.chunk(self.chunk_key(col, row), create=False)
+		if chunk is None:
+			return self._dtypes[column].type(self._fills[column])
+		return chunk.columns[column][self._local(col, row)]
+
+	def set(self, col: int, row: int, column: str, value) -> None:
+		"""Set an attribute of a cell, allocating its chunk if needed."""
+		chunk = self.chunk(self.chunk_key(col, row))
+		chunk.columns[column][self._local(col, row)] = value
+		chunk.dirty = True
+		return
+
+	def get_cube(self, cube, column: str):
+		"""Get an attribute of the cell at a :class:`grid.Cube`."""
+		col, row = cube_to_oddr(cube[0], cube[1], cube[2])
+		return self.get(int(col), int(row), column)
+
+	def set_cube(self, cube, column: str, value) -> None:
+		"""Set an attribute of the cell at a :class:`grid.Cube`."""
+		col, row = cube_to_oddr(cube[0], cube[1], cube[2])
+		self.set(int(col), int(row), column, value)
+		return
+
+	def neighbours(self, col: int, row: int) -> List[Tuple[int, int]]:
+		"""Get the offset coordinates of the six neighbours of a cell, across chunk boundaries."""
+		return [(col + col_step, row + row_step) for col_step, row_step in ODD_R_DIRECTIONS[row & 1]]
+
+	def _region_slices(self, col_min: int, row_min: int, col_max: int, row_max: int):
+		"""Yield the part of each chunk covering a region, as region slices and chunk slices."""
+		chunk_cols, chunk_rows = self._chunk_cols, self._chunk_rows
+		for chunk_row in range(row_min // chunk_rows, row_max // chunk_rows + 1):
+			top = max(row_min, chunk_row * chunk_rows)
+			bottom = min(row_max, (chunk_row + 1) * chunk_rows - 1)
+			for chunk_col in range(col_min // chunk_cols, col_max // chunk_cols + 1):
+				left = max(col_min, chunk_col * chunk_cols)
+				right = min(col_max, (chunk_col + 1) * chunk_cols - 1)
+				region = (slice(top - row_min, bottom - row_min + 1), slice(left - col_min, right - col_min + 1))
+				local = (
+					slice(top - chunk_row * chunk_rows, bottom - chunk_row * chunk_rows + 1),
+					slice(left - chunk_col * chunk_cols, right - chunk_col * chunk_cols + 1),
+				)
+				yield (chunk_col, chunk_row), region, local
+
+	def read_region(self, col_min: int, row_min: int, col_max: int, row_max: int, column: str) -> np.ndarray:
+		"""Get an attribute of a rectangle of cells, bounds included, as a (rows, cols) array."""
+		shape = (row_max - row_min + 1, col_max - col_min + 1)
+		region = np.full(shape, self._fills[column], dtype=self._dtypes[column])
+		for key, region_slices, local_slices in self._region_slices(col_min, row_min, col_max, row_max):
+			chunk = self.chunk(key, create=False)
+			if chunk is not None:
+				values = chunk.columns[column].reshape(self._chunk_rows, self._chunk_cols)
+				region[region_slices] = values[local_slices]
+		return region
+
+	def write_region(self, col_min: int, row_min: int, column: str, values) -> None:
+		"""Set an attribute of a rectangle of cells from a (rows, cols) array."""
+		values = np.asarray(values)
+		row_max, col_max = row_min + values.shape[0] - 1, col_min + values.shape[1] - 1
+		for key, region_slices, local_slices in self._region_slices(col_min, row_min, col_max, row_max):
+			chunk = self.chunk(key)
+			chunk.columns[column].reshape(self._chunk_rows, self._chunk_cols)[local_slices] = values[region_slices]
+			chunk.dirty = True
+		return
+
+	def iter_chunks(self) -> Iterator[Chunk]:
+		"""Yield every allocated chunk in key order, loading evicted ones one at a time."""
+		for key in sorted(self.keys):
+			yield self.chunk(key)
+
+	def iter_cells(self, column: str) -> Iterator[Tuple[int, int, object]]:
+		"""Yield ``(col, row, value)`` for every cell of every allocated chunk."""
+		chunk_cols, chunk_rows = self._chunk_cols, self._chunk_rows
+		for chunk in self.iter_chunks():
+			base_col, base_row = chunk.key[0] * chunk_cols, chunk.key[1] * chunk_rows
+			values = chunk.columns[column].tolist()
+			for local, value in enumerate(values):
+				local_row, local_col = divmod(local, chunk_cols)
+				yield base_col + local_col, base_row + local_row, value
@@ -0,0 +1,405 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""storage/columnar.py.
+
+Columnar storage for rectangular hex grids.
+
+Instead of one :class:`geometry.Hexagon` and one :class:`geometry.Point` per cell, every per-cell
+value lives in a parallel NumPy array addressed by a flat cell index::
+
+	index = row * cols + col
+
+Cells are laid out as odd-row offset ('odd-r'), pointy-top hexagons, the same layout
+:class:`hex_grid.HexGrid` has always drawn. Hexagon objects are only created on access.
+"""
+# Standard Library
+import math
+from typing import (
+	Dict,
+	Iterator,
+	List,
+	Mapping,
+	Optional,
+	Sequence,
+	Tuple,
+	Union,
+)
+
+# Third Party Library
+import numpy as np
+
+# First Party Library
+from geometry import (
+	Hexagon,
+	Point,
+)
+
+# App
+from grid.conversions import (
+	axial_round,
+	axial_to_oddr,
+	oddr_to_axial,
+	oddr_to_pixel,
+	pixel_to_axial,
+)
+from grid.layout import (
+	GridLayout,
+	get_layout,
+)
+from loggers import get_logger
+from storage.adjacency import Adjacency
+
+
+__all__ = ['COORDINATE_COLUMNS', 'ColumnarGrid', 'HexagonMapping', 'HexagonView', 'coordinate_rows']
+
+LOG = get_logger(__name__)
+
+# Coordinates of a 2000x2000 map comfortably fit in 32 bits.
+COORD_DTYPE = np.int32
+
+
+COORDINATE_COLUMNS: Tuple[str, ...] = ('q', 'r', 'x', 'y')
+
+
+def coordinate_rows(cols: int, layout: GridLayout, row_start: int, row_stop: int) -> Dict[str, np.ndarray]:
+	"""Compute the coordinate columns of the cells in rows ``[row_start, row_stop)``.
+
+	:param cols: The amount of columns of the grid.
+	:type cols: int
+	:param layout: Pixel placement of the cell centers.
+	:type layout: GridLayout
+	:param row_start: The first row.
+	:type row_start: int
+	:param row_stop: The row after the last one.
+	:type row_stop: int
+	:return: The ``q``, ``r``, ``x`` and ``y`` arrays, in cell index order.
+	:rtype: Dict[str, np.ndarray]
+	"""
+	start, stop = row_start * cols, row_stop * cols
+	row, col = np.divmod(np.arange(start, stop, dtype=COORD_DTYPE), COORD_DTYPE(cols))
+	q, r = oddr_to_axial(col, row)
+	x, y = oddr_to_pixel(col, row, layout)
+	return dict(zip(COORDINATE_COLUMNS, (q, r, x, y)))
+
+
+class ColumnarGrid:
+	"""Parallel-array storage for every cell of a rectangular hex grid.
+
+	Axial ``q``/``r`` and pixel center ``x``/``y`` are always present. Any number of extra
+	per-cell attribute columns can be added with :meth:`add_column`.
+	"""
+
+	def __new__(cls, cols: int, rows: int, layout: GridLayout):
+		if cols <= 0 or rows <= 0:
+			raise ValueError(f"Attributes 'cols' and 'rows' must be greater than 0.")
+		return super().__new__(cls)
+
+	def __init__(self, cols: int, rows: int, layout: GridLayout) -> None:
+		"""Build the coordinate columns in one vectorized pass.
+
+		:param cols: The amount of columns.
+		:type cols: int
+		:param rows: The amount of rows.
+		:type rows: int
+		:param layout: Pixel placement of the cell centers.
+		:type layout: GridLayout
+		:rtype: None
+		"""
+		self._cols: int = cols
+		self._rows: int = rows
+		self._layout: GridLayout = layout
+
+		coordinates = coordinate_rows(cols, layout, 0, rows)
+		self._q, self._r, self._x, self._y = (coordinates[name] for name in COORDINATE_COLUMNS)
+		self._columns: Dict[str, np.ndarray] = {}
+		self._adjacency: Optional[Adjacency] = None
+		return
+
+	@classmethod
+	def from_arrays(
+		cls,
+		cols: int,
+		rows: int,
+		layout: GridLayout,
+		coordinates: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+		columns: Optional[Dict[str, np.ndarray]] = None
+	) -> 'ColumnarGrid':
+		"""Wrap existing arrays, e.g. memory-mapped ones, without copying or recomputing them.
+
+		:param cols: The amount of columns.
+		:type cols: int
+		:param rows: The amount of rows.
+		:type rows: int
+		:param layout: Pixel placement of the cell centers.
+		:type layout: GridLayout
+		:param coordinates: The ``(q, r, x, y)`` columns.
+		:type coordinates: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+		:param columns: Per-cell attribute columns by name.
+		:type columns: Optional[Dict[str, np.ndarray]]
+		:rtype: ColumnarGrid
+		"""
+		self = cls.__new__(cls, cols, rows, layout)
+		for array in (*coordinates, *(columns or {}).values()):
+			if len(array) != cols * rows:
+				raise ValueError(f'<length: {len(array)}> is not allowed, Must be {cols * rows}.')
+		self._cols, self._rows, self._layout = cols, rows, layout
+		self._q, self._r, self._x, self._y = coordinates
+		self._columns = dict(columns or {})
+		self._adjacency = None
+		return self
+
+	def __repr__(self) -> str:
+		return f'<{self.__class__.__name__}(cols: {self.cols}, rows: {self.rows}, columns: {list(self.columns)})>'
+
+	def __str__(self) -> str:
+		return f'{self.__class__.__name__}({self.cols}, {self.rows})'
+
+	def __len__(self) -> int:
+		return self._cols * self._rows
+
+	@property
+	def cols(self) -> int:
+		return self._cols
+
+	@property
+	def rows(self) -> int:
+		return self._rows
+
+	@property
+	def size(self) -> Tuple[int, int]:
+		return self.cols, self.rows
+
+	@property
+	def layout(self) -> GridLayout:
+		return self._layout
+
+	@property
+	def q(self) -> np.ndarray:
+		return self._q
+
+	@property
+	def r(self) -> np.ndarray:
+		return self._r
+
+	@property
+	def x(self) -> np.ndarray:
+		return self._x
+
+	@property
+	def y(self) -> np.ndarray:
+		return self._y
+
+	@property
+	def columns(self) -> Dict[str, np.ndarray]:
+		return self._columns
+
+	@property
+	def nbytes(self) -> int:
+		"""Total memory held by all columns, in bytes."""
+		arrays = [self._q, self._r, self._x, self._y, *self._columns.values()]
+		return sum(array.nbytes for array in arrays)
+
+	@property
+	def adjacency(self) -> Adjacency:
+		"""The neighbour table of the grid, built on first use."""
+		if self._adjacency is None:
+			self._adjacency = Adjacency(self._cols, self._rows)
+		return self._adjacency
+
+	@property
+	def hexagons(self) -> 'HexagonView':
+		return HexagonView(self)
+
+	def add_column(self, name: str, dtype=np.int32, fill=0) -> np.ndarray:
+		"""Add a per-cell attribute column.
+
+		:param name: The name of the new column.
+		:type name: str
+		:param dtype: NumPy dtype of the column.
+		:param fill: Initial value of every cell.
+		:return: The new column.
+		:rtype: np.ndarray
+		"""
+		if name in self._columns:
+			raise ValueError(f'<column: {name}> already exists.')
+		column = np.full(len(self), fill, dtype=dtype)
+		self._columns[name] = column
+		return column
+
+	def column(self, name: str) -> np.ndarray:
+		"""Get a per-cell attribute column by name."""
+		return self._columns[name]
+
+	def contains(self, col: int, row: int) -> bool:
+		return 0 <= col < self._cols and 0 <= row < self._rows
+
+	def index(self, col: int, row: int) -> int:
+		"""Get the flat cell index of an offset coordinate.
+
+		:raises IndexError: If the coordinate lies outside of the grid.
+		"""
+		if not self.contains(col, row):
+			raise IndexError(f'<col: {col}, row: {row}> is outside of {self}.')
+		return row * self._cols + col
+
+	def offset(self, index: int) -> Tuple[int, int]:
+		"""Get the (col, row) offset coordinate of a flat cell index."""
+		row, col = divmod(index, self._cols)
+		return col, row
+
+	def neighbours(self, index: int) -> List[int]:
+		"""Get the indices of the on-grid neighbours of a cell."""
+		return self.adjacency.neighbours(index)
+
+	def center(self, index: int) -> Point:
+		return Point(int(self._x[index]), int(self._y[index]))
+
+	def hexagon(self, index: int) -> Hexagon:
+		"""Create a :class:`geometry.Hexagon` view of a single cell."""
+		return Hexagon(self.center(index))
+
+	def index_at_center(self, x: int, y: int) -> Optional[int]:
+		"""Get the cell index whose center is exactly at (x, y).
+
+		:return: The cell index, or None if no cell is centered there.
+		:rtype: Optional[int]
+		"""
+		layout = self._layout
+		row, remainder = divmod(y - layout.y_start, layout.y_step)
+		if remainder or not 0 <= row < self._rows:
+			return None
+
+		col, remainder = divmod(x - layout.x_start - (row & 1) * layout.x_shift, layout.x_step)
+		if remainder or not 0 <= col < self._cols:
+			return None
+
+		return row * self._cols + col
+
+	def index_at_pixel(self, x: float, y: float) -> Optional[int]:
+		"""Get the index of the cell covering a pixel.
+
+		Converts the pixel to a fractional axial coordinate and rounds it to the nearest hex,
+		so any pixel inside a hexagon resolves to that cell, not only its exact center.
+
+		:return: The cell index, or None if the pixel lies outside of the grid.
+		:rtype: Optional[int]
+		"""
+		layout = self._layout
+		r = (y - layout.y_start) / layout.y_step
+		q = (x - layout.x_start) / layout.x_step - r / 2
+		q, r = axial_round(q, r)
+
+		col = q + ((r - (r & 1)) >> 1)
+		if not self.contains(col, r):
+			return None
+		return r * self._cols + col
+
+	def indices_in_box(
+		self,
+		left: float,
+		top: float,
+		right: float,
+		bottom: float,
+		margin_x: float = 0,
+		margin_y: float = 0
+	) -> np.ndarray:
+		"""Get the cells whose centers lie in a pixel box grown by a margin.
+
+		With the margins set to half a hexagon's width and height, this is every cell whose
+		bounding box overlaps the box. The rows and columns in range are solved directly from
+		the layout, so the cost is proportional to the result, not to the grid.
+
+		:return: The sorted cell indices.
+		:rtype: np.ndarray
+		"""
+		layout = self._layout
+		row_min = max(0, math.ceil((top - margin_y - layout.y_start) / layout.y_step))
+		row_max = min(self._rows - 1, math.floor((bottom + margin_y - layout.y_start) / layout.y_step))
+
+		parts: List[np.ndarray] = []
+		for parity in (0, 1):
+			first_row = row_min + ((row_min & 1) != parity)
+			rows = np.arange(first_row, row_max + 1, 2, dtype=np.int64)
+			if not rows.size:
+				continue
+
+			x_start = layout.x_start + parity * layout.x_shift
+			col_min = max(0, math.ceil((left - margin_x - x_start) / layout.x_step))
+			col_max = min(self._cols - 1, math.floor((right + margin_x - x_start) / layout.x_step))
+			if col_max < col_min:
+				continue
+
+			cols = np.arange(col_min, col_max + 1, dtype=np.int64)
+			parts.append((rows[:, np.newaxis] * self._cols + cols).ravel())
+
+		if not parts:
+			return np.empty(0, dtype=np.int64)
+		return np.sort(np.concatenate(parts))
+
+	def indices_at_pixels(self, xs, ys) -> np.ndarray:
+		"""Vectorized :meth:`index_at_pixel`.
+
+		:param xs: The x coordinates of the pixels.
+		:type xs: array_like
+		:param ys: The y coordinates of the pixels.
+		:type ys: array_like
+		:return: The cell index of every pixel, -1 where a pixel lies outside of the grid.
+		:rtype: np.ndarray
+		"""
+		col, r = axial_to_oddr(*pixel_to_axial(xs, ys, self._layout))
+		on_grid = (col >= 0) & (col < self._cols) & (r >= 0) & (r < self._rows)
+		return np.where(on_grid, r * self._cols + col, -1)
+
+
+class HexagonView(Sequence):
+	"""Read-only sequence of lazily created :class:`geometry.Hexagon` objects."""
+
+	__slots__ = ('_storage',)
+
+	def __init__(self, storage: ColumnarGrid) -> None:
+		self._storage = storage
+		return
+
+	def __len__(self) -> int:
+		return len(self._storage)
+
+	def __getitem__(self, index: Union[int, slice]) -> Union[Hexagon, List[Hexagon]]:
+		if isinstance(index, slice):
+			return [self._storage.hexagon(i) for i in range(*index.indices(len(self)))]
+		if index < 0:
+			index += len(self)
+		if not 0 <= index < len(self):
+			raise IndexError(f'<index: {index}> out of range.')
+		return self._storage.hexagon(index)
+
+	def __iter__(self) -> Iterator[Hexagon]:
+		storage = self._storage
+		for index in range(len(storage)):
+			yield storage.hexagon(index)
+
+
+class HexagonMapping(Mapping):
+	"""Read-only mapping of cell center :class:`geometry.Point` to a lazily created :class:`geometry.Hexagon`."""
+
+	__slots__ = ('_storage',)
+
+	def __init__(self, storage: ColumnarGrid) -> None:
+		self._storage = storage
+		return
+
+	def __getitem__(self, point: Point) -> Hexagon:
+		index = self._storage.index_at_center(point.x, point.y)
+		if index is None:
+			raise KeyError(point)
+		return self._storage.hexagon(index)
+
+	def __contains__(self, point) -> bool:
+		return isinstance(point, Point) and self._storage.index_at_center(point.x, point.y) is not None
+
+	def __len__(self) -> int:
+		return len(self._storage)
+
+	def __iter__(self) -> Iterator[Point]:
+		storage = self._storage
+		for index in range(len(storage)):
+			yield storage.center(index)
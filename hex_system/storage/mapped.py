@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""storage/mapped.py.
+
+Binary on-disk format of a :class:`storage.ColumnarGrid`, opened with ``mmap``.
+
+Little-endian throughout::
+
+	header         HEADER_FORMAT: magic, version, cols, rows, hex side, GridLayout, column count
+	column table   COLUMN_FORMAT per column: name, dtype string, data offset, data size in bytes
+	column data    one fixed-width array per column, each starting on an ALIGNMENT boundary
+
+The first four columns are always ``q``, ``r``, ``x`` and ``y``. Opened grids wrap the mapped
+bytes directly, nothing is copied or rebuilt, so any number of processes opening the same file
+share one copy in the page cache.
+"""
+# Standard Library
+import mmap
+import struct
+from typing import (
+	Dict,
+	List,
+	NamedTuple,
+	Tuple,
+)
+
+# Third Party Library
+import numpy as np
+
+# App
+from config import PathType
+from grid.layout import GridLayout
+from loggers import get_logger
+from storage.columnar import (
+	COORDINATE_COLUMNS,
+	ColumnarGrid,
+)
+
+
+__all__ = ['GridHeader', 'open_grid', 'read_header', 'save_grid']
+
+LOG = get_logger(__name__)
+
+MAGIC: bytes = b'HEXGRID\x00'
+VERSION: int = 1
+# magic, version, cols, rows, hex side, layout (x_start, y_start, x_step, y_step, x_shift), column count
+HEADER_FORMAT: str = '<8sIIIi5iI'
+# name, dtype string, offset, size
+COLUMN_FORMAT: str = '<32s8sQQ'
+ALIGNMENT: int = 64
+# Dtype kinds stored as fixed-width bytes: bool, ints, floats, complex, datetimes, bytes, str and void.
+FIXED_WIDTH_KINDS: str = 'biufcmMSUV'
+
+# mmap access per open mode: read-only, shared writes, private copy-on-write.
+ACCESS_MODES: Dict[str, int] = {'r': mmap.ACCESS_READ, 'r+': mmap.ACCESS_WRITE, 'c': mmap.ACCESS_COPY}
+
+
+class GridHeader(NamedTuple):
+	"""Everything in a grid file besides the column data."""
+
+	cols: int
+	rows: int
+	side: int
+	layout: GridLayout
+	# (name, dtype, offset, size) of every column, in file order.
+	columns: List[Tuple[str, np.dtype, int, int]]
+
+
+def _align(offset: int) -> int:
+	return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def save_grid(path: PathType, storage: ColumnarGrid, side: int) -> None:
+	"""Write a grid, coordinates and every attribute column, to a file.
+
+	:param path: The file to write.
+	:type path: PathType
+	:param storage: The grid.
+	:type storage: ColumnarGrid
+	:param side: The hexagon side the grid layout was computed from.
+	:type side: int
+	:raises ValueError: If a column holds Python objects or other data of no fixed width.
+	:rtype: None
+	"""
+	arrays = dict(zip(COORDINATE_COLUMNS, (storage.q, storage.r, storage.x, storage.y)))
+	for name, column in storage.columns.items():
+		if name in arrays:
+			raise ValueError(f'<column: {name}> is not allowed, it is a coordinate column.')
+		# Object columns would write pointers, meaningless to whoever maps the file.
+		if column.dtype.hasobject or column.dtype.kind not in FIXED_WIDTH_KINDS:
+			raise ValueError(f'<column: {name}, dtype: {column.dtype}> is not allowed, Must be of a fixed-width dtype.')
+		arrays[name] = column
+
+	arrays = {
+		name: np.ascontiguousarray(array, dtype=array.dtype.newbyteorder('<'))
+		for name, array in arrays.items()
+	}
+	offset = _align(struct.calcsize(HEADER_FORMAT) + struct.calcsize(COLUMN_FORMAT) * len(arrays))
+	table = []
+	for name, array in arrays.items():
+		encoded_name, dtype = name.encode('utf-8'), array.dtype.str.encode('ascii')
+		if len(encoded_name) > 32 or len(dtype) > 8:
+			raise ValueError(f'<column: {name}, dtype: {array.dtype}> does not fit in the column table.')
+		table.append(struct.pack(COLUMN_FORMAT, encoded_name, dtype, offset, array.nbytes))
+		offset = _align(offset + array.nbytes)
+
+	header = struct.pack(HEADER_FORMAT, MAGIC, VERSION, storage.cols, storage.rows, side, *storage.layout, len(arrays))
+	with open(path, 'wb') as file:
+		file.write(header)
+		file.write(b''.join(table))
+		for array in arrays.values():
+			file.seek(_align(file.tell()))
+			file.write(array.tobytes())
+	LOG.debug(f'Saved {storage} to: {path}')
+	return
+
+
+def _parse_header(buffer) -> GridHeader:
+	header_size = struct.calcsize(HEADER_FORMAT)
+	magic, version, cols, rows, side, *layout, count = struct.unpack_from(HEADER_FORMAT, buffer, 0)
+	if magic != MAGIC:
+		raise ValueError(f'<magic: {magic!r}> is not a hex grid file.')
+	if version != VERSION:
+		raise ValueError(f'<version: {version}> is not supported, Must be {VERSION}.')
+
+	columns = []
+	column_size = struct.calcsize(COLUMN_FORMAT)
+	for position in range(count):
+		name, dtype, offset, size = struct.unpack_from(COLUMN_FORMAT, buffer, header_size + position * column_size)
+		name, dtype = name.rstrip(b'\x00').decode('utf-8'), np.dtype(dtype.rstrip(b'\x00').decode('ascii'))
+		columns.append((name, dtype, offset, size))
+	return GridHeader(cols, rows, side, GridLayout(*layout), columns)
+
+
+def read_header(path: PathType) -> GridHeader:
+	"""Read the header of a grid file without mapping its data."""
+	with open(path, 'rb') as file:
+		fixed = file.read(struct.calcsize(HEADER_FORMAT))
+		count = struct.unpack(HEADER_FORMAT, fixed)[-1]
+		return _parse_header(fixed + file.read(struct.calcsize(COLUMN_FORMAT) * count))
+
+
+def open_grid(path: PathType, mode: str = 'r') -> Tuple[ColumnarGrid, GridHeader]:
+	"""Map a grid file into memory.
+
+	:param path: The file to open.
+	:type path: PathType
+	:param mode: ``'r'`` read-only, ``'r+'`` writes go to the file, ``'c'`` writes stay private.
+	:type mode: str
+	:return: The grid, backed by the mapped file, and the header.
+	:rtype: Tuple[ColumnarGrid, GridHeader]
+	"""
+	if mode not in ACCESS_MODES:
+		raise ValueError(f'<mode: {mode}> is not allowed, Must be of {tuple(ACCESS_MODES)}.')
+
+	with open(path, 'r+b' if mode == 'r+' else 'rb') as file:
+		# The mapping stays valid after the file is closed, the arrays keep it alive.
+		buffer = mmap.mmap(file.fileno(), 0, access=ACCESS_MODES[mode])
+	header = _parse_header(buffer)
+
+	arrays = {
+		name: np.frombuffer(buffer, dtype=dtype, count=size // dtype.itemsize, offset=offset)
+		for name, dtype, offset, size in header.columns
+	}
+	coordinates = tuple(arrays.pop(name) for name in COORDINATE_COLUMNS)
+	storage = ColumnarGrid.from_arrays(header.cols, header.rows, header.layout, coordinates, arrays)
+	LOG.debug(f'Opened {storage} from: {path}')
+	return storage, header
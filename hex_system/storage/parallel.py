@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""storage/parallel.py.
+
+Fill per-cell columns of large grids on several processes.
+
+The rows of the grid are split into bands. Every column is one block of shared memory, and each
+worker process computes the cells of one band and writes them straight into its slice of the
+blocks, so no cell data is pickled between processes. Once every band is done the blocks are
+copied into ordinary arrays and released.
+
+The row function must be picklable, i.e. a module-level function or a :func:`functools.partial`
+of one. It is called as ``function(row_start, row_stop)`` and returns one array per column, with
+``(row_stop - row_start) * cols`` cells each.
+"""
+# Standard Library
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import shared_memory
+from typing import (
+	Any,
+	Callable,
+	Dict,
+	List,
+	Optional,
+	Tuple,
+)
+
+# Third Party Library
+import numpy as np
+
+# App
+from grid.layout import GridLayout
+from loggers import get_logger
+from storage.columnar import (
+	COORD_DTYPE,
+	COORDINATE_COLUMNS,
+	ColumnarGrid,
+	coordinate_rows,
+)
+
+
+__all__ = ['build_columnar_parallel', 'fill_rows_parallel']
+
+LOG = get_logger(__name__)
+
+RowFunction = Callable[[int, int], Dict[str, np.ndarray]]
+
+# Bands per worker, more bands even out workers that finish early.
+BANDS_PER_WORKER: int = 4
+
+
+def _row_bands(rows: int, bands: int) -> List[Tuple[int, int]]:
+	bounds = np.linspace(0, rows, min(bands, rows) + 1).round().astype(int).tolist()
+	return [(start, stop) for start, stop in zip(bounds, bounds[1:]) if stop > start]
+
+
+def _fill_band(
+	function: RowFunction,
+	blocks: Dict[str, Tuple[str, str]],
+	cols: int,
+	rows: int,
+	row_start: int,
+	row_stop: int
+) -> None:
+	"""Worker side: compute one band of rows into the shared blocks."""
+	values = function(row_start, row_stop)
+	for name, (block_name, dtype) in blocks.items():
+		block = shared_memory.SharedMemory(name=block_name)
+		try:
+			column = np.ndarray(cols * rows, dtype=dtype, buffer=block.buf)
+			column[row_start * cols:row_stop * cols] = values[name]
+			del column
+		finally:
+			block.close()
+	return
+
+
+def fill_rows_parallel(
+	cols: int,
+	rows: int,
+	dtypes: Dict[str, Any],
+	function: RowFunction,
+	workers: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+	"""Compute per-cell columns band by band on a process pool.
+
+	:param cols: The amount of columns of the grid.
+	:type cols: int
+	:param rows: The amount of rows of the grid.
+	:type rows: int
+	:param dtypes: The name and NumPy dtype of every column ``function`` returns.
+	:type dtypes: Dict[str, Any]
+	:param function: Picklable ``function(row_start, row_stop)`` returning the columns of those rows.
+	:type function: RowFunction
+	:param workers: The amount of processes, defaults to the CPU count. With 1, no pool is started.
+	:type workers: Optional[int]
+	:return: One array of ``cols * rows`` cells per column.
+	:rtype: Dict[str, np.ndarray]
+	"""
+	workers = workers or os.cpu_count() or 1
+	if workers == 1:
+		values = function(0, rows)
+		return {name: np.asarray(values[name], dtype=dtype) for name, dtype in dtypes.items()}
+
+	size = cols * rows
+	blocks: Dict[str, shared_memory.SharedMemory] = {}
+	try:
+		for name, dtype in dtypes.items():
+			blocks[name] = shared_memory.SharedMemory(create=True, size=max(size * np.dtype(dtype).itemsize, 1))
+		block_names = {name: (blocks[name].name, np.dtype(dtype).str) for name, dtype in dtypes.items()}
+
+		fill = partial(_fill_band, function, block_names, cols, rows)
+		with ProcessPoolExecutor(max_workers=workers) as executor:
+			futures = [executor.submit(fill, start, stop) for start, stop in _row_bands(rows, workers * BANDS_PER_WORKER)]
+			for future in futures:
+				future.result()
+
+		return {
+			name: np.ndarray(size, dtype=dtype, buffer=blocks[name].buf).copy()
+			for name, dtype in dtypes.items()
+		}
+	finally:
+		for block in blocks.values():
+			block.close()
+			block.unlink()
+
+
+def build_columnar_parallel(cols: int, rows: int, layout: GridLayout, workers: Optional[int] = None) -> ColumnarGrid:
+	"""Build a :class:`storage.ColumnarGrid` with its coordinate columns computed on a process pool.
+
+	The result is identical to ``ColumnarGrid(cols, rows, layout)``.
+
+	:param cols: The amount of columns.
+	:type cols: int
+	:param rows: The amount of rows.
+	:type rows: int
+	:param layout: Pixel placement of the cell centers.
+	:type layout: GridLayout
+	:param workers: The amount of processes, defaults to the CPU count.
+	:type workers: Optional[int]
+	:rtype: ColumnarGrid
+	"""
+	if cols <= 0 or rows <= 0:
+		raise ValueError(f"Attributes 'cols' and 'rows' must be greater than 0.")
+	dtypes = {name: COORD_DTYPE for name in COORDINATE_COLUMNS}
+	columns = fill_rows_parallel(cols, rows, dtypes, partial(coordinate_rows, cols, layout), workers)
+	return ColumnarGrid.from_arrays(cols, rows, layout, tuple(columns[name] for name in COORDINATE_COLUMNS))
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""storage/spatial.py.
+
+Uniform bucket grid over points, for rectangle, radius and nearest-neighbour queries.
+
+Points are sorted by the bucket they fall in, with buckets numbered row by row. The points
+of a bucket, and of a whole run of buckets along a row, are then one contiguous slice::
+
+	order[starts[bucket]:starts[bucket + 1]]
+
+so a query reads one slice per bucket row it touches instead of scanning every point.
+"""
+# Standard Library
+import math
+from typing import (
+	Optional,
+	Tuple,
+)
+
+# Third Party Library
+import numpy as np
+
+# First Party Library
+from geometry import (
+	Point,
+	Rectangle,
+)
+
+# App
+from config import Number
+from loggers import get_logger
+
+
+__all__ = ['SpatialIndex']
+
+LOG = get_logger(__name__)
+
+# Average amount of points per bucket when no bucket size is given.
+POINTS_PER_BUCKET: int = 4
+
+
+class SpatialIndex:
+	"""Static bucket grid over a set of points, each optionally the center of a box.
+
+	Item ``i`` is the point ``(xs[i], ys[i])``. Every query returns sorted item ids.
+	"""
+
+	def __init__(self, xs, ys, extent: Tuple[Number, Number] = (0, 0), bucket_size: Optional[Number] = None) -> None:
+		"""Index a set of points.
+
+		:param xs: The x coordinate of every item.
+		:type xs: array_like
+		:param ys: The y coordinate of every item.
+		:type ys: array_like
+		:param extent: Half width and half height of the box around every item, used by :meth:`overlapping`.
+		:type extent: Tuple[Number, Number]
+		:param bucket_size: Side of a square bucket, defaults to about four items per bucket.
+		:type bucket_size: Optional[Number]
+		:rtype: None
+		"""
+		self._xs: np.ndarray = np.asarray(xs, dtype=np.float64)
+		self._ys: np.ndarray = np.asarray(ys, dtype=np.float64)
+		if self._xs.shape != self._ys.shape or self._xs.ndim != 1:
+			raise ValueError(f"Attributes 'xs' and 'ys' must be 1-D and of the same length.")
+		self._extent: Tuple[float, float] = (float(extent[0]), float(extent[1]))
+
+		size = len(self._xs)
+		if size:
+			self._min_x, self._min_y = float(self._xs.min()), float(self._ys.min())
+			span_x, span_y = float(self._xs.max()) - self._min_x, float(self._ys.max()) - self._min_y
+		else:
+			self._min_x = self._min_y = span_x = span_y = 0.0
+
+		if bucket_size is None:
+			bucket_size = math.sqrt(max(span_x * span_y, 1.0) * POINTS_PER_BUCKET / max(size, 1))
+		if bucket_size <= 0:
+			raise ValueError(f"Attribute 'bucket_size' must be greater than 0.")
+		self._bucket_size: float = float(bucket_size)
+		self._buckets_x: int = int(span_x // self._bucket_size) + 1
+		self._buckets_y: int = int(span_y // self._bucket_size) + 1
+
+		bucket = self._bucket_row(self._ys) * self._buckets_x + self._bucket_col(self._xs)
+		self._order: np.ndarray = np.argsort(bucket, kind='stable')
+		self._starts: np.ndarray = np.searchsorted(
+			bucket[self._order], np.arange(self._buckets_x * self._buckets_y + 1)
+		)
+		return
+
+	def __repr__(self) -> str:
+		return (
+			f'<{self.__class__.__name__}(items: {len(self)}, buckets: {self._buckets_x}x{self._buckets_y}, '
+			f'bucket_size: {self._bucket_size:g})>'
+		)
+
+	def __len__(self) -> int:
+		return len(self._xs)
+
+	@property
+	def bucket_size(self) -> float:
+		return self._bucket_size
+
+	@property
+	def extent(self) -> Tuple[float, float]:
+		return self._extent
+
+	def _bucket_col(self, x):
+		return np.clip((np.asarray(x) - self._min_x) // self._bucket_size, 0, self._buckets_x - 1).astype(np.int64)
+
+	def _bucket_row(self, y):
+		return np.clip((np.asarray(y) - self._min_y) // self._bucket_size, 0, self._buckets_y - 1).astype(np.int64)
+
+	def _candidates(self, left: float, top: float, right: float, bottom: float) -> np.ndarray:
+		"""Get the items in every bucket touching a box, a superset of the items inside it."""
+		if not len(self) or left > right or top > bottom:
+			return np.empty(0, dtype=np.int64)
+		col_min, col_max = int(self._bucket_col(left)), int(self._bucket_col(right))
+		row_min, row_max = int(self._bucket_row(top)), int(self._bucket_row(bottom))
+
+		starts, buckets_x = self._starts, self._buckets_x
+		slices = [
+			self._order[starts[row * buckets_x + col_min]:starts[row * buckets_x + col_max + 1]]
+			for row in range(row_min, row_max + 1)
+		]
+		return np.concatenate(slices)
+
+	def in_box(self, left: Number, top: Number, right: Number, bottom: Number) -> np.ndarray:
+		"""Get the items whose point lies in a box, edges included."""
+		ids = self._candidates(left, top, right, bottom)
+		xs, ys = self._xs[ids], self._ys[ids]
+		return np.sort(ids[(xs >= left) & (xs <= right) & (ys >= top) & (ys <= bottom)])
+
+	def in_rect(self, rect: Rectangle) -> np.ndarray:
+		"""Get the items whose point lies in a rectangle, like :meth:`geometry.Rectangle.contains`."""
+		return self.in_box(rect.left, rect.top, rect.right, rect.bottom)
+
+	def overlapping(self, rect: Rectangle) -> np.ndarray:
+		"""Get the items whose box, of half size :attr:`extent`, overlaps a rectangle."""
+		extent_x, extent_y = self._extent
+		return self.in_box(rect.left - extent_x, rect.top - extent_y, rect.right + extent_x, rect.bottom + extent_y)
+
+	def within(self, point: Point, radius: Number) -> np.ndarray:
+		"""Get the items whose point is at most ``radius`` away from ``point``."""
+		x, y = point.x, point.y
+		ids = self._candidates(x - radius, y - radius, x + radius, y + radius)
+		distance_2 = (self._xs[ids] - x) ** 2 + (self._ys[ids] - y) ** 2
+		return np.sort(ids[distance_2 <= radius * radius])
+
+	def nearest(self, point: Point, k: int = 1) -> np.ndarray:
+		"""Get the ``k`` items closest to ``point``, closest first, ties broken by id.
+
+		The search box starts at one bucket and doubles until it holds ``k`` items. Any item
+		closer than the k-th of those must then lie within that distance, so one radius query
+		finishes the search.
+
+		:param point: The query point.
+		:type point: Point
+		:param k: The amount of items wanted.
+		:type k: int
+		:return: Up to ``k`` item ids.
+		:rtype: np.ndarray
+		"""
+		k = min(k, len(self))
+		if k <= 0:
+			return np.empty(0, dtype=np.int64)
+
+		x, y = point.x, point.y
+		half = self._bucket_size
+		while True:
+			ids = self._candidates(x - half, y - half, x + half, y + half)
+			if len(ids) >= k:
+				break
+			half *= 2
+
+		distance_2 = (self._xs[ids] - x) ** 2 + (self._ys[ids] - y) ** 2
+		radius = math.sqrt(np.partition(distance_2, k - 1)[k - 1])
+		ids = self._candidates(x - radius, y - radius, x + radius, y + radius)
+		distance_2 = (self._xs[ids] - x) ** 2 + (self._ys[ids] - y) ** 2
+		return ids[np.lexsort((ids, distance_2))[:k]]
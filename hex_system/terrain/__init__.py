@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""terrain/__init__.py."""
+# App
+from terrain.generator import (
+	BIOME_NAMES,
+	TerrainConfig,
+	classify_biomes,
+	generate_terrain,
+	sample_terrain,
+	terrain_region,
+)
+from terrain.noise import (
+	fractal_noise,
+	simplex_noise,
+	value_noise,
+)
+
+
+__all__ = [
+	'BIOME_NAMES',
+	'TerrainConfig',
+	'classify_biomes',
+	'fractal_noise',
+	'generate_terrain',
+	'sample_terrain',
+	'simplex_noise',
+	'terrain_region',
+	'value_noise',
+]
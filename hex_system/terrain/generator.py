@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""terrain/generator.py.
+
+Elevation, moisture and biome layers sampled from noise at hex centers.
+
+Every value depends only on the seed and the pixel center of its cell, so a map can be generated
+whole, by bands of rows on a process pool, or region by region into a :class:`storage.ChunkedGrid`,
+and always comes out the same.
+"""
+# Standard Library
+from functools import partial
+from typing import (
+	Dict,
+	NamedTuple,
+	Optional,
+	Tuple,
+)
+
+# Third Party Library
+import numpy as np
+
+# App
+from grid.conversions import oddr_to_pixel
+from grid.layout import GridLayout
+from loggers import get_logger
+from storage.columnar import (
+	ColumnarGrid,
+	coordinate_rows,
+)
+from storage.parallel import fill_rows_parallel
+from terrain.noise import (
+	fractal_noise,
+	simplex_noise,
+	value_noise,
+)
+
+
+__all__ = ['BIOME_NAMES', 'TerrainConfig', 'classify_biomes', 'generate_terrain', 'sample_terrain', 'terrain_region']
+
+LOG = get_logger(__name__)
+
+ELEVATION_COLUMN: str = 'elevation'
+MOISTURE_COLUMN: str = 'moisture'
+BIOME_COLUMN: str = 'biome'
+
+TERRAIN_DTYPES: Dict[str, np.dtype] = {
+	ELEVATION_COLUMN: np.dtype(np.float32),
+	MOISTURE_COLUMN: np.dtype(np.float32),
+	BIOME_COLUMN: np.dtype(np.uint8),
+}
+
+# Biome ids, as stored in the biome column.
+OCEAN, BEACH, DESERT, GRASSLAND, FOREST, RAINFOREST, SHRUBLAND, TAIGA, TUNDRA, SNOW = range(10)
+BIOME_NAMES: Tuple[str, ...] = (
+	'ocean', 'beach', 'desert', 'grassland', 'forest', 'rainforest', 'shrubland', 'taiga', 'tundra', 'snow'
+)
+
+# Land biomes by elevation band (rows) and moisture band (columns).
+LAND_BIOMES: np.ndarray = np.array([
+	(DESERT, GRASSLAND, RAINFOREST),
+	(SHRUBLAND, FOREST, TAIGA),
+	(TUNDRA, SNOW, SNOW),
+], dtype=np.uint8)
+# Upper bounds of the lower elevation bands, as fractions of the height above the beach.
+LAND_ELEVATION_BANDS: Tuple[float, ...] = (0.4, 0.75)
+MOISTURE_BANDS: Tuple[float, ...] = (0.4, 0.6)
+# Height of the beach above sea level.
+BEACH_HEIGHT: float = 0.02
+
+# Offset between the elevation and moisture seeds, so the two layers are unrelated.
+MOISTURE_SEED_OFFSET: int = 7919
+
+
+class TerrainConfig(NamedTuple):
+	"""Parameters of the terrain layers."""
+
+	seed: int = 0
+	# Size of the largest landmasses, in pixels.
+	feature_size: float = 2048.0
+	octaves: int = 5
+	lacunarity: float = 2.0
+	persistence: float = 0.5
+	# Elevation, in [0, 1], below which cells are ocean.
+	sea_level: float = 0.5
+
+
+def classify_biomes(elevation: np.ndarray, moisture: np.ndarray, sea_level: float) -> np.ndarray:
+	"""Get the biome id of every cell from its elevation and moisture, both in [0, 1]."""
+	beach_level = sea_level + BEACH_HEIGHT
+	land_height = np.clip((elevation - beach_level) / max(1.0 - beach_level, 1e-9), 0.0, 1.0)
+	biomes = LAND_BIOMES[np.digitize(land_height, LAND_ELEVATION_BANDS), np.digitize(moisture, MOISTURE_BANDS)]
+	biomes[elevation < beach_level] = BEACH
+	biomes[elevation < sea_level] = OCEAN
+	return biomes
+
+
+def sample_terrain(x, y, config: TerrainConfig = TerrainConfig()) -> Dict[str, np.ndarray]:
+	"""Sample every terrain layer at pixel coordinates, e.g. hex centers.
+
+	:param x: The pixel x coordinates.
+	:type x: array_like
+	:param y: The pixel y coordinates.
+	:type y: array_like
+	:param config: The terrain parameters.
+	:type config: TerrainConfig
+	:return: The elevation, moisture and biome columns.
+	:rtype: Dict[str, np.ndarray]
+	"""
+	x = np.asarray(x, dtype=np.float64) / config.feature_size
+	y = np.asarray(y, dtype=np.float64) / config.feature_size
+	octaves = dict(octaves=config.octaves, lacunarity=config.lacunarity, persistence=config.persistence)
+
+	elevation = fractal_noise(simplex_noise, x, y, config.seed, **octaves)
+	moisture = fractal_noise(value_noise, x, y, config.seed + MOISTURE_SEED_OFFSET, **octaves)
+	# Fractal sums rarely reach their bounds, stretch them to use most of [0, 1].
+	elevation = np.clip(0.5 + elevation, 0.0, 1.0).astype(np.float32)
+	moisture = np.clip(0.5 + moisture, 0.0, 1.0).astype(np.float32)
+	return {
+		ELEVATION_COLUMN: elevation,
+		MOISTURE_COLUMN: moisture,
+		BIOME_COLUMN: classify_biomes(elevation, moisture, config.sea_level),
+	}
+
+
+def _terrain_rows(cols: int, layout: GridLayout, config: TerrainConfig, row_start: int, row_stop: int):
+	coordinates = coordinate_rows(cols, layout, row_start, row_stop)
+	return sample_terrain(coordinates['x'], coordinates['y'], config)
+
+
+def generate_terrain(
+	storage: ColumnarGrid,
+	config: TerrainConfig = TerrainConfig(),
+	workers: Optional[int] = None
+) -> None:
+	"""Fill the elevation, moisture and biome columns of a grid, adding them if missing.
+
+	:param storage: The grid.
+	:type storage: ColumnarGrid
+	:param config: The terrain parameters.
+	:type config: TerrainConfig
+	:param workers: Generate bands of rows on this many processes, see :mod:`storage.parallel`.
+	:type workers: Optional[int]
+	:rtype: None
+	"""
+	if workers is None:
+		layers = sample_terrain(storage.x, storage.y, config)
+	else:
+		function = partial(_terrain_rows, storage.cols, storage.layout, config)
+		layers = fill_rows_parallel(storage.cols, storage.rows, TERRAIN_DTYPES, function, workers)
+
+	for name, values in layers.items():
+		if name not in storage.columns:
+			storage.add_column(name, dtype=TERRAIN_DTYPES[name])
+		storage.column(name)[:] = values
+	LOG.debug(f'Generated terrain for {storage} with {config}')
+	return
+
+
+def terrain_region(
+	col_min: int,
+	row_min: int,
+	col_max: int,
+	row_max: int,
+	layout: GridLayout,
+	config: TerrainConfig = TerrainConfig()
+) -> Dict[str, np.ndarray]:
+	"""Sample the terrain of a rectangle of offset coordinates, bounds included, e.g. one chunk.
+
+	:return: The elevation, moisture and biome of the region, each a (rows, cols) array.
+	:rtype: Dict[str, np.ndarray]
+	"""
+	row, col = np.mgrid[row_min:row_max + 1, col_min:col_max + 1]
+	x, y = oddr_to_pixel(col, row, layout)
+	return sample_terrain(x, y, config)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""terrain/noise.py.
+
+Seedable, vectorized 2D value and simplex noise.
+
+Lattice points are hashed from their integer coordinates and the seed instead of looked up in
+a permutation table, so noise is a pure function of position: any part of an unbounded plane
+can be sampled on its own, in any order, and always gives the same values.
+"""
+# Standard Library
+from typing import Callable
+
+# Third Party Library
+import numpy as np
+
+# App
+from config import SQRT_3
+from loggers import get_logger
+
+
+__all__ = ['fractal_noise', 'simplex_noise', 'value_noise']
+
+LOG = get_logger(__name__)
+
+NoiseFunction = Callable[[np.ndarray, np.ndarray, int], np.ndarray]
+
+# Skew and unskew factors between the square grid and the simplex (triangle) grid.
+F2: float = 0.5 * (SQRT_3 - 1.0)
+G2: float = (3.0 - SQRT_3) / 6.0
+
+# Eight unit gradient directions.
+GRADIENTS: np.ndarray = np.array([(np.cos(angle), np.sin(angle)) for angle in np.arange(8) * np.pi / 4])
+
+# Scales the sum of the three simplex corner contributions to about [-1, 1].
+SIMPLEX_SCALE: float = 99.0
+
+
+def _hash(i: np.ndarray, j: np.ndarray, seed: int) -> np.ndarray:
+	"""Mix integer lattice coordinates and a seed into well distributed uint32s."""
+	with np.errstate(over='ignore'):
+		h = i.astype(np.int64).astype(np.uint32) * np.uint32(0x8DA6B343)
+		h ^= j.astype(np.int64).astype(np.uint32) * np.uint32(0xD8163841)
+		h ^= np.uint32(seed & 0xFFFFFFFF) * np.uint32(0xCB1AB31F)
+		# Murmur3 finalizer.
+		h ^= h >> np.uint32(16)
+		h *= np.uint32(0x85EBCA6B)
+		h ^= h >> np.uint32(13)
+		h *= np.uint32(0xC2B2AE35)
+		h ^= h >> np.uint32(16)
+	return h
+
+
+def value_noise(x, y, seed: int = 0) -> np.ndarray:
+	"""Sample value noise, smoothly interpolated random values on the integer lattice.
+
+	:param x: The x coordinates, one lattice cell per unit.
+	:type x: array_like
+	:param y: The y coordinates.
+	:type y: array_like
+	:param seed: Selects the noise pattern.
+	:type seed: int
+	:return: Values in [-1, 1].
+	:rtype: np.ndarray
+	"""
+	x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+	x0, y0 = np.floor(x), np.floor(y)
+	i, j = x0.astype(np.int64), y0.astype(np.int64)
+	# Smoothstep, so the noise has no creases along lattice lines.
+	fx, fy = x - x0, y - y0
+	u, v = fx * fx * (3 - 2 * fx), fy * fy * (3 - 2 * fy)
+
+	top_left, top_right, bottom_left, bottom_right = (
+		_hash(i + di, j + dj, seed) * (2.0 / 0xFFFFFFFF) - 1.0 for di, dj in ((0, 0), (1, 0), (0, 1), (1, 1))
+	)
+	top = top_left + (top_right - top_left) * u
+	bottom = bottom_left + (bottom_right - bottom_left) * u
+	return top + (bottom - top) * v
+
+
+def simplex_noise(x, y, seed: int = 0) -> np.ndarray:
+	"""Sample 2D simplex noise, with fewer directional artifacts than value noise.
+
+	:param x: The x coordinates, about one feature per unit.
+	:type x: array_like
+	:param y: The y coordinates.
+	:type y: array_like
+	:param seed: Selects the noise pattern.
+	:type seed: int
+	:return: Values in about [-1, 1].
+	:rtype: np.ndarray
+	"""
+	x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+	skew = (x + y) * F2
+	i, j = np.floor(x + skew), np.floor(y + skew)
+	unskew = (i + j) * G2
+	# Offsets from the three corners of the containing triangle.
+	x0, y0 = x - (i - unskew), y - (j - unskew)
+	# The middle corner is one step along x below the diagonal, one step along y above it.
+	i1 = (x0 > y0).astype(np.int64)
+	j1 = 1 - i1
+	x1, y1 = x0 - i1 + G2, y0 - j1 + G2
+	x2, y2 = x0 - 1.0 + 2.0 * G2, y0 - 1.0 + 2.0 * G2
+
+	i, j = i.astype(np.int64), j.astype(np.int64)
+	total = np.zeros(np.broadcast(x, y).shape)
+	for dx, dy, di, dj in ((x0, y0, 0, 0), (x1, y1, i1, j1), (x2, y2, 1, 1)):
+		gradient = GRADIENTS[_hash(i + di, j + dj, seed) & 7]
+		falloff = np.maximum(0.5 - dx * dx - dy * dy, 0.0)
+		falloff *= falloff
+		total += falloff * falloff * (gradient[..., 0] * dx + gradient[..., 1] * dy)
+	return SIMPLEX_SCALE * total
+
+
+def fractal_noise(
+	noise: NoiseFunction,
+	x,
+	y,
+	seed: int = 0,
+	octaves: int = 5,
+	lacunarity: float = 2.0,
+	persistence: float = 0.5
+) -> np.ndarray:
+	"""Sum octaves of a noise function, each finer and fainter than the last (fractal Brownian motion).
+
+	:param noise: :func:`value_noise` or :func:`simplex_noise`.
+	:type noise: NoiseFunction
+	:param x: The x coordinates of the first octave.
+	:type x: array_like
+	:param y: The y coordinates of the first octave.
+	:type y: array_like
+	:param seed: Selects the noise pattern, every octave uses a different one.
+	:type seed: int
+	:param octaves: The amount of layers.
+	:type octaves: int
+	:param lacunarity: Frequency multiplier between octaves.
+	:type lacunarity: float
+	:param persistence: Amplitude multiplier between octaves.
+	:type persistence: float
+	:return: Values in about [-1, 1].
+	:rtype: np.ndarray
+	"""
+	x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+	total = np.zeros(np.broadcast(x, y).shape)
+	frequency, amplitude, norm = 1.0, 1.0, 0.0
+	for octave in range(octaves):
+		total += amplitude * noise(x * frequency, y * frequency, seed + octave * 1013)
+		norm += amplitude
+		frequency *= lacunarity
+		amplitude *= persistence
+	return total / norm
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/algorithms/test_field_of_view.py."""
+# Third Party Library
+import numpy as np
+import pytest
+
+# App
+from algorithms import (
+	FieldOfView,
+	field_of_view,
+)
+from algorithms.line_of_sight import VisibilityCache
+from grid import Cube
+from hex_grid import get_hex_grid
+from storage import ColumnarGrid
+
+
+@pytest.fixture
+def storage() -> ColumnarGrid:
+	storage = get_hex_grid(21, 21).storage
+	storage.add_column('blocking', dtype=bool, fill=False)
+	return storage
+
+
+def _cube(storage: ColumnarGrid, index: int) -> Cube:
+	q, r = int(storage.q[index]), int(storage.r[index])
+	return Cube(q, r, -q - r)
+
+
+def test_field_of_view_open(storage: ColumnarGrid) -> None:
+	origin = storage.index(10, 10)
+	view = field_of_view(storage, origin, 5)
+	assert np.array_equal(view, VisibilityCache(storage, 5).cells_in_range(origin))
+	return
+
+
+def test_field_of_view_enclosed(storage: ColumnarGrid) -> None:
+	origin = storage.index(10, 10)
+	blocking = storage.column('blocking')
+	walls = storage.neighbours(origin)
+	blocking[walls] = True
+	assert field_of_view(storage, origin, 6).tolist() == sorted([origin, *walls])
+	return
+
+
+def test_field_of_view_shadow(storage: ColumnarGrid) -> None:
+	origin = storage.index(10, 10)
+	center = _cube(storage, origin)
+	wall = center.neighbour(1)
+	behind = [wall.neighbour(1), wall.neighbour(1).neighbour(1)]
+
+	def to_index(cube: Cube) -> int:
+		return storage.index(cube.q + ((cube.r - (cube.r & 1)) >> 1), cube.r)
+
+	storage.column('blocking')[to_index(wall)] = True
+	view = field_of_view(storage, origin, 4).tolist()
+	assert to_index(wall) in view
+	assert all(to_index(cube) not in view for cube in behind)
+	return
+
+
+def test_field_of_view_edge_of_grid(storage: ColumnarGrid) -> None:
+	view = field_of_view(storage, 0, 3)
+	assert all(0 <= index < len(storage) for index in view)
+	assert len(view) == len(VisibilityCache(storage, 3).cells_in_range(0))
+	return
+
+
+def test_field_of_view_incremental(storage: ColumnarGrid) -> None:
+	blocking = storage.column('blocking')
+	blocking[np.random.default_rng(2).random(len(storage)) < 0.25] = True
+	views = FieldOfView(storage, radius=6)
+	origins = [storage.index(col, row) for col, row in [(3, 3), (10, 10), (17, 17), (4, 16)]]
+	for origin in origins:
+		views.visible_cells(origin)
+
+	changed = [storage.index(11, 10), storage.index(0, 20)]
+	blocking[changed] = ~blocking[changed]
+	views.update_blockers(changed)
+
+	for origin in origins:
+		assert np.array_equal(views.visible_cells(origin), field_of_view(storage, origin, 6))
+	return
+
+
+def test_field_of_view_keeps_unaffected_views(storage: ColumnarGrid) -> None:
+	views = FieldOfView(storage, radius=3)
+	near, far = storage.index(2, 2), storage.index(18, 18)
+	views.visible_cells(near)
+	views.visible_cells(far)
+	assert views.update_blockers([storage.index(3, 2)]) == 1
+	assert far in views and near not in views
+	return
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/algorithms/test_line_of_sight.py."""
+# Third Party Library
+import numpy as np
+import pytest
+
+# App
+from algorithms import (
+	VisibilityCache,
+	has_line_of_sight,
+	hex_line,
+	line_of_sight,
+)
+from algorithms.line_of_sight import hex_line_array
+from grid import Cube
+from hex_grid import get_hex_grid
+from storage import ColumnarGrid
+
+
+@pytest.fixture
+def storage() -> ColumnarGrid:
+	storage = get_hex_grid(15, 15).storage
+	blocking = storage.add_column('blocking', dtype=bool, fill=False)
+	blocking[np.random.default_rng(11).random(len(storage)) < 0.2] = True
+	return storage
+
+
+def test_hex_line() -> None:
+	origin, target = Cube(0, 0, 0), Cube(4, -1, -3)
+	line = list(hex_line(origin, target))
+	assert line[0] == origin and line[-1] == target
+	assert len(line) == origin.distance(target) + 1
+	for current, following in zip(line, line[1:]):
+		assert current.distance(following) == 1
+
+	q, r, s = hex_line_array(origin, target)
+	assert list(zip(q.tolist(), r.tolist(), s.tolist())) == line
+	assert list(hex_line(origin, origin)) == [origin]
+	return
+
+
+def test_line_of_sight_wall() -> None:
+	storage = get_hex_grid(9, 1).storage
+	blocking = storage.add_column('blocking', dtype=bool, fill=False)
+	blocking[4] = True
+	assert has_line_of_sight(storage, 0, 3)
+	assert has_line_of_sight(storage, 0, 4)
+	assert not has_line_of_sight(storage, 0, 5)
+	assert line_of_sight(storage, 0, [1, 3, 4, 5, 8]).tolist() == [True, True, True, False, False]
+	return
+
+
+def test_line_of_sight_batch_matches_scalar(storage: ColumnarGrid) -> None:
+	for origin in (0, 112, 224):
+		targets = np.arange(len(storage))
+		expected = [has_line_of_sight(storage, origin, int(target)) for target in targets]
+		assert line_of_sight(storage, origin, targets).tolist() == expected
+	return
+
+
+def test_visibility_cache(storage: ColumnarGrid) -> None:
+	cache = VisibilityCache(storage, radius=4, max_origins=2)
+	origin = storage.index(7, 7)
+	visible = cache.visible_cells(origin)
+	candidates = cache.cells_in_range(origin)
+	assert np.array_equal(visible, candidates[line_of_sight(storage, origin, candidates)])
+	assert cache.visible_cells(origin) is visible
+	assert cache.mask(origin).sum() == visible.size
+	assert cache.is_visible(origin, origin)
+
+	cache.invalidate(storage.index(0, 14))
+	assert origin in cache
+	cache.invalidate(storage.index(8, 7))
+	assert origin not in cache
+
+	for other in (1, 2, 3):
+		cache.visible_cells(other)
+	assert len(cache) == 2
+	return
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/algorithms/test_pathfinding.py."""
+# Standard Library
+import math
+
+# Third Party Library
+import numpy as np
+import pytest
+
+# App
+from algorithms import (
+	astar,
+	bidirectional,
+	dijkstra,
+	dijkstra_costs,
+)
+from hex_grid import get_hex_grid
+
+
+SEARCHES = [astar, dijkstra, bidirectional]
+
+
+def _path_cost(path, costs) -> float:
+	return sum(costs[index] for index in path[1:])
+
+
+def _assert_connected(storage, path) -> None:
+	for current, following in zip(path, path[1:]):
+		assert following in storage.neighbours(current)
+	return
+
+
+@pytest.mark.parametrize('search', SEARCHES)
+def test_path_straight_row(search) -> None:
+	storage = get_hex_grid(10, 3).storage
+	path = search(storage, storage.index(0, 0), storage.index(9, 0))
+	assert len(path) == 10
+	_assert_connected(storage, path)
+	return
+
+
+@pytest.mark.parametrize('search', SEARCHES)
+def test_path_to_itself(search) -> None:
+	storage = get_hex_grid(3, 3).storage
+	assert search(storage, 4, 4) == [4]
+	return
+
+
+@pytest.mark.parametrize('search', SEARCHES)
+def test_path_blocked(search) -> None:
+	storage = get_hex_grid(5, 5).storage
+	costs = np.ones(len(storage))
+	costs[[storage.index(2, row) for row in range(5)]] = math.inf
+	assert search(storage, storage.index(0, 2), storage.index(4, 2), costs) is None
+	return
+
+
+@pytest.mark.parametrize('search', SEARCHES)
+def test_path_is_cheapest(search) -> None:
+	storage = get_hex_grid(12, 9).storage
+	costs = np.random.default_rng(7).integers(1, 6, len(storage)).astype(float)
+	costs[np.random.default_rng(8).random(len(storage)) < 0.15] = math.inf
+	start, goal = storage.index(0, 0), storage.index(11, 8)
+	costs[[start, goal]] = 1.0
+
+	field = dijkstra_costs(storage, start, costs)
+	path = search(storage, start, goal, costs)
+	if field[goal] == math.inf:
+		assert path is None
+	else:
+		_assert_connected(storage, path)
+		assert _path_cost(path, costs) == field[goal]
+	return
+
+
+def test_astar_matches_cube_distance_without_costs() -> None:
+	storage = get_hex_grid(20, 20).storage
+	start, goal = storage.index(3, 17), storage.index(15, 2)
+	dq = int(storage.q[goal] - storage.q[start])
+	dr = int(storage.r[goal] - storage.r[start])
+	path = astar(storage, start, goal)
+	assert len(path) - 1 == (abs(dq) + abs(dr) + abs(dq + dr)) // 2
+	return
+
+
+def test_hex_grid_shortest_path() -> None:
+	hex_grid = get_hex_grid(4, 4)
+	assert hex_grid.shortest_path(0, 1) == [0, 1]
+	return
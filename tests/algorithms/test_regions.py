@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/algorithms/test_regions.py."""
+# Standard Library
+from collections import deque
+
+# Third Party Library
+import numpy as np
+import pytest
+
+# App
+from algorithms import (
+	distance_field,
+	flood_fill,
+	label_regions,
+	territories,
+)
+from algorithms import regions
+from hex_grid import get_hex_grid
+
+
+def _reference_labels(storage, values, mask):
+	"""Label regions with a plain per-cell BFS."""
+	labels = np.full(len(storage), -1)
+	count = 0
+	for start in range(len(storage)):
+		if labels[start] != -1 or not mask[start]:
+			continue
+		labels[start] = count
+		queue = deque([start])
+		while queue:
+			current = queue.popleft()
+			for neighbour in storage.neighbours(current):
+				if labels[neighbour] == -1 and mask[neighbour] and values[neighbour] == values[current]:
+					labels[neighbour] = count
+					queue.append(neighbour)
+		count += 1
+	return labels, count
+
+
+def _reference_distances(storage, sources, mask):
+	distances = np.full(len(storage), -1)
+	distances[sources] = 0
+	queue = deque(sources)
+	while queue:
+		current = queue.popleft()
+		for neighbour in storage.neighbours(current):
+			if distances[neighbour] == -1 and mask[neighbour]:
+				distances[neighbour] = distances[current] + 1
+				queue.append(neighbour)
+	return distances
+
+
+def _cube_distances(storage, source):
+	dq, dr = storage.q - storage.q[source], storage.r - storage.r[source]
+	return (np.abs(dq) + np.abs(dr) + np.abs(dq + dr)) // 2
+
+
+@pytest.fixture
+def storage():
+	return get_hex_grid(23, 17).storage
+
+
+@pytest.fixture
+def values(storage):
+	return np.random.default_rng(5).integers(0, 3, len(storage))
+
+
+def test_label_regions_matches_reference(storage, values) -> None:
+	mask = np.random.default_rng(6).random(len(storage)) > 0.2
+	for kwargs in ({'values': values}, {'mask': mask}, {'values': values, 'mask': mask}):
+		labels, count = label_regions(storage, **kwargs)
+		expected, expected_count = _reference_labels(
+			storage, kwargs.get('values', np.zeros(len(storage))), kwargs.get('mask', np.ones(len(storage), dtype=bool))
+		)
+		assert count == expected_count
+		np.testing.assert_array_equal(labels, expected)
+	return
+
+
+def test_label_regions_long_snake() -> None:
+	# One winding region across the whole grid, far deeper than any recursion limit.
+	storage = get_hex_grid(200, 200).storage
+	mask = np.zeros((200, 200), dtype=bool)
+	mask[::2] = True
+	mask[1::4, -1] = True
+	mask[3::4, 0] = True
+	labels, count = label_regions(storage, mask=mask.reshape(-1))
+	assert count == 1
+	assert (labels[mask.reshape(-1)] == 0).all()
+	return
+
+
+def test_flood_fill(storage, values) -> None:
+	labels, _ = label_regions(storage, values)
+	for start in (0, 100, len(storage) - 1):
+		np.testing.assert_array_equal(flood_fill(storage, start, values), np.flatnonzero(labels == labels[start]))
+	return
+
+
+def test_flood_fill_long_snake(monkeypatch) -> None:
+	# A corridor of thousands of BFS steps with one or two cells each, fills it by labeling instead.
+	storage = get_hex_grid(200, 200).storage
+	mask = np.zeros((200, 200), dtype=bool)
+	mask[::2] = True
+	mask[1::4, -1] = True
+	mask[3::4, 0] = True
+	# Cut the last row off, a separate region.
+	mask[-2] = False
+	mask = mask.reshape(-1)
+	calls = []
+
+	def spy(*args, **kwargs):
+		calls.append(args)
+		return label_regions(*args, **kwargs)
+
+	monkeypatch.setattr(regions, 'label_regions', spy)
+	filled = flood_fill(storage, 0, mask=mask)
+	assert len(calls) == 1
+	expected = np.flatnonzero(mask)
+	np.testing.assert_array_equal(filled, expected[expected < 198 * 200])
+	return
+
+
+def test_flood_fill_masked(storage) -> None:
+	mask = np.ones(len(storage), dtype=bool)
+	mask[[storage.index(5, row) for row in range(storage.rows)]] = False
+	filled = flood_fill(storage, storage.index(0, 0), mask=mask)
+	assert len(filled) == 5 * storage.rows
+	assert len(flood_fill(storage, storage.index(5, 0), mask=mask)) == 0
+	with pytest.raises(IndexError):
+		flood_fill(storage, len(storage))
+	return
+
+
+def test_distance_field_matches_reference(storage) -> None:
+	mask = np.random.default_rng(7).random(len(storage)) > 0.3
+	sources = [0, storage.index(11, 8), storage.index(22, 16)]
+	mask[sources] = True
+	np.testing.assert_array_equal(distance_field(storage, sources, mask), _reference_distances(storage, sources, mask))
+	return
+
+
+def test_distance_field_is_cube_distance(storage) -> None:
+	center = storage.index(11, 8)
+	np.testing.assert_array_equal(distance_field(storage, [center]), _cube_distances(storage, center))
+	return
+
+
+def test_distance_field_max_distance(storage) -> None:
+	distances = distance_field(storage, [storage.index(11, 8)], max_distance=3)
+	assert distances.max() == 3
+	assert np.count_nonzero(distances >= 0) == 1 + 6 + 12 + 18
+	assert np.count_nonzero(distance_field(storage, [0, 1], max_distance=0) == 0) == 2
+	with pytest.raises(ValueError):
+		distance_field(storage, [])
+	return
+
+
+def test_territories(storage) -> None:
+	sources = [storage.index(2, 2), storage.index(20, 14), storage.index(2, 2)]
+	owners, distances = territories(storage, sources)
+	assert set(np.unique(owners)) == {0, 1}
+	to_first, to_second = _cube_distances(storage, sources[0]), _cube_distances(storage, sources[1])
+	np.testing.assert_array_equal(distances, np.minimum(to_first, to_second))
+	np.testing.assert_array_equal(owners, np.where(to_first <= to_second, 0, 1))
+	return
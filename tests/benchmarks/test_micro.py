@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/benchmarks/test_micro.py."""
+# Standard Library
+import platform
+
+# Third Party Library
+import pytest
+
+# App
+from benchmarks.micro import (
+	Measurement,
+	compare,
+	count_allocations,
+	environment,
+	load_baseline,
+	measure,
+	reference_speed,
+	save_baseline,
+	skipped_checks,
+)
+
+
+def test_measure() -> None:
+	measurement = measure(lambda: 1 + 1, min_time=0.01, repeat=2)
+	assert measurement.ops_per_sec > 1000
+	assert measurement.allocations_per_op == 0
+	assert reference_speed(min_time=0.01, repeat=2) > 0
+	return
+
+
+@pytest.mark.skipif(platform.python_implementation() != 'CPython', reason='counts CPython allocator blocks')
+def test_count_allocations() -> None:
+	nothing = count_allocations(lambda: None)
+	one = count_allocations(lambda: object())
+	two = count_allocations(lambda: [object(), object()])
+	assert nothing < 0.5
+	assert one >= 1
+	# Two objects and the list holding them.
+	assert two > 2 * one
+	return
+
+
+def test_compare() -> None:
+	baseline = {'environment': environment(), 'results': {'op': {'ops_per_sec': 1000.0, 'allocations_per_op': 2.0}}}
+	assert compare('op', Measurement(900.0, 2.0), baseline, 0.25) == []
+	assert compare('other', Measurement(1.0, 9.0), baseline, 0.25) == []
+	assert len(compare('op', Measurement(700.0, 2.0), baseline, 0.25)) == 1
+	assert len(compare('op', Measurement(1000.0, 3.0), baseline, 0.25)) == 1
+
+	# Against a baseline taken while the machine ran twice as fast, half the throughput is no regression.
+	baseline['reference_speed'] = {'op': 200.0}
+	assert compare('op', Measurement(500.0, 2.0), baseline, 0.25, speed=100.0) == []
+	assert len(compare('op', Measurement(500.0, 2.0), baseline, 0.25, speed=200.0)) == 1
+
+	# Throughput from another machine is not comparable, allocations are, also on another patch release.
+	major, minor = platform.python_version_tuple()[:2]
+	baseline['environment'] = dict(baseline['environment'], platform='elsewhere', python=f'{major}.{minor}.999')
+	assert compare('op', Measurement(1.0, 2.0), baseline, 0.25) == []
+	assert len(compare('op', Measurement(1000.0, 3.0), baseline, 0.25)) == 1
+
+	baseline['environment']['python'] = '2.7.18'
+	assert compare('op', Measurement(1.0, 9.0), baseline, 0.25) == []
+	return
+
+
+def test_skipped_checks() -> None:
+	assert len(skipped_checks(None)) == 1
+	baseline = {'environment': environment(), 'results': {}}
+	assert skipped_checks(baseline) == []
+
+	baseline['environment'] = dict(baseline['environment'], platform='elsewhere')
+	skipped = skipped_checks(baseline)
+	assert len(skipped) == 1 and skipped[0].startswith('throughput not compared') and 'elsewhere' in skipped[0]
+
+	baseline['environment']['python'] = '2.7.18'
+	assert [check.split()[0] for check in skipped_checks(baseline)] == ['throughput', 'allocations']
+	return
+
+
+def test_save_baseline(tmp_path) -> None:
+	path = tmp_path / 'baseline.json'
+	assert load_baseline(path) is None
+	save_baseline(path, {'first': Measurement(10.0, 1.0)}, {'first': 5.0})
+	save_baseline(path, {'second': Measurement(20.0, 0.0)}, {'second': 6.0})
+	baseline = load_baseline(path)
+	assert baseline['environment'] == environment()
+	assert baseline['reference_speed'] == {'first': 5.0, 'second': 6.0}
+	assert baseline['results'] == {
+		'first': {'ops_per_sec': 10.0, 'allocations_per_op': 1.0},
+		'second': {'ops_per_sec': 20.0, 'allocations_per_op': 0.0},
+	}
+	return
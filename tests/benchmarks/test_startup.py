@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/benchmarks/test_startup.py."""
+# Standard Library
+import json
+
+# App
+from benchmarks.startup import (
+	_Runner,
+	compare,
+	flatten,
+	main,
+	run_benchmarks,
+)
+
+
+def test_run_benchmarks() -> None:
+	results = run_benchmarks(modules=('config',), sizes=(2, 4), repeat=1)
+	json.dumps(results)
+	assert set(results['imports']['config']) == {'cold', 'warm'}
+	assert results['imports']['config']['cold']['median_ms'] > 0
+	assert set(results['grid_build']) == {'2x2', '4x4'}
+	frame = results['first_frame']
+	assert 'skipped' in frame or frame['first_frame'] > 0
+	return
+
+
+CACHED_SCRIPT: str = '''
+import importlib.util, json, os, sys
+import geometry
+json.dump(os.path.exists(importlib.util.cache_from_source(geometry.__file__)), open(sys.argv[1], 'w'))
+'''
+
+
+def test_cold_runs_find_no_bytecode(tmp_path) -> None:
+	runner = _Runner(tmp_path)
+	assert runner.run(CACHED_SCRIPT) is True
+	# The bytecode the warm run wrote is not read by a cold run.
+	assert runner.run(CACHED_SCRIPT, cached=False) is False
+	assert runner.run(CACHED_SCRIPT) is True
+	return
+
+
+def test_compare() -> None:
+	baseline = {
+		'imports': {'grid': {'cold': {'min_ms': 10.0, 'median_ms': 10.0}}},
+		'grid_build': {'10x10': {'min_ms': 1.0, 'median_ms': 1.0}},
+		'first_frame': {'skipped': 'no display'},
+	}
+	results = json.loads(json.dumps(baseline))
+	results['imports']['grid']['cold'] = {'min_ms': 20.0, 'median_ms': 12.0}
+	results['grid_build']['10x10']['median_ms'] = 2.0
+	results['grid_build']['20x20'] = {'min_ms': 5.0, 'median_ms': 5.0}
+
+	assert flatten(baseline) == {
+		'imports.grid.cold.min_ms': 10.0,
+		'imports.grid.cold.median_ms': 10.0,
+		'grid_build.10x10.min_ms': 1.0,
+		'grid_build.10x10.median_ms': 1.0,
+	}
+	assert compare(results, baseline) == [('grid_build.10x10.median_ms', 1.0, 2.0)]
+	assert compare(results, baseline, tolerance=0.1) == [
+		('imports.grid.cold.median_ms', 10.0, 12.0),
+		('grid_build.10x10.median_ms', 1.0, 2.0),
+	]
+	return
+
+
+def test_main_writes_results(tmp_path) -> None:
+	output = tmp_path / 'startup.json'
+	assert main(['--modules', 'hex_system', '--sizes', '2', '--repeat', '1', '--no-frame', '--output', str(output)]) == 0
+	results = json.loads(output.read_text())
+	assert results['first_frame'] == {'skipped': 'disabled'}
+	assert main([
+		'--modules', 'hex_system', '--sizes', '2', '--repeat', '1', '--no-frame', '--output', str(tmp_path / 'again.json'),
+		'--baseline', str(output), '--tolerance', '1000',
+	]) == 0
+	return
@@ -10,10 +10,24 @@
 # First Party Library
 from geometry import Point
 
+# App
+import config
+
 
 LOG = logging.getLogger()
 
 
+@pytest.fixture(scope='session', autouse=True)
+def log_dir(tmp_path_factory):
+    """Write the log files of every logger the tests create to a temporary directory, not the project's."""
+    directory = tmp_path_factory.mktemp('logs')
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv('HEX_SYSTEM_LOG_DIR', str(directory))
+        monkeypatch.setattr(config, 'LOG_DIR', directory)
+        yield directory
+    return
+
+
 @pytest.fixture
 def point_0_0() -> Point:
     return Point(0, 0)
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/geometry/test_hexagon.py."""
+# Third Party Library
+import numpy as np
+
+# First Party Library
+from geometry import (
+	Hexagon,
+	Point,
+)
+
+
+def test_hexagon_corners() -> None:
+	hexagon = Hexagon(Point(28, 32))
+	assert hexagon.corners[0] == Point(28, 0)
+	assert hexagon.corners[3] == Point(28, 64)
+	assert len(hexagon.corners) == 6
+	return
+
+
+def test_hexagon_corners_match_trigonometry() -> None:
+	hexagon = Hexagon(Point(100, 200))
+	expected = [hexagon.center + hexagon._get_corner_offset(radian) for radian in hexagon.angle_radians]
+	assert hexagon.corners == expected
+	return
+
+
+def test_hexagon_corners_batch() -> None:
+	centers = [Point(28, 32), Point(56, 80), Point(-10, 7)]
+	corners = Hexagon.corners_batch([p.x for p in centers], [p.y for p in centers])
+
+	assert corners.shape == (3, 6, 2)
+	for center, hex_corners in zip(centers, corners.tolist()):
+		assert [Point(x, y) for x, y in hex_corners] == Hexagon(center).corners
+	return
+
+
+def test_hexagon_corners_batch_empty() -> None:
+	corners = Hexagon.corners_batch(np.array([], dtype=np.int32), np.array([], dtype=np.int32))
+	assert corners.shape == (0, 6, 2)
+	return
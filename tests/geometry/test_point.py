@@ -111,3 +111,10 @@ def test_point_compare(x0: Number, y0: Number, x1: Number, y1: Number) -> None:
 		assert (Point(x0, y0) >= Point(x1, y1)) is True
 
 	return
+
+
+def test_point_hash_distinguishes_diagonal() -> None:
+	points = {Point(x, 10 - x) for x in range(11)}
+	assert len({hash(point) for point in points}) == 11
+	assert hash(Point(3, 4)) == hash(Point(3, 4))
+	return
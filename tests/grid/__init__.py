@@ -0,0 +1,3 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/grid/__init__.py."""
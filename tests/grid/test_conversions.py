@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/grid/test_conversions.py."""
+# Third Party Library
+import numpy as np
+import pytest
+
+# First Party Library
+from geometry import (
+	Hexagon,
+	Point,
+)
+
+# App
+from grid import (
+	Cube,
+	HexCell,
+	Offset,
+)
+from grid.conversions import (
+	axial_round,
+	axial_to_cube,
+	axial_to_oddr,
+	axial_to_pixel,
+	cube_to_axial,
+	cube_to_oddr,
+	oddr_to_axial,
+	oddr_to_cube,
+	oddr_to_pixel,
+	pixel_to_axial,
+	pixel_to_oddr,
+)
+from grid.layout import get_layout
+
+
+LAYOUT = get_layout(Hexagon(Point(0, 0)))
+
+
+@pytest.fixture
+def offsets():
+	col, row = np.meshgrid(np.arange(-7, 8), np.arange(-9, 10))
+	return col.ravel(), row.ravel()
+
+
+def test_oddr_axial_round_trip(offsets) -> None:
+	col, row = offsets
+	q, r = oddr_to_axial(col, row)
+	back_col, back_row = axial_to_oddr(q, r)
+	assert np.array_equal(back_col, col) and np.array_equal(back_row, row)
+	return
+
+
+def test_oddr_cube_round_trip(offsets) -> None:
+	col, row = offsets
+	q, r, s = oddr_to_cube(col, row)
+	assert not np.any(q + r + s)
+	back_col, back_row = cube_to_oddr(q, r, s)
+	assert np.array_equal(back_col, col) and np.array_equal(back_row, row)
+	return
+
+
+def test_conversions_match_hex_cell(offsets) -> None:
+	col, row = offsets
+	q, r, s = oddr_to_cube(col, row)
+	for index in range(len(col)):
+		cell = HexCell(Cube(int(q[index]), int(r[index]), int(s[index])))
+		assert cell.offset == Offset(int(col[index]), int(row[index]))
+		assert HexCell.from_offset(cell.offset) == cell
+	return
+
+
+def test_conversions_keep_integer_dtype() -> None:
+	q, r = oddr_to_axial(np.array([3, 4], dtype=np.int32), np.array([1, 2], dtype=np.int32))
+	assert q.dtype == np.int32
+	assert axial_to_cube(q, r)[2].dtype == np.int32
+	return
+
+
+def test_cube_to_axial_invalid() -> None:
+	with pytest.raises(ValueError):
+		cube_to_axial([1], [1], [1])
+	return
+
+
+def test_pixel_round_trip(offsets) -> None:
+	col, row = offsets
+	x, y = oddr_to_pixel(col, row, LAYOUT)
+	back_col, back_row = pixel_to_oddr(x + 5, y - 7, LAYOUT)
+	assert np.array_equal(back_col, col) and np.array_equal(back_row, row)
+
+	q, r = oddr_to_axial(col, row)
+	assert np.array_equal(axial_to_pixel(q, r, LAYOUT)[0], x)
+	assert np.array_equal(pixel_to_axial(x, y, LAYOUT)[0], q)
+	return
+
+
+def test_axial_round() -> None:
+	assert axial_round(0.1, -0.2) == (0, 0)
+	assert axial_round(0.9, 0.05) == (1, 0)
+	assert axial_round(-1.6, 0.7) == (-2, 1)
+	return
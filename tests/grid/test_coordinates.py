@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/grid/test_coordinates.py."""
+# Standard Library
+import pickle
+
+# Third Party Library
+import pytest
+
+# App
+from grid import (
+	Cube,
+	HexCell,
+	Offset,
+)
+from grid.cube import CUBE_DIRECTIONS
+
+
+def test_cube_init() -> None:
+	cube = Cube(1, -3, 2)
+	assert (cube.q, cube.r, cube.s) == (1, -3, 2)
+	assert cube.qrs == (1, -3, 2)
+	assert cube[2] == 2
+	return
+
+
+def test_cube_invalid() -> None:
+	with pytest.raises(ValueError):
+		Cube(1, 1, 1)
+	# Sums to zero, but truncating would give the invalid (0, 0, -1).
+	with pytest.raises(ValueError):
+		Cube(0.6, 0.6, -1.2)
+	return
+
+
+def test_cube_accepts_whole_floats() -> None:
+	cube = Cube(1.0, -3.0, 2.0)
+	assert cube == (1, -3, 2)
+	assert all(type(value) is int for value in cube)
+	return
+
+
+def test_cube_is_immutable() -> None:
+	cube = Cube(1, -1, 0)
+	with pytest.raises(AttributeError):
+		cube.q = 3
+	with pytest.raises(AttributeError):
+		cube.extra = 3
+	return
+
+
+def test_cube_eq_and_hash() -> None:
+	assert Cube(1, -1, 0) == Cube(1, -1, 0)
+	assert Cube(1, -1, 0) != Cube(0, -1, 1)
+	assert hash(Cube(2, -5, 3)) == hash(Cube(2, -5, 3))
+	assert len({Cube(1, -1, 0), Cube(1, -1, 0), Cube(-1, 1, 0)}) == 2
+	return
+
+
+def test_cube_intern() -> None:
+	assert Cube.intern(1, -1, 0) is Cube.intern(1, -1, 0)
+	assert Cube.intern(100, -100, 0) == Cube(100, -100, 0)
+	assert CUBE_DIRECTIONS[0] is Cube.intern(1, -1, 0)
+	return
+
+
+def test_cube_arithmetic() -> None:
+	assert Cube(1, -1, 0) + Cube(0, 1, -1) == Cube(1, 0, -1)
+	assert Cube(1, -1, 0) - Cube(0, 1, -1) == Cube(1, -2, 1)
+	assert Cube(1, -2, 1) * 3 == Cube(3, -6, 3)
+	assert -Cube(1, -2, 1) == Cube(-1, 2, -1)
+	assert isinstance(Cube(1, -1, 0) + Cube(0, 1, -1), Cube)
+	assert 3 * Cube(1, -2, 1) == Cube(3, -6, 3)
+	assert isinstance(3 * Cube(1, -2, 1), Cube)
+	return
+
+
+def test_cube_comparison_per_component() -> None:
+	assert Cube(1, -1, 0) <= Cube(1, -1, 0)
+	assert Cube(1, -1, 0) >= Cube(1, -1, 0)
+	# Lexicographic tuple comparison would find these ordered.
+	assert not Cube(1, -1, 0) <= Cube(2, 0, -2)
+	assert not Cube(2, 0, -2) >= Cube(1, -1, 0)
+	return
+
+
+def test_cube_distance() -> None:
+	assert Cube(0, 0, 0).distance(Cube(3, -1, -2)) == 3
+	assert isinstance(Cube(0, 0, 0).distance(Cube(1, 0, -1)), int)
+	assert abs(Cube(3, -1, -2)) == 3
+	return
+
+
+def test_cube_rotation() -> None:
+	cube = Cube(1, -3, 2)
+	assert cube.rotate_clockwise().rotate_counterclockwise() == cube
+	rotated = cube
+	for _ in range(6):
+		rotated = rotated.rotate_clockwise()
+	assert rotated == cube
+	return
+
+
+def test_coordinates_pickle() -> None:
+	cube = Cube(4, -1, -3)
+	offset = Offset(2, 5)
+	assert pickle.loads(pickle.dumps(cube)) == cube
+	assert pickle.loads(pickle.dumps(offset)) == offset
+	return
+
+
+def test_offset() -> None:
+	offset = Offset(2, 5)
+	assert (offset.col, offset.row) == (2, 5)
+	assert offset + Offset(1, 1) == Offset(3, 6)
+	assert hash(offset) == hash(Offset(2, 5))
+	assert Offset.intern(1, 2) is Offset.intern(1, 2)
+	with pytest.raises(AttributeError):
+		offset.col = 3
+	return
+
+
+def test_offset_does_not_repeat() -> None:
+	with pytest.raises(TypeError):
+		Offset(1, 2) * 2
+	with pytest.raises(TypeError):
+		2 * Offset(1, 2)
+	return
+
+
+def test_offset_comparison_per_component() -> None:
+	assert Offset(1, 2) <= Offset(1, 3)
+	assert Offset(1, 3) >= Offset(1, 2)
+	assert not Offset(1, 3) <= Offset(2, 2)
+	assert not Offset(2, 2) >= Offset(1, 3)
+	with pytest.raises(TypeError):
+		Offset(1, 2) <= (1, 2)
+	return
+
+
+@pytest.mark.parametrize(('cube', 'offset'), [
+	(Cube(0, 0, 0), Offset(0, 0)),
+	(Cube(0, 1, -1), Offset(0, 1)),
+	(Cube(-1, 2, -1), Offset(0, 2)),
+	(Cube(2, 3, -5), Offset(3, 3)),
+])
+def test_hex_cell_offset(cube: Cube, offset: Offset) -> None:
+	cell = HexCell(cube)
+	assert cell.offset == offset
+	assert (cell.col, cell.row) == tuple(offset)
+	assert cell.qrs == tuple(cube)
+	return
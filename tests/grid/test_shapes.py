@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/grid/test_shapes.py."""
+# Third Party Library
+import pytest
+
+# App
+from grid import (
+	Cube,
+	HexCell,
+)
+from grid.shapes import (
+	hex_range_array,
+	hex_ring_array,
+	hex_spiral_array,
+)
+
+
+CENTER = Cube(2, -5, 3)
+
+
+@pytest.mark.parametrize('radius', [0, 1, 2, 5])
+def test_cube_range(radius: int) -> None:
+	cubes = list(CENTER.range(radius))
+	assert len(cubes) == 1 + 3 * radius * (radius + 1)
+	assert len(set(cubes)) == len(cubes)
+	assert all(CENTER.distance(cube) <= radius for cube in cubes)
+	return
+
+
+@pytest.mark.parametrize('radius', [0, 1, 3])
+def test_cube_ring(radius: int) -> None:
+	cubes = list(CENTER.ring(radius))
+	assert len(cubes) == max(1, 6 * radius)
+	assert len(set(cubes)) == len(cubes)
+	assert all(CENTER.distance(cube) == radius for cube in cubes)
+	for current, following in zip(cubes, cubes[1:]):
+		assert current.distance(following) == 1
+	return
+
+
+def test_cube_spiral() -> None:
+	cubes = list(CENTER.spiral(3))
+	assert cubes[0] == CENTER
+	assert set(cubes) == set(CENTER.range(3))
+	assert [CENTER.distance(cube) for cube in cubes] == sorted(CENTER.distance(cube) for cube in cubes)
+	return
+
+
+def test_cube_range_is_lazy() -> None:
+	cubes = CENTER.range(10 ** 9)
+	assert next(cubes).distance(CENTER) == 10 ** 9
+	return
+
+
+def test_cube_range_intersection() -> None:
+	other = Cube(4, -4, 0)
+	expected = {cube for cube in CENTER.range(3) if other.distance(cube) <= 2}
+	cubes = list(CENTER.range_intersection(3, other, 2))
+	assert len(cubes) == len(expected)
+	assert set(cubes) == expected
+	assert list(CENTER.range_intersection(1, Cube(20, -20, 0), 1)) == []
+	return
+
+
+def test_hex_cell_generators() -> None:
+	cell = HexCell(CENTER)
+	assert [c.cube for c in cell.ring(2)] == list(CENTER.ring(2))
+	assert len(list(cell.spiral(2))) == 19
+	assert len(list(cell.neighbours())) == 6
+	return
+
+
+@pytest.mark.parametrize(('array_function', 'generator'), [
+	(hex_range_array, Cube.range),
+	(hex_ring_array, Cube.ring),
+	(hex_spiral_array, Cube.spiral),
+])
+def test_shape_arrays_match_generators(array_function, generator) -> None:
+	q, r, s = array_function(CENTER, 4)
+	assert list(zip(q.tolist(), r.tolist(), s.tolist())) == list(generator(CENTER, 4))
+	return
@@ -0,0 +1,13 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/gui/conftest.py."""
+# Third Party Library
+import pytest
+
+# App
+from tests.gui.fakes import FakeCanvas
+
+
+@pytest.fixture
+def canvas() -> FakeCanvas:
+	return FakeCanvas()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/gui/fakes.py."""
+# Standard Library
+from typing import (
+	Callable,
+	Dict,
+	List,
+)
+
+
+__all__ = ['FakeCanvas']
+
+
+class FakeCanvas:
+	"""Records the calls a Tk canvas would receive, no display needed."""
+
+	def __init__(self) -> None:
+		self.items: Dict[int, Dict] = {}
+		self.created: int = 0
+		self.configured: List[int] = []
+		self.moved: List[int] = []
+		self.idle: Dict[str, Callable] = {}
+		return
+
+	def create_polygon(self, *coords, **options) -> int:
+		self.created += 1
+		item = self.created
+		self.items[item] = {'coords': coords, **options}
+		return item
+
+	def coords(self, item: int, *coords) -> None:
+		self.items[item]['coords'] = coords
+		self.moved.append(item)
+		return
+
+	def itemconfigure(self, item: int, **options) -> None:
+		self.items[item].update(options)
+		self.configured.append(item)
+		return
+
+	def after_idle(self, callback: Callable) -> str:
+		after_id = f'after#{len(self.idle)}'
+		self.idle[after_id] = callback
+		return after_id
+
+	def after_cancel(self, after_id: str) -> None:
+		self.idle.pop(after_id, None)
+		return
+
+	def delete(self, *items: int) -> None:
+		for item in items:
+			del self.items[item]
+		return
+
+	def run_idle(self) -> None:
+		idle, self.idle = self.idle, {}
+		for callback in idle.values():
+			callback()
+		return
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/gui/test_camera.py."""
+# Third Party Library
+import pytest
+
+# App
+from gui.camera import Camera
+
+
+def test_camera_viewport() -> None:
+	camera = Camera(200, 100, x=10, y=20, zoom=2.0)
+	viewport = camera.viewport
+	assert (viewport.left, viewport.top, viewport.right, viewport.bottom) == (10, 20, 110, 70)
+	return
+
+
+def test_camera_pan_is_in_screen_pixels() -> None:
+	camera = Camera(200, 100, zoom=2.0)
+	camera.pan(40, -20)
+	assert camera.state == (20, -10, 2.0)
+	return
+
+
+def test_camera_zoom_keeps_point_under_cursor() -> None:
+	camera = Camera(200, 100, x=5, y=5)
+	before = camera.to_world(50, 30)
+	camera.zoom_at(2.0, 50, 30)
+	assert camera.zoom == 2.0
+	assert camera.to_world(50, 30) == pytest.approx(before)
+	assert camera.to_screen(*before) == pytest.approx((50, 30))
+	return
+
+
+def test_camera_zoom_is_clamped() -> None:
+	camera = Camera(200, 100, min_zoom=0.5, max_zoom=2.0)
+	camera.zoom_at(10, 0, 0)
+	assert camera.zoom == 2.0
+	camera.zoom_at(0.01, 0, 0)
+	assert camera.zoom == 0.5
+	return
+
+
+def test_camera_rejects_empty_screen() -> None:
+	with pytest.raises(ValueError):
+		Camera(0, 100)
+	return
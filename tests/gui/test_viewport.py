@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/gui/test_viewport.py."""
+# Third Party Library
+import pytest
+
+# App
+from gui.camera import Camera
+from gui.viewport import ViewportRenderer
+from hex_grid import get_hex_grid
+from tests.gui.fakes import FakeCanvas
+
+
+@pytest.fixture
+def renderer(canvas: FakeCanvas) -> ViewportRenderer:
+	return ViewportRenderer(canvas, get_hex_grid(200, 200), Camera(300, 200), fill='green', outline='black')
+
+
+def test_viewport_draws_only_visible_cells(canvas: FakeCanvas, renderer: ViewportRenderer) -> None:
+	drawn = renderer.render()
+	assert 0 < drawn < 40
+	assert canvas.created == drawn
+	assert 0 in renderer.active
+	assert 200 * 200 - 1 not in renderer.active
+	return
+
+
+def test_viewport_recycles_items_when_scrolling(canvas: FakeCanvas, renderer: ViewportRenderer) -> None:
+	renderer.render()
+	created = canvas.created
+
+	for _ in range(50):
+		renderer.camera.pan(37, 23)
+		renderer.render()
+	assert 0 not in renderer.active
+	# Scrolling far only ever needs a few more items than fit on screen at once.
+	assert canvas.created < created * 2
+	assert len(renderer.active) + renderer.pool_size == canvas.created
+	for item in renderer.active.values():
+		assert canvas.items[item].get('state', 'normal') == 'normal'
+	return
+
+
+def test_viewport_skips_unmoved_cells(canvas: FakeCanvas, renderer: ViewportRenderer) -> None:
+	renderer.render()
+	canvas.moved.clear()
+	renderer.render()
+	assert canvas.moved == []
+	return
+
+
+def test_viewport_coords_follow_camera(canvas: FakeCanvas, renderer: ViewportRenderer) -> None:
+	renderer.render()
+	item = renderer.active[0]
+	x, y = canvas.items[item]['coords'][:2]
+
+	renderer.camera.pan(10, 5)
+	renderer.render()
+	assert canvas.items[item]['coords'][:2] == pytest.approx((x - 10, y - 5))
+	return
+
+
+def test_viewport_styles_survive_recycling(canvas: FakeCanvas, renderer: ViewportRenderer) -> None:
+	renderer.render()
+	renderer.set_fill(0, 'red')
+	assert len(canvas.idle) == 1
+	canvas.run_idle()
+	assert canvas.items[renderer.active[0]]['fill'] == 'red'
+
+	renderer.camera.move_to(5000, 5000)
+	renderer.render()
+	renderer.camera.move_to(0, 0)
+	renderer.render()
+	assert canvas.items[renderer.active[0]]['fill'] == 'red'
+	assert renderer.style(1) == {'fill': 'green', 'outline': 'black'}
+	return
+
+
+def test_viewport_skips_unchanged_styles(canvas: FakeCanvas, renderer: ViewportRenderer) -> None:
+	renderer.render()
+	renderer.set_fill(0, 'green')
+	assert canvas.idle == {}
+	renderer.render()
+	assert canvas.configured == []
+	return
+
+
+def test_viewport_rejects_unknown_option(renderer: ViewportRenderer) -> None:
+	with pytest.raises(TypeError):
+		renderer.set_style(0, stipple='gray50')
+	return
+
+
+def test_viewport_clear(canvas: FakeCanvas, renderer: ViewportRenderer) -> None:
+	renderer.render()
+	renderer.camera.pan(500, 0)
+	renderer.render()
+	renderer.clear()
+	assert canvas.items == {}
+	assert renderer.active == {}
+	return
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/render/test_image.py."""
+# Standard Library
+import struct
+import zlib
+
+# Third Party Library
+import numpy as np
+import pytest
+
+# App
+from render import (
+	encode_png,
+	encode_ppm,
+	write_png,
+)
+
+
+@pytest.fixture
+def image() -> np.ndarray:
+	return np.random.default_rng(5).integers(0, 256, (7, 9, 4), dtype=np.uint8)
+
+
+def test_encode_png_round_trip(image: np.ndarray) -> None:
+	data = encode_png(image)
+	assert data[:8] == b'\x89PNG\r\n\x1a\n'
+
+	width, height = struct.unpack('>II', data[16:24])
+	assert (width, height) == (9, 7)
+
+	idat_length = struct.unpack('>I', data[33:37])[0]
+	assert data[37:41] == b'IDAT'
+	raw = np.frombuffer(zlib.decompress(data[41:41 + idat_length]), dtype=np.uint8).reshape(7, -1)
+	assert not raw[:, 0].any()
+	np.testing.assert_array_equal(raw[:, 1:].reshape(image.shape), image)
+	assert data.endswith(b'IEND\xaeB`\x82')
+	return
+
+
+def test_encode_ppm_drops_alpha(image: np.ndarray) -> None:
+	data = encode_ppm(image)
+	header = b'P6\n9 7\n255\n'
+	assert data.startswith(header)
+	np.testing.assert_array_equal(np.frombuffer(data[len(header):], dtype=np.uint8).reshape(7, 9, 3), image[..., :3])
+	return
+
+
+def test_encode_rejects_non_rgba() -> None:
+	with pytest.raises(ValueError):
+		encode_png(np.zeros((4, 4, 3), dtype=np.uint8))
+	return
+
+
+def test_write_png(tmp_path, image: np.ndarray) -> None:
+	path = tmp_path / 'map.png'
+	write_png(path, image)
+	assert path.read_bytes() == encode_png(image)
+	return
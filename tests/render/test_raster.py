@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/render/test_raster.py."""
+# Third Party Library
+import numpy as np
+import pytest
+
+# App
+from hex_grid import get_hex_grid
+from render import (
+	image_size,
+	parse_color,
+	rasterize,
+)
+
+
+def test_parse_color() -> None:
+	assert parse_color('#859900') == (0x85, 0x99, 0x00, 255)
+	assert parse_color('#01020304') == (1, 2, 3, 4)
+	assert parse_color((1, 2, 3)) == (1, 2, 3, 255)
+	with pytest.raises(ValueError):
+		parse_color('#123')
+	return
+
+
+def test_rasterize_size_and_background() -> None:
+	hex_grid = get_hex_grid(6, 5)
+	image = rasterize(hex_grid, '#ff0000', scale=0.5, background='#00000000')
+	width, height = image_size(hex_grid, 0.5)
+	assert image.shape == (height, width, 4)
+	assert image.dtype == np.uint8
+	# The top left corner lies between hexes.
+	assert tuple(image[0, 0]) == (0, 0, 0, 0)
+	return
+
+
+def test_rasterize_colors_each_cell_at_its_center() -> None:
+	hex_grid = get_hex_grid(7, 6)
+	storage = hex_grid.storage
+	fill = np.random.default_rng(3).integers(0, 256, (len(storage), 4), dtype=np.uint8)
+	image = rasterize(hex_grid, fill)
+	np.testing.assert_array_equal(image[storage.y, storage.x], fill)
+	return
+
+
+def test_rasterize_leaves_no_gaps_inside_the_grid() -> None:
+	hex_grid = get_hex_grid(8, 8)
+	image = rasterize(hex_grid, '#ffffff', scale=0.3)
+	height, width, _ = image.shape
+	# Away from the ragged border, hexes tile the plane exactly.
+	inner = image[height // 4:3 * height // 4, width // 4:3 * width // 4, 3]
+	assert inner.all()
+	return
+
+
+def test_rasterize_rejects_bad_fill() -> None:
+	with pytest.raises(ValueError):
+		rasterize(get_hex_grid(3, 3), np.zeros((2, 3), dtype=np.uint8))
+	return
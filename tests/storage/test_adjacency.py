@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/storage/test_adjacency.py."""
+# Third Party Library
+import numpy as np
+import pytest
+
+# App
+from storage import Adjacency
+from storage.adjacency import (
+	SENTINEL,
+	build_adjacency,
+)
+
+
+# Neighbours in East, North-East, North-West, West, South-West, South-East order on a 5x4 grid, worked out by hand.
+EXPECTED_5X4 = {
+	# Interior cell on an even row.
+	(2, 2): [13, 7, 6, 11, 16, 17],
+	# Cell on an odd (and last) row, the southern neighbours fall off the grid.
+	(2, 3): [18, 13, 12, 16, SENTINEL, SENTINEL],
+	# Top-left corner.
+	(0, 0): [1, SENTINEL, SENTINEL, SENTINEL, SENTINEL, 5],
+	# Last column of an odd row, the eastern neighbours fall off the grid.
+	(4, 1): [SENTINEL, SENTINEL, 4, 8, 14, SENTINEL],
+}
+
+
+@pytest.mark.parametrize(('col', 'row'), list(EXPECTED_5X4))
+def test_build_adjacency_matches_reference(col: int, row: int) -> None:
+	table = build_adjacency(5, 4)
+	assert table.shape == (5 * 4, 6)
+	assert table.dtype == np.int32
+	assert table[row * 5 + col].tolist() == EXPECTED_5X4[(col, row)]
+	return
+
+
+def test_build_adjacency_single_cell() -> None:
+	assert build_adjacency(1, 1).tolist() == [[SENTINEL] * 6]
+	return
+
+
+def test_adjacency_is_symmetric() -> None:
+	adjacency = Adjacency(6, 5)
+	for index in range(len(adjacency)):
+		for neighbour in adjacency.neighbours(index):
+			assert index in adjacency.neighbours(neighbour)
+	return
+
+
+def test_adjacency_interior_degree() -> None:
+	adjacency = Adjacency(5, 5)
+	assert adjacency.degree[2 * 5 + 2] == 6
+	assert adjacency.degree[0] == 2
+	return
+
+
+def test_adjacency_to_csr() -> None:
+	adjacency = Adjacency(4, 3)
+	indptr, indices = adjacency.to_csr()
+	assert indptr[-1] == len(indices) == int(adjacency.degree.sum())
+	for index in range(len(adjacency)):
+		assert indices[indptr[index]:indptr[index + 1]].tolist() == adjacency.neighbours(index)
+	return
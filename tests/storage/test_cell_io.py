@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/storage/test_cell_io.py."""
+# Standard Library
+import io
+
+# Third Party Library
+import numpy as np
+import pytest
+
+# First Party Library
+from geometry import (
+	Hexagon,
+	Point,
+)
+
+# App
+from grid import (
+	Cube,
+	Offset,
+)
+from grid.layout import get_layout
+from storage import (
+	ColumnarGrid,
+	iter_cells,
+	load_cells,
+)
+from storage.cell_io import (
+	CUBE,
+	OFFSET,
+	read_binary,
+	read_csv,
+	read_jsonl,
+	write_binary,
+	write_csv,
+	write_jsonl,
+)
+
+
+def _grid() -> ColumnarGrid:
+	return ColumnarGrid(7, 5, get_layout(Hexagon(Point(0, 0))))
+
+
+@pytest.fixture
+def storage() -> ColumnarGrid:
+	storage = _grid()
+	storage.add_column('terrain', dtype=np.uint8)
+	storage.add_column('elevation', dtype=np.float32)
+	storage.column('terrain')[:] = np.arange(len(storage)) % 4
+	storage.column('elevation')[:] = np.linspace(-1, 1, len(storage))
+	return storage
+
+
+def _assert_same_columns(loaded: ColumnarGrid, storage: ColumnarGrid) -> None:
+	for name in ('terrain', 'elevation'):
+		np.testing.assert_array_equal(loaded.column(name), storage.column(name))
+	return
+
+
+def test_iter_cells_keys(storage: ColumnarGrid) -> None:
+	records = list(iter_cells(storage, ['terrain'], batch_size=4))
+	assert len(records) == len(storage)
+	assert records[8] == (Offset(1, 1), {'terrain': 0})
+
+	cube, values = list(iter_cells(storage, ['terrain'], key=CUBE))[8]
+	assert isinstance(cube, Cube)
+	assert cube == Cube(int(storage.q[8]), int(storage.r[8]), -int(storage.q[8]) - int(storage.r[8]))
+	return
+
+
+@pytest.mark.parametrize('key', [OFFSET, CUBE])
+def test_csv_round_trip(storage: ColumnarGrid, key: str) -> None:
+	file = io.StringIO(newline='')
+	assert write_csv(file, iter_cells(storage, ['terrain', 'elevation']), ['terrain', 'elevation'], key=key) == 35
+	file.seek(0)
+
+	loaded = _grid()
+	load_cells(loaded, read_csv(file), dtypes={'terrain': np.uint8, 'elevation': np.float32}, batch_size=8)
+	_assert_same_columns(loaded, storage)
+	return
+
+
+def test_csv_bool_round_trip() -> None:
+	storage = _grid()
+	storage.add_column('blocking', dtype=bool)
+	storage.column('blocking')[:] = np.arange(len(storage)) % 3 == 0
+	file = io.StringIO(newline='')
+	write_csv(file, iter_cells(storage, ['blocking']), ['blocking'])
+	file.seek(0)
+
+	loaded = _grid()
+	load_cells(loaded, read_csv(file), dtypes={'blocking': bool})
+	np.testing.assert_array_equal(loaded.column('blocking'), storage.column('blocking'))
+
+	load_cells(loaded, [(Offset(0, 0), {'blocking': '0'}), (Offset(1, 0), {'blocking': '1'})])
+	assert loaded.column('blocking')[:2].tolist() == [False, True]
+	with pytest.raises(ValueError):
+		load_cells(loaded, [(Offset(0, 0), {'blocking': 'yes'})])
+	return
+
+
+@pytest.mark.parametrize('key', [OFFSET, CUBE])
+def test_jsonl_round_trip(storage: ColumnarGrid, key: str) -> None:
+	file = io.StringIO()
+	write_jsonl(file, iter_cells(storage, ['terrain', 'elevation'], key=key), ['terrain', 'elevation'], key=key)
+	file.seek(0)
+	first = file.readline()
+	assert first.startswith('{"q":' if key == CUBE else '{"col":0,"row":0,')
+	file.seek(0)
+
+	loaded = _grid()
+	load_cells(loaded, read_jsonl(file), dtypes={'terrain': np.uint8, 'elevation': np.float32})
+	_assert_same_columns(loaded, storage)
+	return
+
+
+@pytest.mark.parametrize('key', [OFFSET, CUBE])
+def test_binary_round_trip(storage: ColumnarGrid, key: str) -> None:
+	file = io.BytesIO()
+	dtypes = {'terrain': np.uint8, 'elevation': np.float32}
+	write_binary(file, iter_cells(storage, list(dtypes)), dtypes, key=key, batch_size=6)
+	file.seek(0)
+
+	records = list(read_binary(file))
+	assert len(records) == 35
+	assert isinstance(records[0][0], Cube if key == CUBE else Offset)
+
+	loaded = _grid()
+	load_cells(loaded, records, dtypes=dtypes)
+	_assert_same_columns(loaded, storage)
+	return
+
+
+def test_binary_rejects_truncated_file(storage: ColumnarGrid) -> None:
+	file = io.BytesIO()
+	write_binary(file, iter_cells(storage, ['terrain']), {'terrain': np.uint8})
+	truncated = io.BytesIO(file.getvalue()[:-3])
+	with pytest.raises(ValueError):
+		list(read_binary(truncated))
+	return
+
+
+def test_load_cells_errors(storage: ColumnarGrid) -> None:
+	with pytest.raises(KeyError):
+		load_cells(storage, [(Offset(0, 0), {'owner': 1})])
+	with pytest.raises(IndexError):
+		load_cells(storage, [(Offset(7, 0), {'terrain': 1})])
+	# Columns are taken from the first record, later records may not add or drop any.
+	for values in ({'terrain': 1, 'elevation': 0.5}, {}):
+		with pytest.raises(ValueError):
+			load_cells(storage, [(Offset(0, 0), {'terrain': 1}), (Offset(1, 0), values)], batch_size=1)
+	return
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/storage/test_chunked.py."""
+# Third Party Library
+import numpy as np
+import pytest
+
+# App
+from grid import (
+	Cube,
+	HexCell,
+	Offset,
+)
+from storage import ChunkedGrid
+
+
+@pytest.fixture
+def chunked(tmp_path) -> ChunkedGrid:
+	chunked = ChunkedGrid(chunk_cols=4, chunk_rows=4, max_chunks=2, directory=tmp_path)
+	chunked.add_column('height', dtype=np.int16, fill=-1)
+	return chunked
+
+
+def test_chunked_reads_do_not_allocate(chunked: ChunkedGrid) -> None:
+	assert chunked.get(1000, -1000, 'height') == -1
+	assert chunked.keys == set()
+	return
+
+
+def test_chunked_writes_allocate_lazily(chunked: ChunkedGrid) -> None:
+	chunked.set(5, -1, 'height', 7)
+	assert chunked.keys == {(1, -1)}
+	assert chunked.get(5, -1, 'height') == 7
+	assert chunked.get(4, -1, 'height') == -1
+	return
+
+
+def test_chunked_evicts_to_disk_and_reloads(chunked: ChunkedGrid) -> None:
+	for chunk_col in range(5):
+		chunked.set(chunk_col * 4, 0, 'height', chunk_col)
+	assert len(chunked.loaded) == 2
+	assert len(list(chunked.directory.glob('chunk_*.npz'))) == 3
+
+	assert [chunked.get(chunk_col * 4, 0, 'height') for chunk_col in range(5)] == [0, 1, 2, 3, 4]
+	assert len(chunked.loaded) == 2
+
+	chunked.close()
+	reopened = ChunkedGrid(chunk_cols=4, chunk_rows=4, directory=chunked.directory)
+	reopened.add_column('height', dtype=np.int16, fill=-1)
+	assert reopened.get(16, 0, 'height') == 4
+	return
+
+
+def test_chunked_regions_cross_chunk_boundaries(chunked: ChunkedGrid) -> None:
+	values = np.arange(9 * 7, dtype=np.int16).reshape(7, 9)
+	chunked.write_region(-3, -2, 'height', values)
+	np.testing.assert_array_equal(chunked.read_region(-3, -2, 5, 4, 'height'), values)
+	assert chunked.get(5, 4, 'height') == values[-1, -1]
+
+	region = chunked.read_region(-4, -2, 5, 4, 'height')
+	assert (region[:, 0] == -1).all()
+	return
+
+
+def test_chunked_iter_cells(chunked: ChunkedGrid) -> None:
+	chunked.set(-1, -1, 'height', 3)
+	chunked.set(9, 9, 'height', 4)
+	cells = {(col, row): value for col, row, value in chunked.iter_cells('height') if value != -1}
+	assert cells == {(-1, -1): 3, (9, 9): 4}
+	assert len(list(chunked.iter_cells('height'))) == 2 * 16
+	return
+
+
+def test_chunked_cube_access_matches_offsets(chunked: ChunkedGrid) -> None:
+	cell = HexCell(Cube(3, -6, 3))
+	chunked.set_cube(cell.cube, 'height', 11)
+	assert chunked.get(*cell.offset, 'height') == 11
+	assert chunked.get_cube(cell.cube, 'height') == 11
+	return
+
+
+def test_chunked_neighbours_match_cube_neighbours(chunked: ChunkedGrid) -> None:
+	for col, row in ((0, 0), (3, 3), (-1, 4), (4, -5)):
+		cell = HexCell.from_offset(Offset(col, row))
+		expected = {tuple(HexCell(cube).offset) for cube in cell.cube.neighbours()}
+		assert set(chunked.neighbours(col, row)) == expected
+	return
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/storage/test_columnar.py."""
+# Third Party Library
+import numpy as np
+import pytest
+
+# First Party Library
+from geometry import (
+	Hexagon,
+	Point,
+	Rectangle,
+)
+
+# App
+from grid.layout import get_layout
+from hex_grid import get_hex_grid
+from storage import ColumnarGrid
+
+
+@pytest.fixture
+def storage() -> ColumnarGrid:
+	return ColumnarGrid(4, 3, get_layout(Hexagon(Point(0, 0))))
+
+
+def test_columnar_size(storage: ColumnarGrid) -> None:
+	assert len(storage) == 12
+	assert storage.size == (4, 3)
+	assert storage.q.dtype == np.int32
+	return
+
+
+def test_columnar_rejects_empty() -> None:
+	with pytest.raises(ValueError):
+		ColumnarGrid(0, 3, get_layout(Hexagon(Point(0, 0))))
+	return
+
+
+def test_columnar_axial_coordinates(storage: ColumnarGrid) -> None:
+	# Odd-r offset: (col, row) -> q = col - (row - (row & 1)) // 2, r = row
+	index = storage.index(1, 2)
+	assert (storage.q[index], storage.r[index]) == (0, 2)
+	assert storage.offset(index) == (1, 2)
+	return
+
+
+def test_columnar_odd_rows_are_shifted(storage: ColumnarGrid) -> None:
+	layout = storage.layout
+	even = storage.center(storage.index(0, 0))
+	odd = storage.center(storage.index(0, 1))
+	assert odd.x - even.x == layout.x_shift
+	assert odd.y - even.y == layout.y_step
+	return
+
+
+def test_columnar_index_out_of_grid(storage: ColumnarGrid) -> None:
+	with pytest.raises(IndexError):
+		storage.index(4, 0)
+	return
+
+
+def test_columnar_index_at_center(storage: ColumnarGrid) -> None:
+	for index in range(len(storage)):
+		center = storage.center(index)
+		assert storage.index_at_center(center.x, center.y) == index
+	assert storage.index_at_center(0, 0) is None
+	return
+
+
+def test_columnar_add_column(storage: ColumnarGrid) -> None:
+	terrain = storage.add_column('terrain', dtype=np.uint8, fill=3)
+	assert storage.column('terrain') is terrain
+	assert terrain.shape == (12,)
+	assert int(terrain[5]) == 3
+
+	with pytest.raises(ValueError):
+		storage.add_column('terrain')
+	return
+
+
+def test_hex_grid_hexes_are_lazy_views() -> None:
+	hex_grid = get_hex_grid(3, 2)
+	assert len(hex_grid.hexes) == 6
+	assert hex_grid.hexes[-1].center == hex_grid.storage.center(5)
+
+	hexagon = hex_grid.hexes[4]
+	assert hex_grid.grid[hexagon.center].center == hexagon.center
+	assert [h.center for h in hex_grid.top_row()] == [hex_grid.storage.center(i) for i in range(3)]
+	return
+
+
+def test_columnar_index_at_pixel_centers(storage: ColumnarGrid) -> None:
+	for index in range(len(storage)):
+		center = storage.center(index)
+		assert storage.index_at_pixel(center.x, center.y) == index
+	return
+
+
+def test_columnar_index_at_pixel_near_center() -> None:
+	storage = get_hex_grid(9, 7).storage
+	rng = np.random.default_rng(3)
+	for index in range(len(storage)):
+		center = storage.center(index)
+		for dx, dy in rng.uniform(-20, 20, (8, 2)):
+			assert storage.index_at_pixel(center.x + dx, center.y + dy) == index
+	return
+
+
+def test_columnar_index_at_pixel_outside(storage: ColumnarGrid) -> None:
+	assert storage.index_at_pixel(-100, -100) is None
+	assert storage.index_at_pixel(10_000, 32) is None
+	return
+
+
+def test_columnar_indices_at_pixels_match_scalar() -> None:
+	storage = get_hex_grid(9, 7).storage
+	rng = np.random.default_rng(5)
+	xs = rng.uniform(-60, 600, 2000)
+	ys = rng.uniform(-60, 420, 2000)
+	indices = storage.indices_at_pixels(xs, ys)
+	expected = [storage.index_at_pixel(x, y) for x, y in zip(xs, ys)]
+	assert indices.tolist() == [-1 if index is None else index for index in expected]
+	return
+
+
+def test_hex_grid_index_at_pixel() -> None:
+	hex_grid = get_hex_grid(4, 4)
+	center = hex_grid.storage.center(6)
+	assert hex_grid.index_at_pixel(center.x + 3, center.y - 3) == 6
+	assert hex_grid.indices_at_pixels([center.x], [center.y]).tolist() == [6]
+	return
+
+
+def test_hex_grid_indices_in_rect_match_bounding_boxes() -> None:
+	hex_grid = get_hex_grid(30, 20)
+	half_width, half_height = hex_grid.hexagon.width / 2, hex_grid.hexagon.height / 2
+	for left, top, right, bottom in ((0, 0, 100, 100), (-50, -50, 10, 10), (333, 215, 701, 408), (5000, 0, 6000, 10)):
+		rect = Rectangle(Point(left, top), Point(right, bottom))
+		x, y = hex_grid.storage.x, hex_grid.storage.y
+		expected = np.flatnonzero(
+			(x + half_width >= left) & (x - half_width <= right) & (y + half_height >= top) & (y - half_height <= bottom)
+		)
+		np.testing.assert_array_equal(hex_grid.indices_in_rect(rect), expected)
+	return
+
+
+@pytest.mark.parametrize(('cols', 'rows'), [(1, 1), (3, 1), (3, 2), (2000, 3)])
+def test_hex_grid_rect_bounds_cells(cols: int, rows: int) -> None:
+	hex_grid = get_hex_grid(cols, rows)
+	right = (hex_grid.storage.x + hex_grid.hexagon.width / 2).max()
+	bottom = (hex_grid.storage.y + hex_grid.hexagon.height / 2).max()
+	assert hex_grid.rect.origin == Point(0, 0)
+	assert 0 <= hex_grid.rect.right - right < 1
+	assert 0 <= hex_grid.rect.bottom - bottom < 1
+	return
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/storage/test_mapped.py."""
+# Third Party Library
+import numpy as np
+import pytest
+
+# App
+from hex_grid import (
+	HexGrid,
+	get_hex_grid,
+	open_hex_grid,
+)
+from storage import open_grid
+from storage.mapped import (
+	ALIGNMENT,
+	read_header,
+)
+
+
+@pytest.fixture
+def hex_grid() -> HexGrid:
+	hex_grid = get_hex_grid(13, 9)
+	hex_grid.storage.add_column('terrain', dtype=np.uint8, fill=2)
+	hex_grid.storage.add_column('elevation', dtype=np.float32)
+	hex_grid.storage.column('elevation')[:] = np.linspace(0, 1, 13 * 9)
+	return hex_grid
+
+
+def test_mapped_round_trip(tmp_path, hex_grid: HexGrid) -> None:
+	path = tmp_path / 'map.hexgrid'
+	hex_grid.save(path)
+	opened = open_hex_grid(path)
+
+	assert opened.size == hex_grid.size
+	assert opened.storage.layout == hex_grid.storage.layout
+	for name in ('q', 'r', 'x', 'y'):
+		np.testing.assert_array_equal(getattr(opened.storage, name), getattr(hex_grid.storage, name))
+	for name, column in hex_grid.storage.columns.items():
+		assert opened.storage.column(name).dtype == column.dtype
+		np.testing.assert_array_equal(opened.storage.column(name), column)
+	assert opened.neighbours(20) == hex_grid.neighbours(20)
+	return
+
+
+def test_mapped_header_and_alignment(tmp_path, hex_grid: HexGrid) -> None:
+	path = tmp_path / 'map.hexgrid'
+	hex_grid.save(path)
+	header = read_header(path)
+	assert (header.cols, header.rows, header.side) == (13, 9, hex_grid.hexagon.side)
+	assert [name for name, *_ in header.columns] == ['q', 'r', 'x', 'y', 'terrain', 'elevation']
+	assert all(offset % ALIGNMENT == 0 for _, _, offset, _ in header.columns)
+	return
+
+
+def test_mapped_modes(tmp_path, hex_grid: HexGrid) -> None:
+	path = tmp_path / 'map.hexgrid'
+	hex_grid.save(path)
+
+	read_only, _ = open_grid(path)
+	with pytest.raises(ValueError):
+		read_only.column('terrain')[0] = 9
+
+	private, _ = open_grid(path, 'c')
+	private.column('terrain')[0] = 9
+	assert open_grid(path)[0].column('terrain')[0] == 2
+
+	shared, _ = open_grid(path, 'r+')
+	shared.column('terrain')[0] = 7
+	assert open_grid(path)[0].column('terrain')[0] == 7
+	return
+
+
+@pytest.mark.parametrize('dtype', [object, np.dtype([('name', object), ('size', np.int32)])])
+def test_mapped_rejects_object_columns(tmp_path, hex_grid: HexGrid, dtype) -> None:
+	hex_grid.storage.add_column('names', dtype=dtype)
+	path = tmp_path / 'map.hexgrid'
+	with pytest.raises(ValueError):
+		hex_grid.save(path)
+	assert not path.exists()
+	return
+
+
+def test_mapped_rejects_other_files(tmp_path) -> None:
+	path = tmp_path / 'not_a_grid'
+	path.write_bytes(b'\x00' * 128)
+	with pytest.raises(ValueError):
+		open_grid(path)
+	return
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/storage/test_parallel.py."""
+# Standard Library
+from typing import Dict
+
+# Third Party Library
+import numpy as np
+
+# App
+from hex_grid import get_hex_grid
+from storage.parallel import fill_rows_parallel
+
+
+COLS: int = 11
+
+
+def _row_numbers(row_start: int, row_stop: int) -> Dict[str, np.ndarray]:
+	row = np.repeat(np.arange(row_start, row_stop), COLS)
+	return {'row': row, 'half': row / 2}
+
+
+def test_fill_rows_parallel_matches_serial() -> None:
+	dtypes = {'row': np.int64, 'half': np.float64}
+	serial = fill_rows_parallel(COLS, 37, dtypes, _row_numbers, workers=1)
+	parallel = fill_rows_parallel(COLS, 37, dtypes, _row_numbers, workers=3)
+	for name in dtypes:
+		assert parallel[name].dtype == np.dtype(dtypes[name])
+		np.testing.assert_array_equal(parallel[name], serial[name])
+	return
+
+
+def test_get_hex_grid_parallel_matches_serial() -> None:
+	serial = get_hex_grid(23, 17)
+	parallel = get_hex_grid(23, 17, workers=2)
+	for name in ('q', 'r', 'x', 'y'):
+		np.testing.assert_array_equal(getattr(parallel.storage, name), getattr(serial.storage, name))
+	assert parallel.neighbours(40) == serial.neighbours(40)
+	return
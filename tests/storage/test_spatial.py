@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/storage/test_spatial.py."""
+# Third Party Library
+import numpy as np
+import pytest
+
+# First Party Library
+from geometry import (
+	Point,
+	Rectangle,
+)
+
+# App
+from hex_grid import get_hex_grid
+from storage import SpatialIndex
+
+
+@pytest.fixture
+def points() -> np.ndarray:
+	return np.random.default_rng(11).uniform(-100, 900, (2000, 2))
+
+
+@pytest.fixture
+def index(points: np.ndarray) -> SpatialIndex:
+	return SpatialIndex(points[:, 0], points[:, 1], extent=(5, 3))
+
+
+def test_spatial_in_rect_matches_scan(points: np.ndarray, index: SpatialIndex) -> None:
+	for left, top, right, bottom in ((0, 0, 100, 100), (-500, -500, 2000, 2000), (300, 250, 301, 900), (5000, 0, 6000, 1)):
+		rect = Rectangle(Point(left, top), Point(right, bottom))
+		expected = np.flatnonzero(rect.contains_points(points[:, 0], points[:, 1]))
+		np.testing.assert_array_equal(index.in_rect(rect), expected)
+	return
+
+
+def test_spatial_overlapping_grows_by_extent(points: np.ndarray, index: SpatialIndex) -> None:
+	rect = Rectangle(Point(100, 200), Point(400, 300))
+	grown = Rectangle(Point(95, 197), Point(405, 303))
+	np.testing.assert_array_equal(index.overlapping(rect), index.in_rect(grown))
+	return
+
+
+def test_spatial_within_matches_scan(points: np.ndarray, index: SpatialIndex) -> None:
+	center = Point(410.5, 375.25)
+	distance = np.hypot(points[:, 0] - center.x, points[:, 1] - center.y)
+	for radius in (0, 10, 75.5, 3000):
+		np.testing.assert_array_equal(index.within(center, radius), np.flatnonzero(distance <= radius))
+	return
+
+
+def test_spatial_nearest_matches_scan(points: np.ndarray, index: SpatialIndex) -> None:
+	for x, y in ((0, 0), (450, 450), (-1000, 2000)):
+		distance = np.hypot(points[:, 0] - x, points[:, 1] - y)
+		expected = np.lexsort((np.arange(len(points)), distance))
+		np.testing.assert_array_equal(index.nearest(Point(x, y)), expected[:1])
+		np.testing.assert_array_equal(index.nearest(Point(x, y), k=7), expected[:7])
+	assert len(index.nearest(Point(0, 0), k=5000)) == 2000
+	return
+
+
+def test_spatial_empty() -> None:
+	index = SpatialIndex([], [])
+	assert len(index.nearest(Point(0, 0))) == 0
+	assert len(index.within(Point(0, 0), 10)) == 0
+	return
+
+
+def test_hex_grid_spatial_index() -> None:
+	hex_grid = get_hex_grid(20, 15)
+	rect = Rectangle(Point(100, 120), Point(420, 333))
+	np.testing.assert_array_equal(hex_grid.spatial_index.overlapping(rect), hex_grid.indices_in_rect(rect))
+
+	center = hex_grid.storage.center(47)
+	assert hex_grid.spatial_index.nearest(Point(center.x + 3, center.y - 2)).tolist() == [47]
+	return
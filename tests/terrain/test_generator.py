@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/terrain/test_generator.py."""
+# Third Party Library
+import numpy as np
+import pytest
+
+# App
+from hex_grid import get_hex_grid
+from storage import ChunkedGrid
+from terrain import (
+	BIOME_NAMES,
+	TerrainConfig,
+	classify_biomes,
+	generate_terrain,
+	terrain_region,
+)
+from terrain.generator import (
+	BEACH,
+	OCEAN,
+	SNOW,
+)
+
+
+CONFIG = TerrainConfig(seed=42, feature_size=300.0, octaves=3)
+
+
+def test_generate_terrain_columns() -> None:
+	storage = get_hex_grid(40, 30).storage
+	generate_terrain(storage, CONFIG)
+	assert storage.column('elevation').dtype == np.float32
+	assert storage.column('biome').dtype == np.uint8
+	elevation = storage.column('elevation')
+	assert elevation.min() >= 0 and elevation.max() <= 1
+	assert storage.column('biome').max() < len(BIOME_NAMES)
+	assert len(np.unique(storage.column('biome'))) > 3
+	return
+
+
+def test_generate_terrain_is_deterministic() -> None:
+	first, second, other = (get_hex_grid(20, 20).storage for _ in range(3))
+	generate_terrain(first, CONFIG)
+	generate_terrain(second, CONFIG)
+	generate_terrain(other, CONFIG._replace(seed=43))
+	np.testing.assert_array_equal(first.column('elevation'), second.column('elevation'))
+	assert not np.array_equal(first.column('elevation'), other.column('elevation'))
+	return
+
+
+def test_generate_terrain_parallel_matches_serial() -> None:
+	serial, parallel = get_hex_grid(30, 25).storage, get_hex_grid(30, 25).storage
+	generate_terrain(serial, CONFIG)
+	generate_terrain(parallel, CONFIG, workers=2)
+	for name in ('elevation', 'moisture', 'biome'):
+		np.testing.assert_array_equal(parallel.column(name), serial.column(name))
+	return
+
+
+def test_terrain_region_matches_whole_grid() -> None:
+	hex_grid = get_hex_grid(30, 25)
+	generate_terrain(hex_grid.storage, CONFIG)
+
+	chunked = ChunkedGrid(chunk_cols=8, chunk_rows=8)
+	chunked.add_column('biome', dtype=np.uint8)
+	for chunk_col in range(4):
+		for chunk_row in range(4):
+			col, row = chunk_col * 8, chunk_row * 8
+			region = terrain_region(col, row, col + 7, row + 7, hex_grid.storage.layout, CONFIG)
+			chunked.write_region(col, row, 'biome', region['biome'])
+
+	biomes = chunked.read_region(0, 0, 29, 24, 'biome')
+	np.testing.assert_array_equal(biomes.ravel(), hex_grid.storage.column('biome'))
+	chunked.close()
+	return
+
+
+@pytest.mark.parametrize('elevation, moisture, biome', [(0.2, 0.9, OCEAN), (0.505, 0.5, BEACH), (1.0, 0.9, SNOW)])
+def test_classify_biomes(elevation: float, moisture: float, biome: int) -> None:
+	assert classify_biomes(np.array([elevation]), np.array([moisture]), 0.5)[0] == biome
+	return
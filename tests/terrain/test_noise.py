@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/terrain/test_noise.py."""
+# Third Party Library
+import numpy as np
+import pytest
+
+# App
+from terrain import (
+	fractal_noise,
+	simplex_noise,
+	value_noise,
+)
+
+
+@pytest.fixture
+def plane():
+	return np.meshgrid(np.linspace(-40.3, 40.7, 300), np.linspace(-20.1, 60.9, 300))
+
+
+@pytest.mark.parametrize('noise', [value_noise, simplex_noise])
+def test_noise_is_seeded_and_deterministic(noise, plane) -> None:
+	x, y = plane
+	np.testing.assert_array_equal(noise(x, y, 5), noise(x, y, 5))
+	assert not np.allclose(noise(x, y, 5), noise(x, y, 6))
+	return
+
+
+@pytest.mark.parametrize('noise', [value_noise, simplex_noise])
+def test_noise_range(noise, plane) -> None:
+	values = noise(*plane, 1)
+	assert values.min() >= -1.0 and values.max() <= 1.0
+	assert values.std() > 0.2
+	return
+
+
+@pytest.mark.parametrize('noise', [value_noise, simplex_noise])
+def test_noise_is_a_function_of_position(noise, plane) -> None:
+	x, y = plane
+	whole = noise(x, y, 9)
+	# Sampling a part on its own gives the same values.
+	np.testing.assert_array_equal(noise(x[100:150, 30:90], y[100:150, 30:90], 9), whole[100:150, 30:90])
+	np.testing.assert_array_equal(noise(x[7, 8], y[7, 8], 9), whole[7, 8])
+	return
+
+
+def test_noise_is_continuous() -> None:
+	x = np.linspace(0, 10, 100001)
+	for noise in (value_noise, simplex_noise):
+		assert np.abs(np.diff(noise(x, x * 0.3, 2))).max() < 0.01
+	return
+
+
+def test_fractal_noise_range(plane) -> None:
+	values = fractal_noise(simplex_noise, *plane, seed=3, octaves=4)
+	assert values.min() >= -1.0 and values.max() <= 1.0
+	return
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/test_imports.py."""
+# Standard Library
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Third Party Library
+import pytest
+
+
+HEX_SYSTEM_DIR: Path = Path(__file__).parent.parent / 'hex_system'
+
+# Modules whose import must stay free of filesystem side effects.
+MODULES = ('config', 'loggers', 'geometry', 'grid')
+
+# Budget for the import of the modules above, first party code only: NumPy and the standard
+# library are excluded, so the budget holds on any machine the suite runs on.
+IMPORT_BUDGET_US: int = 100_000
+
+IMPORT_SCRIPT = '''
+import json, sys
+before = set(sys.modules)
+import hex_system
+{imports}
+print(json.dumps(sorted(set(sys.modules) - before)))
+'''
+
+
+def _import(tmp_path, *arguments):
+	env = dict(os.environ, HEX_SYSTEM_LOG_DIR=str(tmp_path / 'logs'))
+	env['PYTHONPATH'] = os.pathsep.join([str(HEX_SYSTEM_DIR.parent), str(HEX_SYSTEM_DIR)])
+	script = IMPORT_SCRIPT.format(imports='\n'.join(f'import {module}' for module in MODULES))
+	return subprocess.run(
+		[sys.executable, *arguments, '-c', script], cwd=tmp_path, env=env, capture_output=True, text=True, check=True
+	)
+
+
+def test_import_has_no_side_effects(tmp_path) -> None:
+	result = _import(tmp_path)
+	imported = json.loads(result.stdout)
+	assert not (tmp_path / 'logs').exists()
+	assert list(tmp_path.iterdir()) == []
+	assert 'zoneinfo' not in imported
+	return
+
+
+def test_first_record_creates_log_dir(tmp_path) -> None:
+	env = dict(os.environ, HEX_SYSTEM_LOG_DIR=str(tmp_path / 'logs'), PYTHONPATH=str(HEX_SYSTEM_DIR))
+	script = 'from loggers import get_logger; get_logger("first").warning("created")'
+	subprocess.run([sys.executable, '-c', script], cwd=tmp_path, env=env, capture_output=True, check=True)
+	assert 'created' in (tmp_path / 'logs' / 'first.log').read_text()
+	return
+
+
+@pytest.mark.skipif(sys.flags.optimize > 0, reason='Timing is only checked in the default mode.')
+def test_import_time_budget(tmp_path) -> None:
+	result = _import(tmp_path, '-X', 'importtime')
+	first_party = {'hex_system', *MODULES}
+	total = 0
+	for line in result.stderr.splitlines():
+		if not line.startswith('import time:') or 'self [us]' in line:
+			continue
+		self_us, _, name = line[len('import time:'):].split('|')
+		if name.strip().split('.')[0] in first_party:
+			total += int(self_us)
+	assert 0 < total < IMPORT_BUDGET_US
+	return
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# vim: ft=python
+"""tests/test_loggers.py."""
+# Standard Library
+import io
+import logging
+import platform
+import queue
+
+# Third Party Library
+import pytest
+
+# App
+from benchmarks.micro import count_allocations
+from loggers import (
+	HOT_PATH_LOG_LEVEL,
+	BatchQueueListener,
+	BinaryFileHandler,
+	BoundedQueueHandler,
+	DeferredHandler,
+	ExtraTypeAdapter,
+	LogEntry,
+	NSLogRecord,
+	StructuredFormatter,
+	disable_async_logging,
+	enable_async_logging,
+	get_logger,
+	read_binary_log,
+	read_jsonl_log,
+	set_log_level,
+)
+
+
+class ListHandler(logging.Handler):
+
+	def __init__(self) -> None:
+		super().__init__()
+		self.records = []
+		self.messages = []
+		return
+
+	def emit(self, record: logging.LogRecord) -> None:
+		self.records.append(record)
+		self.messages.append(record.getMessage())
+		return
+
+
+def _record(message: str, *args) -> logging.LogRecord:
+	return logging.LogRecord('tests', logging.INFO, __file__, 1, message, args, None)
+
+
+def test_get_logger_is_cached() -> None:
+	first = get_logger('tests.cached')
+	handlers = list(first.logger.handlers)
+	assert get_logger('tests.cached') is first
+	assert first.logger.handlers == handlers
+	assert len(handlers) == 1
+	return
+
+
+def test_handlers_are_created_on_first_record() -> None:
+	log = get_logger('tests.deferred')
+	assert [type(handler) for handler in log.logger.handlers] == [DeferredHandler]
+
+	log.info('first')
+	handlers = list(log.logger.handlers)
+	assert len(handlers) == 2 and not any(isinstance(handler, DeferredHandler) for handler in handlers)
+	log.info('second')
+	assert log.logger.handlers == handlers
+	return
+
+
+def test_disabled_level_skips_process(monkeypatch) -> None:
+	log = get_logger('tests.disabled')
+	calls = []
+	monkeypatch.setattr(ExtraTypeAdapter, 'process', lambda self, msg, kwargs: calls.append(msg) or (msg, kwargs))
+	set_log_level('tests.disabled', logging.INFO)
+
+	assert not log.debug_enabled
+	log.debug('skipped')
+	assert calls == []
+	return
+
+
+@pytest.mark.skipif(platform.python_implementation() != 'CPython', reason='counts CPython allocator blocks')
+def test_hot_path_debug_guard() -> None:
+	log = get_logger('tests.hot_path', level=HOT_PATH_LOG_LEVEL)
+	ratio = 0.5
+
+	def guarded() -> None:
+		if log.debug_enabled:
+			log.debug(f'<ratio: {ratio}>.')
+		return
+
+	assert not log.debug_enabled
+	# Neither the message nor a record is built.
+	assert count_allocations(guarded) == 0
+
+	set_log_level('tests.hot_path', logging.DEBUG)
+	assert log.debug_enabled
+	set_log_level('tests.hot_path', HOT_PATH_LOG_LEVEL)
+	assert not log.debug_enabled
+	return
+
+
+def test_process_keeps_default_extra() -> None:
+	log = get_logger('tests.process')
+	_, kwargs = log.process('message', {})
+	assert kwargs['extra'] == {'type': 'REPORT'}
+
+	_, kwargs = log.process('message', {'type': 'BEGIN', 'exc_info': True})
+	assert kwargs == {'extra': {'type': 'BEGIN'}, 'exc_info': True}
+	assert log.extra == {'type': 'REPORT'}
+	return
+
+
+@pytest.mark.parametrize('policy, timeout', [('drop', None), ('block', 0.01)])
+def test_full_queue_drops(policy, timeout) -> None:
+	handler = BoundedQueueHandler(queue.Queue(maxsize=2), policy, timeout)
+	for position in range(3):
+		handler.handle(_record('message %d', position))
+	assert handler.dropped == 1
+	assert handler.queue.get_nowait().getMessage() == 'message 0'
+	with pytest.raises(ValueError):
+		BoundedQueueHandler(queue.Queue(), 'wait')
+	return
+
+
+def test_listener_writes_every_record() -> None:
+	log_queue = queue.Queue(maxsize=100)
+	handler, writer = BoundedQueueHandler(log_queue, 'block'), ListHandler()
+	listener = BatchQueueListener(log_queue, writer, batch_size=8)
+	listener.start()
+	for position in range(100):
+		handler.handle(_record('message %d', position))
+	listener.stop()
+	assert writer.messages == [f'message {position}' for position in range(100)]
+	assert handler.dropped == 0
+	return
+
+
+def test_enable_async_logging() -> None:
+	log = get_logger('tests.async')
+	handler = enable_async_logging(policy='block')
+	try:
+		assert log.logger.handlers == [handler]
+		assert get_logger('tests.async_later').logger.handlers == [handler]
+		log.info('queued')
+	finally:
+		disable_async_logging()
+	assert [type(handler) for handler in log.logger.handlers] == [DeferredHandler]
+	assert handler.queue.empty()
+	return
+
+
+def _structured_records():
+	log = get_logger('tests.structured')
+	collect = ListHandler()
+	log.logger.addHandler(collect)
+	try:
+		log.info('plain')
+		log.warning('typed ünïcode', type='BEGIN')
+		try:
+			raise ValueError('broken')
+		except ValueError:
+			log.error('failed', exc_info=True)
+	finally:
+		log.logger.removeHandler(collect)
+	return collect.records
+
+
+def test_ns_log_record_keeps_nanoseconds() -> None:
+	record = NSLogRecord('tests', logging.INFO, __file__, 1, 'message', None, None)
+	assert isinstance(record.created_ns, int)
+	assert record.created == record.created_ns / 1_000_000_000
+	assert record.created_ns > 1_600_000_000 * 1_000_000_000
+	# Milliseconds since the module loaded, whatever the type of the private `logging._startTime`.
+	assert 0 <= record.relativeCreated < 24 * 60 * 60 * 1000
+	return
+
+
+def test_jsonl_round_trip() -> None:
+	records = _structured_records()
+	formatter = StructuredFormatter()
+	file = io.StringIO(''.join(formatter.format(record) + '\n' for record in records))
+	entries = list(read_jsonl_log(file))
+
+	assert [entry.message for entry in entries] == ['plain', 'typed ünïcode', 'failed']
+	assert [entry.type for entry in entries] == ['REPORT', 'BEGIN', 'REPORT']
+	assert [entry.ts for entry in entries] == [record.created_ns for record in records]
+	assert entries[2].level == logging.ERROR and 'ValueError: broken' in entries[2].exc
+	assert entries[0].name == 'tests.structured' and entries[0].func == '_structured_records'
+	return
+
+
+def test_binary_round_trip(tmp_path) -> None:
+	records = _structured_records()
+	path = tmp_path / 'log.bin'
+	# Two sessions appending to the same file.
+	for part in (records[:1], records[1:]):
+		handler = BinaryFileHandler(path)
+		for record in part:
+			handler.handle(record)
+		handler.close()
+
+	with open(path, 'rb') as file:
+		entries = list(read_binary_log(file))
+	formatter = StructuredFormatter()
+	assert entries == [formatter.entry(record) for record in records]
+	assert all(isinstance(entry, LogEntry) for entry in entries)
+
+	with pytest.raises(ValueError):
+		list(read_binary_log(io.BytesIO(path.read_bytes()[:-3])))
+	with pytest.raises(ValueError):
+		list(read_binary_log(io.BytesIO(b'NOTALOG\x00\x01\x00')))
+	return